@@ -3,6 +3,7 @@
 import copy
 import logging
 import uuid
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Literal
 
@@ -36,14 +37,33 @@ class ProviderSettings(BaseModel):
 PROVIDER_SETTINGS_MAP: dict[str, type[ProviderSettings]] = {}
 
 
+@lru_cache(maxsize=1024)
+def compile_rule_pattern(pattern: str) -> regex.Pattern[str]:
+    """
+    Compile a rule pattern with DOTALL, once per pattern for the whole run.
+
+    Config validation compiles every rule pattern up front, and the translation
+    phase applies the same patterns to every match of a task; sharing this cache
+    means each pattern is compiled exactly once and every later use is a
+    dictionary hit. Invalid patterns raise regex.error on every call, as
+    regex.compile() does.
+    """
+    return regex.compile(pattern, regex.DOTALL)
+
+
 def _deep_merge(source: dict[str, Any], destination: dict[str, Any]) -> dict[str, Any]:
     """
     Non-destructively merge two dictionaries.
 
     Source values overwrite destination values.
     Nested dictionaries (including 'rules') are merged recursively.
+
+    Only the dictionaries on the merge path are copied; destination values the
+    source does not touch are shared with the result, while source values are
+    always deep-copied so the result never aliases shortcut data. Callers pass
+    a destination they own (a fresh copy or a previous merge result).
     """
-    merged = copy.deepcopy(destination)
+    merged = dict(destination)
     for key, value in source.items():
         if isinstance(value, dict) and key in merged and isinstance(merged.get(key), dict):
             merged[key] = _deep_merge(value, merged[key])
@@ -90,17 +110,22 @@ def _deep_merge_with_list_append(source: dict[str, Any], destination: dict[str,
     Deeply merge two dictionaries.
 
     - Dictionaries are merged recursively.
-    - Lists are combined (source items are prepended).
+    - Lists are combined (deep copies of the source items are prepended).
     - Other types from source overwrite destination.
+
+    Like `_deep_merge`, only the path being merged is copied; untouched
+    destination values are shared with the result, while source values
+    (list items included) are deep-copied so the result never aliases
+    shortcut data.
     """
-    merged = copy.deepcopy(destination)
+    merged = dict(destination)
     for key, value in source.items():
         dest_value = merged.get(key)
         if isinstance(value, dict) and isinstance(dest_value, dict):
             merged[key] = _deep_merge_with_list_append(value, dest_value)
         elif isinstance(value, list) and isinstance(dest_value, list):
             # Prepend source list to destination to give it priority
-            merged[key] = value + dest_value
+            merged[key] = copy.deepcopy(value) + dest_value
         else:
             merged[key] = copy.deepcopy(value)
     return merged
@@ -111,8 +136,8 @@ def _resolve_rules_extends(rules_data: dict[str, Any], shortcuts: dict[str, Any]
     if not isinstance(rules_data, dict) or "extends" not in rules_data:
         return rules_data
 
-    # Make a copy to avoid modifying the original shortcut dicts
-    rules_data = copy.deepcopy(rules_data)
+    # Only the top-level "extends" key is popped; nested values are deep-copied by the merge below
+    rules_data = dict(rules_data)
 
     extended_aliases = rules_data.pop("extends", [])
     if isinstance(extended_aliases, str):
@@ -211,7 +236,7 @@ def _parse_rules(rules_data: dict[str, Any] | list) -> list[Rule]:
     for rule in expanded_rules:
         pattern = rule.match.regex
         try:
-            regex.compile(pattern, regex.DOTALL)
+            compile_rule_pattern(pattern)
         except regex.error as e:
             msg = f"Invalid regex pattern in {rule.action.action} rule: '{pattern}' - {e}"
             raise ValueError(msg) from e
@@ -233,7 +258,9 @@ def _generate_stable_task_id(config: dict[str, Any]) -> str:
         "extraction_rules": config.get("extraction_rules", []),
     }
 
-    # Convert to a stable string representation
+    # Convert to a stable string representation. This must stay on the default
+    # pure-Python Dumper: libyaml's CDumper wraps long non-ASCII scalars at
+    # different points, which would silently change IDs and orphan caches.
     stable_string = yaml.dump(key_properties, sort_keys=True, default_flow_style=False)
 
     # Generate UUID v5 using a namespace (DNS namespace is standard practice)
@@ -339,11 +366,23 @@ def _build_providers_from_dict(providers_data: dict[str, Any]) -> dict[str, Prov
     return providers
 
 
-class StrictSingleQuoteLoader(yaml.SafeLoader):
+# libyaml's C parser is several times faster than the pure-Python one; PyYAML
+# builds without libyaml fall back to SafeLoader with identical results.
+_BaseSafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+class StrictSingleQuoteLoader(_BaseSafeLoader):
     """
     A custom YAML loader that enforces the use of single quotes for all strings.
 
-    It raises an error if any double-quoted strings are found.
+    It raises an error if any double-quoted strings are found. Scalar styles and
+    marks are reported by both the C and the pure-Python parser, so the check
+    works the same on either base loader.
+
+    The check runs on the parsed node's style rather than on the raw text, so
+    the file is read once. It cannot live in the scanner: CSafeLoader tokenizes
+    in C and exposes no ``fetch_double`` hook, and overriding it would force the
+    pure-Python scanner, which costs far more than the style check saves.
     """
 
 
@@ -458,6 +497,8 @@ def load_config(config_path: str) -> GlocalConfig:
         raise TypeError(msg)
 
     try:
+        # The loader pulls the file in chunks; the document is built in full because
+        # tasks can extend shortcuts declared after them.
         with path.open(encoding="utf-8") as f:
             data = yaml.load(f, Loader=StrictSingleQuoteLoader)  # noqa: S506
 
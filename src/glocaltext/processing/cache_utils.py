@@ -108,28 +108,36 @@ def _update_cache(cache_path: Path, task_id: str, matches_to_cache: list[TextMat
 
 
 def _partition_matches_by_cache(matches: list[TextMatch], cache: dict[str, str]) -> tuple[list[TextMatch], list[TextMatch]]:
-    """Partitions matches into those found in the cache and those needing new translation."""
+    """
+    Partitions matches into those found in the cache and those needing new translation.
+
+    Matches are grouped by original text first, so each unique text is hashed and
+    looked up once no matter how many matches share it.
+    """
     logger.debug("Partitioning %d matches by cache.", len(matches))
-    uncached_matches_by_text: dict[str, list[TextMatch]] = {}
+    matches_by_text: dict[str, list[TextMatch]] = {}
     cached_matches: list[TextMatch] = []
 
     for match in matches:
         if match.translated_text:
             cached_matches.append(match)
             continue
+        matches_by_text.setdefault(match.original_text, []).append(match)
 
-        checksum = calculate_checksum(match.original_text)
+    matches_to_translate: list[TextMatch] = []
+    for original_text, text_matches in matches_by_text.items():
+        checksum = calculate_checksum(original_text)
         cached_translation = cache.get(checksum)
 
         if cached_translation:
-            match.translated_text = cached_translation
-            match.lifecycle = MatchLifecycle.CACHED
-            logger.debug("[CACHE HIT] Checksum=%s, Lifecycle set to 'CACHED'", checksum[:16])
-            cached_matches.append(match)
+            for match in text_matches:
+                match.translated_text = cached_translation
+                match.lifecycle = MatchLifecycle.CACHED
+            logger.debug("[CACHE HIT] Checksum=%s, Lifecycle set to 'CACHED' for %d matches", checksum[:16], len(text_matches))
+            cached_matches.extend(text_matches)
         else:
-            uncached_matches_by_text.setdefault(match.original_text, []).append(match)
+            matches_to_translate.extend(text_matches)
 
-    matches_to_translate = [match for matches_list in uncached_matches_by_text.values() for match in matches_list]
     logger.debug(
         "Partitioning complete: %d matches to translate, %d matches found in cache.",
         len(matches_to_translate),
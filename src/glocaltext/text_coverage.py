@@ -8,8 +8,9 @@ performance and accuracy.
 
 Main components:
 - TextCoverage: Core class for tracking coverage ranges
-- merge_ranges(): Helper function for merging overlapping ranges
+- merge_ranges(): Helper function for merging overlapping ranges in place
 - calculate_total_coverage(): Helper function for calculating total covered characters
+- CoverageBitmap: Byte-per-character fast path for hot loops that only need full-coverage checks
 
 Usage example:
     >>> coverage = TextCoverage("Hello World")
@@ -22,22 +23,34 @@ Usage example:
     True
 """
 
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable
 from dataclasses import dataclass, field
+from itertools import islice, starmap
+from operator import itemgetter
+
+# Bisect keys for sorted, non-overlapping range lists, where both starts and ends ascend
+_range_start = itemgetter(0)
+_range_end = itemgetter(1)
 
 
 def merge_ranges(ranges: list[tuple[int, int]]) -> list[tuple[int, int]]:
     """
-    Merge overlapping or adjacent ranges.
+    Merge overlapping or adjacent ranges in place.
 
-    Algorithm: Sort all ranges first, then linearly scan to merge adjacent or overlapping ranges.
+    Algorithm: Sort the list in place, then sweep it once while holding a single
+    "merge target" range. Each range either extends the target or flushes it to the
+    next write position, so merged ranges overwrite the front of the list and the
+    leftover tail is deleted at the end.
     Time complexity: O(n log n), where n is the number of ranges.
-    Space complexity: O(n).
+    Space complexity: O(1) beyond the sort; no result list is allocated.
 
     Args:
-        ranges: List of ranges, each range is a (start, end) tuple representing [start, end)
+        ranges: List of ranges, each range is a (start, end) tuple representing [start, end);
+            the list is modified in place (pass a copy to keep it intact)
 
     Returns:
-        Merged list of ranges, guaranteed non-overlapping and sorted
+        The same list, now holding merged ranges, guaranteed non-overlapping and sorted
 
     Examples:
         >>> merge_ranges([(0, 3), (2, 5), (7, 9)])
@@ -47,28 +60,30 @@ def merge_ranges(ranges: list[tuple[int, int]]) -> list[tuple[int, int]]:
 
     """
     if not ranges:
-        return []
-
-    # Sort by start position
-    sorted_ranges = sorted(ranges, key=lambda r: r[0])
-
-    merged: list[tuple[int, int]] = [sorted_ranges[0]]
-
-    for current_start, current_end in sorted_ranges[1:]:
-        last_start, last_end = merged[-1]
-
-        # If current range overlaps or is adjacent to the last range, merge them
-        if current_start <= last_end:
-            # Merge ranges, taking the maximum end position of both
-            merged[-1] = (last_start, max(last_end, current_end))
-        else:
-            # Otherwise add new range
-            merged.append((current_start, current_end))
-
-    return merged
-
-
-def calculate_total_coverage(ranges: list[tuple[int, int]]) -> int:
+        return ranges
+
+    ranges.sort()
+
+    write = 0
+    merged_start, merged_end = ranges[0]
+    # Writes only land at indices already visited (write < current), so iterating the
+    # list while overwriting its front is safe and avoids per-item indexing
+    for current_start, current_end in islice(ranges, 1, None):
+        if current_start > merged_end:
+            # A gap: flush the merge target and start a new one
+            ranges[write] = (merged_start, merged_end)
+            write += 1
+            merged_start, merged_end = current_start, current_end
+        elif current_end > merged_end:
+            # Overlapping or adjacent and reaching further: extend the target
+            merged_end = current_end
+
+    ranges[write] = (merged_start, merged_end)
+    del ranges[write + 1 :]
+    return ranges
+
+
+def calculate_total_coverage(ranges: Iterable[tuple[int, int]]) -> int:
     """
     Calculate the total number of characters covered by the range list.
 
@@ -88,7 +103,118 @@ def calculate_total_coverage(ranges: list[tuple[int, int]]) -> int:
         0
 
     """
-    return sum(end - start for start, end in ranges)
+    # starmap() calls int.__rsub__(start, end) == end - start from C, so no generator
+    # frame or tuple unpacking runs in bytecode for each range
+    return sum(starmap(int.__rsub__, ranges))
+
+
+class CoverageBitmap:
+    """
+    Byte-per-character coverage map for hot loops that only ask "is everything covered?".
+
+    Each position of the text owns one byte in a ``bytearray``. Marking a range is a
+    single slice assignment (a C-level memcpy) and the full-coverage check is a single
+    ``bytearray.find`` (a C-level memchr), so no interval bookkeeping happens at all.
+
+    Unlike TextCoverage, ranges are not validated: callers are expected to pass spans
+    produced by regex matches over the same text. The coverage percentage and the
+    uncovered ranges can still be read back, each with a handful of C-level scans.
+
+    Usage example:
+        >>> bitmap = TextCoverage.bitmap(len("Hello World"))
+        >>> bitmap.add_range(0, 5)
+        >>> bitmap.add_range(5, 11)
+        >>> bitmap.is_fully_covered()
+        True
+
+    """
+
+    __slots__ = ("_bits", "_ones")
+
+    def __init__(self, length: int) -> None:
+        """
+        Initialize an all-uncovered bitmap.
+
+        Args:
+            length: Length of the text being tracked
+
+        """
+        self._bits = bytearray(length)
+        self._ones = memoryview(b"\x01" * length)
+
+    def __len__(self) -> int:
+        """Return the length of the tracked text."""
+        return len(self._bits)
+
+    def add_range(self, start: int, end: int) -> None:
+        """
+        Mark the range [start, end) as covered.
+
+        Args:
+            start: Start position (inclusive)
+            end: End position (exclusive)
+
+        """
+        self._bits[start:end] = self._ones[start:end]
+
+    def add_ranges(self, ranges: Iterable[tuple[int, int]]) -> None:
+        """
+        Mark every range [start, end) of a batch as covered.
+
+        Args:
+            ranges: Ranges in any order, each range is a (start, end) tuple
+
+        """
+        bits, ones = self._bits, self._ones
+        for start, end in ranges:
+            bits[start:end] = ones[start:end]
+
+    def reset(self) -> None:
+        """Mark every position as uncovered again, reusing the existing buffer."""
+        self._bits[:] = bytes(len(self._bits))
+
+    def get_coverage_percentage(self) -> float:
+        """
+        Calculate coverage percentage (0.0 - 1.0) by counting covered bytes.
+
+        Returns:
+            Coverage percentage (empty text is always 1.0)
+
+        """
+        length = len(self._bits)
+        if length == 0:
+            return 1.0
+        return self._bits.count(1) / length
+
+    def get_uncovered_ranges(self) -> list[tuple[int, int]]:
+        """
+        Return list of uncovered ranges, found by alternately searching for 0 and 1 bytes.
+
+        Returns:
+            List of uncovered ranges, each range is a (start, end) tuple
+
+        """
+        bits = self._bits
+        length = len(bits)
+        uncovered: list[tuple[int, int]] = []
+        gap_start = bits.find(0)
+        while gap_start != -1:
+            gap_end = bits.find(1, gap_start)
+            if gap_end == -1:
+                gap_end = length
+            uncovered.append((gap_start, gap_end))
+            gap_start = bits.find(0, gap_end)
+        return uncovered
+
+    def is_fully_covered(self) -> bool:
+        """
+        Check if every position has been covered.
+
+        Returns:
+            True if no uncovered position remains (empty text is always covered)
+
+        """
+        return self._bits.find(0) == -1
 
 
 @dataclass
@@ -104,7 +230,12 @@ class TextCoverage:
 
     Attributes:
         original_text: Original text string
-        covered_ranges: List of covered ranges, each range is a (start, end) tuple
+        covered_ranges: List of covered ranges, each range is a (start, end) tuple;
+            always sorted and merged. Reads return the list itself rather than a
+            copy; update it through add_range()/add_ranges() or by assigning a new
+            list, which is validated and merged into a fresh list on assignment (the
+            assigned list is left untouched). Mutating the returned list directly is
+            not supported
 
     Usage example:
         >>> coverage = TextCoverage("Hello World")
@@ -119,6 +250,36 @@ class TextCoverage:
 
     original_text: str
     covered_ranges: list[tuple[int, int]] = field(default_factory=list)
+    # (ranges list, covered character count) of the last count; reset whenever ranges change
+    _covered_chars_cache: tuple[list[tuple[int, int]], int] | None = field(default=None, init=False, repr=False, compare=False)
+
+    def __setattr__(self, name: str, value: object) -> None:
+        """Validate and merge every list assigned to covered_ranges, including the one passed to __init__."""
+        if name == "covered_ranges" and isinstance(value, Iterable):
+            ranges: list[tuple[int, int]] = []
+            for start, end in value:
+                # Ranges are checked like add_range() does, so coverage never leaves the text
+                self._validate_range(start, end)
+                # Empty ranges cover nothing
+                if start < end:
+                    ranges.append((start, end))
+            # add_range(), add_ranges() and get_uncovered_ranges() rely on sorted, merged ranges
+            value = merge_ranges(ranges)
+        super().__setattr__(name, value)
+
+    @classmethod
+    def bitmap(cls, length: int) -> CoverageBitmap:
+        """
+        Create a CoverageBitmap fast path for a text of the given length.
+
+        Args:
+            length: Length of the text being tracked
+
+        Returns:
+            A new, all-uncovered CoverageBitmap
+
+        """
+        return CoverageBitmap(length)
 
     def add_range(self, start: int, end: int) -> None:
         """
@@ -141,7 +302,83 @@ class TextCoverage:
             1
 
         """
-        # Validate range validity
+        self._validate_range(start, end)
+
+        # If empty range, don't add
+        if start == end:
+            return
+
+        ranges = self.covered_ranges
+        self._covered_chars_cache = None
+
+        # Fast path: matches usually arrive left to right, so the new range tends to
+        # start at or after the last one and can be appended (or joined) directly
+        if not ranges or start > ranges[-1][1]:
+            ranges.append((start, end))
+            return
+        if start == ranges[-1][1]:
+            ranges[-1] = (ranges[-1][0], end)
+            return
+
+        # covered_ranges is sorted and merged, so only the ranges touching [start, end)
+        # are merged: the first one ending at or after start through the last one
+        # starting at or before end. Bisecting finds both without a full re-merge.
+        lo = bisect_left(ranges, start, key=_range_end)
+        hi = bisect_right(ranges, end, lo=lo, key=_range_start)
+        if lo < hi:
+            start = min(start, ranges[lo][0])
+            end = max(end, ranges[hi - 1][1])
+        ranges[lo:hi] = [(start, end)]
+
+    def add_ranges(self, ranges: Iterable[tuple[int, int]]) -> None:
+        """
+        Add a batch of coverage ranges, merging them into the existing ranges once.
+
+        Every range is validated before any is added, so an invalid range leaves the
+        coverage unchanged. The new ranges are appended and the whole list is merged
+        in one pass; Timsort recognizes the existing ranges and an already sorted batch
+        (such as the spans of one finditer() call) as two runs and merges them in
+        linear time, instead of one bisect-and-splice per range.
+
+        Args:
+            ranges: Ranges in any order, each range is a (start, end) tuple representing [start, end)
+
+        Raises:
+            ValueError: If any range is invalid (start > end or exceeds text bounds)
+
+        Examples:
+            >>> coverage = TextCoverage("Hello World")
+            >>> coverage.add_ranges([(6, 11), (0, 5), (5, 6)])
+            >>> coverage.covered_ranges
+            [(0, 11)]
+
+        """
+        new_ranges: list[tuple[int, int]] = []
+        for start, end in ranges:
+            self._validate_range(start, end)
+            # Empty ranges cover nothing
+            if start < end:
+                new_ranges.append((start, end))
+
+        if not new_ranges:
+            return
+
+        self.covered_ranges.extend(new_ranges)
+        merge_ranges(self.covered_ranges)
+        self._covered_chars_cache = None
+
+    def _validate_range(self, start: int, end: int) -> None:
+        """
+        Check that [start, end) is a valid range within the text.
+
+        Args:
+            start: Start position (inclusive)
+            end: End position (exclusive)
+
+        Raises:
+            ValueError: If range is invalid (start > end or exceeds text bounds)
+
+        """
         if start > end:
             msg = f"Invalid range: start ({start}) cannot be greater than end ({end})"
             raise ValueError(msg)
@@ -154,19 +391,48 @@ class TextCoverage:
             msg = f"Invalid range: end ({end}) exceeds text length ({len(self.original_text)})"
             raise ValueError(msg)
 
-        # If empty range, don't add
-        if start == end:
-            return
+    def reset(self) -> None:
+        """
+        Remove all coverage ranges so the instance can track the same text again.
+
+        Examples:
+            >>> coverage = TextCoverage("Hello")
+            >>> coverage.add_range(0, 5)
+            >>> coverage.reset()
+            >>> coverage.covered_ranges
+            []
 
-        # Add range and re-merge
-        self.covered_ranges.append((start, end))
-        self.covered_ranges = merge_ranges(self.covered_ranges)
+        """
+        self.covered_ranges.clear()
+        self._covered_chars_cache = None
+
+    def _covered_chars(self) -> int:
+        """
+        Return the number of covered characters, recounting only after the ranges changed.
+
+        Rule engines poll coverage after every rule, so repeated reads between two
+        add_range() calls return the cached count. The cache is tied to the
+        covered_ranges list object, so assigning a new list also invalidates it.
+
+        Returns:
+            Number of characters covered by at least one range
+
+        """
+        cache = self._covered_chars_cache
+        if cache is not None and cache[0] is self.covered_ranges:
+            return cache[1]
+
+        covered_chars = calculate_total_coverage(self.covered_ranges)
+        self._covered_chars_cache = (self.covered_ranges, covered_chars)
+        return covered_chars
 
     def is_fully_covered(self) -> bool:
         """
         Check if text is fully covered.
 
         Full coverage definition: Merged ranges form a continuous interval [0, len(text)).
+        The merged ranges are compared with that interval directly rather than counting
+        covered characters, which would also match ranges with a gap that run past the end.
 
         Returns:
             True if text is fully covered, False otherwise
@@ -182,17 +448,13 @@ class TextCoverage:
             False
 
         """
+        text_length = len(self.original_text)
+
         # Empty text is considered fully covered
-        if len(self.original_text) == 0:
+        if text_length == 0:
             return True
 
-        # No coverage ranges
-        if not self.covered_ranges:
-            return False
-
-        # Check if there is only one range that covers the entire text
-        merged = merge_ranges(self.covered_ranges)
-        return len(merged) == 1 and merged[0] == (0, len(self.original_text))
+        return self.covered_ranges == [(0, text_length)]
 
     def get_coverage_percentage(self) -> float:
         """
@@ -214,16 +476,14 @@ class TextCoverage:
         if text_length == 0:
             return 1.0
 
-        merged = merge_ranges(self.covered_ranges)
-        covered_chars = calculate_total_coverage(merged)
-
-        return covered_chars / text_length
+        return self._covered_chars() / text_length
 
     def get_uncovered_ranges(self) -> list[tuple[int, int]]:
         """
         Return list of uncovered ranges.
 
-        This method calculates which parts of the original text are not yet covered by any rule.
+        This method calculates which parts of the original text are not yet covered by any rule,
+        as the complement of covered_ranges in a single pass.
 
         Returns:
             List of uncovered ranges, each range is a (start, end) tuple
@@ -237,28 +497,19 @@ class TextCoverage:
 
         """
         text_length = len(self.original_text)
-
-        # If no coverage ranges, entire text is uncovered
-        if not self.covered_ranges:
-            return [(0, text_length)] if text_length > 0 else []
-
-        merged = merge_ranges(self.covered_ranges)
         uncovered: list[tuple[int, int]] = []
 
-        # Check before the first range
-        if merged[0][0] > 0:
-            uncovered.append((0, merged[0][0]))
-
-        # Check gaps between adjacent ranges
-        for i in range(len(merged) - 1):
-            gap_start = merged[i][1]
-            gap_end = merged[i + 1][0]
-            if gap_start < gap_end:
-                uncovered.append((gap_start, gap_end))
+        # covered_ranges is kept sorted and merged (assignments are merged by __setattr__),
+        # so one sweep emits the gap before each range
+        covered_end = 0
+        for start, end in self.covered_ranges:
+            if start > covered_end:
+                uncovered.append((covered_end, start))
+            covered_end = end
 
-        # Check after the last range
-        if merged[-1][1] < text_length:
-            uncovered.append((merged[-1][1], text_length))
+        # Check after the last range (the whole text when nothing is covered)
+        if covered_end < text_length:
+            uncovered.append((covered_end, text_length))
 
         return uncovered
 
@@ -266,7 +517,7 @@ class TextCoverage:
         """
         Extract uncovered text content.
 
-        This method concatenates text from all uncovered ranges.
+        This method concatenates text from all uncovered ranges with a single join.
 
         Returns:
             Uncovered text content (may contain multiple non-contiguous fragments)
@@ -279,5 +530,8 @@ class TextCoverage:
             ' '  # Only the space in the middle is uncovered
 
         """
-        uncovered_ranges = self.get_uncovered_ranges()
-        return "".join(self.original_text[start:end] for start, end in uncovered_ranges)
+        text = self.original_text
+        # join() materializes its argument anyway, so a list skips the generator overhead.
+        # Slicing str directly is deliberate: ASCII/Latin-1 strings already store one byte
+        # per character (PEP 393), and a bytes mirror measured slower once decoded.
+        return "".join([text[start:end] for start, end in self.get_uncovered_ranges()])
@@ -8,10 +8,10 @@ from typing import Any
 
 import regex
 
-from .config import GlocalConfig, ProviderSettings
+from .config import GlocalConfig, ProviderSettings, compile_rule_pattern
 from .match_state import SKIP_USER_RULE, MatchLifecycle, SkipReason
 from .models import TextMatch
-from .text_coverage import TextCoverage
+from .text_coverage import CoverageBitmap, TextCoverage
 from .translators import TRANSLATOR_MAPPING
 from .translators.base import BaseTranslator, TranslationResult
 from .types import PreProcessedText, Rule, TranslationTask
@@ -22,6 +22,9 @@ logger = logging.getLogger(__name__)
 _PATTERN_LOG_MAX_LENGTH = 50
 # Text snippet length for debug logging
 _TEXT_SNIPPET_MAX_LENGTH = 50
+# Longest text whose coverage is tracked with a byte-per-character CoverageBitmap;
+# longer texts use the interval list of TextCoverage to bound memory
+_COVERAGE_BITMAP_MAX_LENGTH = 1 << 20
 
 # A cache to store initialized translator instances to avoid re-creating them.
 _translator_cache: dict[str, BaseTranslator] = {}
@@ -131,7 +134,7 @@ def _check_rule_match(text: str, rule: Rule) -> tuple[bool, str | None]:
     # Validate patterns before loop
     def is_valid_pattern(pattern: str) -> bool:
         try:
-            regex.compile(pattern, regex.DOTALL)
+            compile_rule_pattern(pattern)
         except regex.error as e:
             logger.debug("[Rule Match] Skipping pattern with regex error: '%s...' - %s", pattern[:_PATTERN_LOG_MAX_LENGTH] if len(pattern) > _PATTERN_LOG_MAX_LENGTH else pattern, e)
             return False
@@ -142,7 +145,7 @@ def _check_rule_match(text: str, rule: Rule) -> tuple[bool, str | None]:
 
     # Search with validated patterns
     for r in valid_patterns:
-        if regex.search(r, text, regex.DOTALL):
+        if compile_rule_pattern(r).search(text):
             return True, r
     return False, None
 
@@ -175,7 +178,7 @@ def _handle_replace_action(text: str, matched_value: str, rule: Rule) -> str:
 
     try:
         # regex.sub correctly handles backreferences like \1, \g<name>, etc.
-        modified_text = regex.sub(matched_value, rule.action.value, text, regex.DOTALL)
+        modified_text = compile_rule_pattern(matched_value).sub(rule.action.value, text)
         logger.debug("[REPLACE ACTION] Output text: '%s'", modified_text[:200])
         logger.debug("[REPLACE ACTION] Text changed: %s", text != modified_text)
     except regex.error as e:
@@ -191,7 +194,7 @@ def _apply_regex_protection(text: str, matched_value: str, protected_map: dict[s
     try:
         new_text = ""
         last_end = 0
-        for m in regex.finditer(matched_value, text, regex.DOTALL):
+        for m in compile_rule_pattern(matched_value).finditer(text):
             original_substring = m.group(0)
 
             placeholder = next((k for k, v in protected_map.items() if v == original_substring), None)
@@ -303,7 +306,7 @@ def _try_terminate_with_replace(match: TextMatch, text: str, rule: Rule, matched
     A 'replace' rule is terminating if it matches the ENTIRE string or replaces with an empty value.
     Returns True if the match was successfully terminated.
     """
-    is_full_match = regex.fullmatch(matched_pattern, text, regex.DOTALL) is not None
+    is_full_match = compile_rule_pattern(matched_pattern).fullmatch(text) is not None
     is_replace_to_empty = rule.action.value == ""
 
     if not (is_full_match or is_replace_to_empty):
@@ -341,7 +344,7 @@ def _get_terminating_rule_patterns(rules: list[Rule]) -> list[str]:
     return patterns
 
 
-def _track_pattern_coverage(pattern: str, text: str, coverage: TextCoverage) -> None:
+def _track_pattern_coverage(pattern: str, text: str, coverage: TextCoverage | CoverageBitmap) -> None:
     """
     Track coverage of a single regex pattern in the text.
 
@@ -352,15 +355,15 @@ def _track_pattern_coverage(pattern: str, text: str, coverage: TextCoverage) ->
     Args:
         pattern: Regex pattern to search for
         text: Text to search in
-        coverage: TextCoverage instance to update with matched ranges
+        coverage: TextCoverage or CoverageBitmap to update with matched ranges
 
     """
+    spans: list[tuple[int, int]] = []
     try:
         # Find all matches of this pattern in the text
-        for regex_match in regex.finditer(pattern, text, regex.DOTALL):
-            start = regex_match.start()
-            end = regex_match.end()
-            coverage.add_range(start, end)
+        for regex_match in compile_rule_pattern(pattern).finditer(text):
+            start, end = regex_match.span()
+            spans.append((start, end))
             logger.debug(
                 "[Coverage Detection] Rule '%s' matched range [%d, %d) in text: '%s...'",
                 pattern[:50],
@@ -374,6 +377,9 @@ def _track_pattern_coverage(pattern: str, text: str, coverage: TextCoverage) ->
         logger.debug("[Coverage Detection] Skipping pattern with regex error: '%s...' - %s", pattern[:_PATTERN_LOG_MAX_LENGTH] if len(pattern) > _PATTERN_LOG_MAX_LENGTH else pattern, e)
         return
 
+    # Merge all of this pattern's matches into the coverage at once
+    coverage.add_ranges(spans)
+
 
 def _select_text_for_coverage_check(match: TextMatch, original_text_for_coverage: str | None) -> str:
     """
@@ -432,8 +438,9 @@ def _check_full_coverage(match: TextMatch, rules: list[Rule], original_text_for_
     if not text_to_check:
         return True
 
-    # Create coverage tracker for this match
-    coverage = TextCoverage(text_to_check)
+    # Create coverage tracker for this match: a bitmap makes every range a slice
+    # assignment and every full-coverage check a memchr, unless the text is huge
+    coverage = TextCoverage.bitmap(len(text_to_check)) if len(text_to_check) <= _COVERAGE_BITMAP_MAX_LENGTH else TextCoverage(text_to_check)
 
     # Track coverage for ALL terminating rules (replace/skip/protect)
     logger.debug(
@@ -447,18 +454,15 @@ def _check_full_coverage(match: TextMatch, rules: list[Rule], original_text_for_
             rule_patterns = [rule.match.regex] if isinstance(rule.match.regex, str) else rule.match.regex
             for pattern in rule_patterns:
                 _track_pattern_coverage(pattern, text_to_check, coverage)
-
-    # Check if text is fully covered
-    is_fully_covered = coverage.is_fully_covered()
-
-    if is_fully_covered:
-        logger.debug("[Full Coverage Detected] Text is 100%% covered by skip/protect rules: '%s...'", text_to_check[:50])
-    else:
-        coverage_pct = coverage.get_coverage_percentage()
-        uncovered_ranges = coverage.get_uncovered_ranges()
-        logger.debug("[Partial Coverage] Text is %.1f%% covered, uncovered ranges: %s", coverage_pct * 100, uncovered_ranges)
-
-    return is_fully_covered
+                # Once fully covered, the remaining patterns cannot change the outcome
+                if coverage.is_fully_covered():
+                    logger.debug("[Full Coverage Detected] Text is 100%% covered by skip/protect rules: '%s...'", text_to_check[:50])
+                    return True
+
+    coverage_pct = coverage.get_coverage_percentage()
+    uncovered_ranges = coverage.get_uncovered_ranges()
+    logger.debug("[Partial Coverage] Text is %.1f%% covered, uncovered ranges: %s", coverage_pct * 100, uncovered_ranges)
+    return False
 
 
 def _is_match_terminated(match: TextMatch, rules: list[Rule]) -> bool:
@@ -501,7 +505,7 @@ def _is_match_terminated(match: TextMatch, rules: list[Rule]) -> bool:
 
         # For skip rules, only terminate if the pattern fully matches the entire text
         # Check if this is a full match (covers entire text)
-        if regex.fullmatch(matched_pattern, text_to_process, regex.DOTALL):
+        if compile_rule_pattern(matched_pattern).fullmatch(text_to_process):
             _handle_skip_action([match])
             logger.debug("[Terminating Check] Skip rule fully matched entire text, terminating")
             return True
@@ -545,7 +549,7 @@ def _apply_single_pattern(pattern: str, replacement: str, text: str) -> tuple[st
 
     """
     try:
-        new_text = regex.sub(pattern, replacement, text, regex.DOTALL)
+        new_text = compile_rule_pattern(pattern).sub(replacement, text)
     except regex.error as e:
         logger.warning("[Replace Rule] Failed to apply pattern '%s...': %s", pattern[:30], e)
         return text, False
@@ -1052,6 +1056,20 @@ def _determine_batching_strategy(
     )
 
 
+def _group_matches_by_text(matches: list[TextMatch]) -> dict[str, list[TextMatch]]:
+    """
+    Group matches by the text that will be sent to the translator, in first-seen order.
+
+    Use processed_text as the deduplication key if replace rules modified the text.
+    This ensures matches with the same post-replace-rule text are translated together.
+    """
+    unique_texts: dict[str, list[TextMatch]] = defaultdict(list)
+    for match in matches:
+        text_key = match.processed_text if match.processed_text else match.original_text
+        unique_texts[text_key].append(match)
+    return unique_texts
+
+
 def _process_genai_matches(
     matches: list[TextMatch],
     context: ProcessingContext,
@@ -1060,12 +1078,7 @@ def _process_genai_matches(
     if not matches:
         return
 
-    unique_texts: dict[str, list[TextMatch]] = defaultdict(list)
-    for match in matches:
-        # Use processed_text as the deduplication key if replace rules modified the text.
-        # This ensures matches with the same post-replace-rule text are translated together.
-        text_key = match.processed_text if match.processed_text else match.original_text
-        unique_texts[text_key].append(match)
+    unique_texts = _group_matches_by_text(matches)
     logger.info("Found %d unique text strings to process for API translation.", len(unique_texts))
 
     # Always apply pre-processing rules (protect and replace), even in dry-run mode
@@ -1114,11 +1127,11 @@ def _process_simple_matches(
             match.translated_text = match.processed_text if match.processed_text else match.original_text
         return
 
-    # Simple providers handle one text at a time.
-    for match in matches:
-        # Use processed_text if available (after replace rules), otherwise use original_text.
-        # This ensures replace rules' modifications are sent to the translator.
-        text_to_translate = match.processed_text if match.processed_text else match.original_text
+    # Simple providers handle one text at a time, so each unique text is sent once
+    # and its translation is shared by every match with that text.
+    unique_texts = _group_matches_by_text(matches)
+    logger.debug("Translating %d unique texts for %d matches with %s.", len(unique_texts), len(matches), context.provider_name)
+    for text_to_translate, text_matches in unique_texts.items():
         try:
             results = context.translator.translate(
                 texts=[text_to_translate],
@@ -1128,15 +1141,17 @@ def _process_simple_matches(
                 prompts=None,  # Simple providers don't use prompts
             )
         except Exception:
-            logger.exception("Error translating text '%s' with %s", match.original_text, context.provider_name)
-            match.lifecycle = MatchLifecycle.SKIPPED
-            match.skip_reason = SkipReason(category="mode", code="translation_error", message=f"Translation error with {context.provider_name}")
+            logger.exception("Error translating text '%s' with %s", text_matches[0].original_text, context.provider_name)
+            for match in text_matches:
+                match.lifecycle = MatchLifecycle.SKIPPED
+                match.skip_reason = SkipReason(category="mode", code="translation_error", message=f"Translation error with {context.provider_name}")
             continue
 
         if results:
-            match.translated_text = results[0].translated_text
-            match.tokens_used = results[0].tokens_used
-            match.lifecycle = MatchLifecycle.TRANSLATED
+            for match in text_matches:
+                match.translated_text = results[0].translated_text
+                match.tokens_used = results[0].tokens_used
+                match.lifecycle = MatchLifecycle.TRANSLATED
 
 
 def process_matches(
@@ -9,6 +9,9 @@ from .base_genai import BaseGenAITranslator, TranslationList
 
 logger = logging.getLogger(__name__)
 
+# Markdown code fence some responses wrap the JSON payload in
+_JSON_FENCE = re.compile(r"```json\n(.*?)\n```", re.DOTALL)
+
 
 class GeminiTranslator(BaseGenAITranslator):
     """
@@ -46,10 +49,11 @@ class GeminiTranslator(BaseGenAITranslator):
 
         """
         # Clean the response text from markdown code blocks.
-        match = re.search(r"```json\n(.*?)\n```", response_text, re.DOTALL)
+        match = _JSON_FENCE.search(response_text)
         if match:
             response_text = match.group(1)
 
+        # pydantic-core parses and validates the JSON in one native pass
         data = TranslationList.model_validate_json(response_text)
         translated_texts = data.translations
         if len(translated_texts) != len(original_texts):
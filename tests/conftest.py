@@ -0,0 +1,34 @@
+"""Shared fixtures and GenAI response stand-ins for the test modules."""
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+
+import pytest
+
+
+@dataclass
+class FakeUsageMetadata:
+    """The subset of a GenAI usage metadata object the translators read."""
+
+    total_token_count: int | None = None
+
+
+@dataclass
+class FakeGenerateResponse:
+    """Plain stand-in for a generate_content response; only exposes what translate() reads."""
+
+    text: str
+    usage_metadata: FakeUsageMetadata | None = None
+
+
+@pytest.fixture
+def create_config_file(tmp_path: Path) -> Callable[[str], str]:
+    """Return a factory that writes YAML content to a real file under tmp_path and returns its path."""
+
+    def _create(content: str, name: str = "config.yaml") -> str:
+        path = tmp_path / name
+        path.write_text(content, encoding="utf-8")
+        return str(path)
+
+    return _create
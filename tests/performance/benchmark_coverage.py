@@ -10,13 +10,19 @@ Usage:
     python tests/performance/benchmark_coverage.py
     python tests/performance/benchmark_coverage.py --iterations 5000
     python tests/performance/benchmark_coverage.py --test small_text
+    python tests/performance/benchmark_coverage.py --backend bitmap
 """
 
 import argparse
+import functools
+import os
 import platform
 import statistics
 import sys
 import time
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
@@ -26,24 +32,490 @@ import regex
 # Add parent directory to path to import glocaltext modules
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-from glocaltext.text_coverage import TextCoverage
-from glocaltext.types import ActionRule, MatchRule, Rule, TextMatch
+from glocaltext.text_coverage import CoverageBitmap, TextCoverage
+from glocaltext.types import ActionRule, MatchRule, Rule
+
+# Minimum duration of one timing sample; faster scenarios are batched until they reach it
+_MIN_SAMPLE_NS = 1_000_000
+
+# Expected mean time per operation of each scenario, in run_all_benchmarks() order
+_SCENARIO_THRESHOLDS_MS = (0.1, 1.0, 10.0, 5.0, 2.0)
+
+# Number of leading scenarios (small, medium, large text) compared by the performance analysis
+_ANALYZED_SCENARIOS = 3
+
+# Bounds for the number of discarded warmup samples per scenario
+_MIN_WARMUP_SAMPLES = 10
+_MAX_WARMUP_SAMPLES = 100
+
+# Characters that give a pattern regex semantics; patterns without any of them match literally
+_REGEX_METACHARACTERS = frozenset(".^$*+?{}[]\\|()")
+
+
+def _is_literal(pattern: str) -> bool:
+    """
+    Check whether a pattern matches exactly its own text.
+
+    Args:
+        pattern: Regex pattern string
+
+    Returns:
+        True if the pattern is non-empty and contains no regex metacharacters
+
+    """
+    return bool(pattern) and _REGEX_METACHARACTERS.isdisjoint(pattern)
+
+
+@functools.lru_cache(maxsize=256)
+def _compiled(pattern: str, flags: int = 0) -> regex.Pattern[str] | None:
+    """
+    Compile a single rule pattern once per process.
+
+    Args:
+        pattern: Regex pattern string
+        flags: regex compile flags
+
+    Returns:
+        The compiled pattern, or None if the pattern is invalid
+
+    """
+    try:
+        return regex.compile(pattern, flags)
+    except regex.error:
+        # Skip invalid regex patterns in benchmark
+        # This is acceptable in a benchmark context
+        return None
+
+
+@functools.lru_cache(maxsize=128)
+def _compiled_fused(patterns: tuple[str, ...], flags: int = 0) -> regex.Pattern[str]:
+    """
+    Compile a set of rule patterns into one alternation, once per process.
+
+    Note: a fused alternation reports at most one match per position, so it can
+    under-report coverage when patterns overlap. It is only used with --fused.
+
+    Args:
+        patterns: Regex pattern strings, in rule order
+        flags: regex compile flags
+
+    Returns:
+        The compiled alternation of all patterns
+
+    """
+    return regex.compile("|".join(f"(?:{p})" for p in patterns), flags)
+
+
+class CoverageBitset:
+    """
+    Bit-per-character coverage map packed into a single Python integer.
+
+    Python integers are arrays of machine words, so OR-ing a shifted run of ones
+    marks a range one word at a time (SWAR), and the full-coverage check is a single
+    integer comparison. This needs an eighth of the memory of CoverageBitmap.
+
+    Like CoverageBitmap, ranges are not validated. Only the benchmark's "bitset"
+    backend uses it, to compare against the CoverageBitmap fast path.
+
+    Usage example:
+        >>> bitset = CoverageBitset(len("Hello World"))
+        >>> bitset.add_range(0, 6)
+        >>> bitset.add_range(6, 11)
+        >>> bitset.is_fully_covered()
+        True
+
+    """
+
+    __slots__ = ("_full", "_length", "_mask")
+
+    def __init__(self, length: int) -> None:
+        """
+        Initialize an all-uncovered bitset.
+
+        Args:
+            length: Length of the text being tracked
+
+        """
+        self._length = length
+        self._full = (1 << length) - 1
+        self._mask = 0
+
+    def __len__(self) -> int:
+        """Return the length of the tracked text."""
+        return self._length
+
+    def add_range(self, start: int, end: int) -> None:
+        """
+        Mark the range [start, end) as covered.
+
+        Args:
+            start: Start position (inclusive)
+            end: End position (exclusive)
+
+        """
+        self._mask |= ((1 << (end - start)) - 1) << start
+
+    def reset(self) -> None:
+        """Mark every position as uncovered again."""
+        self._mask = 0
+
+    def is_fully_covered(self) -> bool:
+        """
+        Check if every position has been covered.
+
+        Returns:
+            True if no uncovered position remains (empty text is always covered)
+
+        """
+        return self._mask == self._full
+
+
+def scan_and_cover(text: str, compiled_patterns: Iterable[regex.Pattern[str]]) -> bool:
+    """
+    Check whether the matches of the given patterns fully cover the text.
+
+    This is the loop-fused equivalent of creating a CoverageBitmap, calling
+    add_range() for every match and then is_fully_covered(): the bitmap lives in
+    local variables, so each match costs one slice assignment and no method call.
+    Only the benchmark's "scan" backend uses it.
+
+    Args:
+        text: Text to scan
+        compiled_patterns: Compiled regex patterns whose matches count as coverage
+
+    Returns:
+        True if every character of the text is covered by at least one match
+
+    Examples:
+        >>> scan_and_cover("ab12", [regex.compile(r"[a-z]+"), regex.compile(r"[0-9]+")])
+        True
+
+    """
+    length = len(text)
+    bits = bytearray(length)
+    ones = memoryview(b"\x01" * length)
+    for pattern in compiled_patterns:
+        # Drive the pattern's scanner directly: same matches as finditer(), less per-match overhead
+        for match in iter(pattern.scanner(text).search, None):
+            start, end = match.span()
+            bits[start:end] = ones[start:end]
+        # Stop scanning once nothing is left to cover
+        if bits.find(0) == -1:
+            return True
+    return bits.find(0) == -1
+
+
+def ranges_cover_length(ranges: Iterable[tuple[int, int]], length: int) -> bool:
+    """
+    Check whether the ranges jointly cover [0, length).
+
+    Algorithm: Sort ranges by start, then sweep while tracking the furthest covered
+    position. Any range starting beyond that position leaves a gap, so the sweep can
+    stop early. Unlike merge_ranges(), no list of merged ranges is built. Only the
+    benchmark's "batch" backend uses it.
+    Time complexity: O(n log n) worst case, O(n) when ranges are already sorted.
+
+    Args:
+        ranges: Ranges in any order, each range is a (start, end) tuple; may overlap
+        length: Length of the text
+
+    Returns:
+        True if every position in [0, length) is covered (always True for length 0)
+
+    Examples:
+        >>> ranges_cover_length([(3, 5), (0, 3)], 5)
+        True
+        >>> ranges_cover_length([(0, 2), (3, 5)], 5)
+        False
+
+    """
+    # Empty text is considered fully covered
+    if length == 0:
+        return True
+
+    covered_end = 0
+    for start, end in sorted(ranges):
+        # A range starting past the covered prefix leaves a gap
+        if start > covered_end:
+            return False
+        covered_end = max(covered_end, end)
+
+    return covered_end >= length
+
+
+def _detect_coverage(text: str, literals: list[str], compiled_patterns: list[regex.Pattern[str]], coverage: TextCoverage | CoverageBitmap | CoverageBitset) -> bool:
+    """
+    Simulate coverage detection logic for one text.
+
+    Scanning stops between rules as soon as the text is fully covered, since
+    the remaining rules cannot change the outcome.
+
+    Args:
+        text: The text to scan
+        literals: Literal patterns to find with str.find()
+        compiled_patterns: Patterns to match against the text
+        coverage: Empty coverage tracker for the text
+
+    Returns:
+        True if the rules fully cover the text
+
+    """
+    for literal in literals:
+        width = len(literal)
+        index = text.find(literal)
+        while index != -1:
+            coverage.add_range(index, index + width)
+            index = text.find(literal, index + width)
+        if coverage.is_fully_covered():
+            return True
+
+    for pattern in compiled_patterns:
+        # A bare scanner skips finditer's iterator wrapper around the same search loop
+        for regex_match in iter(pattern.scanner(text).search, None):
+            start, end = regex_match.span()
+            coverage.add_range(start, end)
+        if coverage.is_fully_covered():
+            return True
+
+    return coverage.is_fully_covered()
+
+
+def _detect_coverage_batch(text: str, compiled_patterns: list[regex.Pattern[str]]) -> bool:
+    """
+    Collect every match span first, then check full coverage in one sorted sweep.
+
+    Args:
+        text: The text to scan
+        compiled_patterns: Patterns to match against the text
+
+    Returns:
+        True if the matches fully cover the text
+
+    """
+    starts: list[int] = []
+    ends: list[int] = []
+    for pattern in compiled_patterns:
+        for regex_match in iter(pattern.scanner(text).search, None):
+            start, end = regex_match.span()
+            starts.append(start)
+            ends.append(end)
+    return ranges_cover_length(zip(starts, ends, strict=True), len(text))
+
+
+# Backends that detect coverage in a single call instead of driving a coverage tracker
+_TRACKERLESS_DETECTORS = {
+    "batch": _detect_coverage_batch,
+    "scan": scan_and_cover,
+}
+
+
+@dataclass(frozen=True)
+class BenchmarkOptions:
+    """
+    Knobs that select which coverage detection variant is measured.
+
+    Attributes:
+        backend: Coverage tracker to measure ("intervals" for TextCoverage,
+                 "bitmap" for the CoverageBitmap fast path, "bitset" for the
+                 CoverageBitset fast path, "scan" for the loop-fused
+                 scan_and_cover() function, "batch" for collecting all spans
+                 and checking them with ranges_cover_length())
+        fused: Scan all rules with a single fused alternation instead of one
+               pattern per rule
+        literal_search: Find literal patterns with str.find() instead of the
+                        regex engine (ignored by the "scan" and "batch" backends)
+        regex_flags: regex compile flags for every rule pattern
+
+    """
+
+    backend: str = "intervals"
+    fused: bool = False
+    literal_search: bool = False
+    regex_flags: int = 0
+
+
+def _run_benchmark(iterations: int, options: BenchmarkOptions, name: str) -> dict[str, Any]:
+    """
+    Run one named benchmark in a fresh CoverageBenchmark.
+
+    Module-level so it can be pickled and submitted to a worker process.
+
+    Args:
+        iterations: Number of times to run the benchmark test
+        options: Coverage detection variant to measure
+        name: Benchmark name, e.g. "small_text"
+
+    Returns:
+        Result dictionary of the benchmark
+
+    """
+    benchmark = CoverageBenchmark(iterations, options)
+    return getattr(benchmark, f"benchmark_{name}")()
 
 
 class CoverageBenchmark:
     """Performance benchmark for coverage detection functionality."""
 
-    def __init__(self, iterations: int = 1000) -> None:
+    def __init__(self, iterations: int = 1000, options: BenchmarkOptions | None = None, jobs: int = 1) -> None:
         """
         Initialize the benchmark runner.
 
         Args:
             iterations: Number of times to run each benchmark test
+            options: Coverage detection variant to measure (defaults to
+                     per-rule regex scanning into TextCoverage)
+            jobs: Number of worker processes used by run_all_benchmarks()
 
         """
         self.iterations = iterations
+        self.options = options or BenchmarkOptions()
+        self.jobs = jobs
         self.results: list[dict[str, Any]] = []
 
+    @property
+    def warmup_samples(self) -> int:
+        """Number of untimed samples run before measuring: 5% of iterations, between 10 and 100."""
+        return max(_MIN_WARMUP_SAMPLES, min(_MAX_WARMUP_SAMPLES, self.iterations // 20))
+
+    def _new_coverage(self, text: str) -> TextCoverage | CoverageBitmap | CoverageBitset:
+        """
+        Create a fresh coverage tracker for the configured backend.
+
+        Args:
+            text: The text whose coverage is tracked
+
+        Returns:
+            A TextCoverage, CoverageBitmap or CoverageBitset sized to the text
+
+        """
+        if self.options.backend == "bitmap":
+            return TextCoverage.bitmap(len(text))
+        if self.options.backend == "bitset":
+            return CoverageBitset(len(text))
+        return TextCoverage(text)
+
+    def _compile_rules(self, rules: list[Rule]) -> tuple[list[str], list[regex.Pattern[str]]]:
+        """
+        Flatten a rule set into parallel arrays of literal strings and compiled patterns.
+
+        Rule objects are only touched here: the timed loop iterates plain lists,
+        one per matching strategy, and never dereferences Rule/MatchRule.
+        Compiled patterns come from the module-level caches. Literal patterns are
+        only split out when literal search is enabled.
+
+        Args:
+            rules: Rules whose patterns should be compiled
+
+        Returns:
+            Tuple of (literal patterns, compiled regex patterns), each in rule order
+
+        """
+        # Interned strings let the compile caches match keys by identity before comparing text
+        pattern_strs = [sys.intern(rule.match.regex) for rule in rules]
+        literals: list[str] = []
+        regex_strs = pattern_strs
+        if self.options.literal_search and self.options.backend not in _TRACKERLESS_DETECTORS:
+            regex_strs = []
+            for pattern in pattern_strs:
+                (literals if _is_literal(pattern) else regex_strs).append(pattern)
+        if not regex_strs:
+            return literals, []
+        if self.options.fused:
+            return literals, [_compiled_fused(tuple(regex_strs), self.options.regex_flags)]
+        compiled_patterns = (_compiled(pattern, self.options.regex_flags) for pattern in regex_strs)
+        return literals, [compiled for compiled in compiled_patterns if compiled is not None]
+
+    def _run_batch(self, text: str, literals: list[str], compiled_patterns: list[regex.Pattern[str]], coverages: list[TextCoverage | CoverageBitmap | CoverageBitset]) -> int:
+        """
+        Run coverage detection once per coverage tracker and time the whole batch.
+
+        The trackers are reset before the timer starts, so only matching and
+        coverage tracking are measured and no tracker is allocated per operation.
+
+        Args:
+            text: The text to scan
+            literals: Literal patterns to find with str.find()
+            compiled_patterns: Patterns to match against the text
+            coverages: Reusable coverage trackers, one per operation in the batch
+
+        Returns:
+            Elapsed time of the batch in nanoseconds
+
+        """
+        detector = _TRACKERLESS_DETECTORS.get(self.options.backend)
+        if detector is not None:
+            start = time.perf_counter_ns()
+            for _ in coverages:
+                _ = detector(text, compiled_patterns)
+            return time.perf_counter_ns() - start
+
+        for coverage in coverages:
+            coverage.reset()
+
+        start = time.perf_counter_ns()
+
+        for coverage in coverages:
+            _ = _detect_coverage(text, literals, compiled_patterns, coverage)
+
+        return time.perf_counter_ns() - start
+
+    def _calibrate_batch_size(self, text: str, literals: list[str], compiled_patterns: list[regex.Pattern[str]]) -> int:
+        """
+        Find the smallest power-of-two batch size whose run takes at least _MIN_SAMPLE_NS.
+
+        Batching keeps timer overhead and resolution negligible for scenarios
+        that only take a few microseconds per operation.
+
+        Args:
+            text: The text to scan
+            literals: Literal patterns to find with str.find()
+            compiled_patterns: Patterns to match against the text
+
+        Returns:
+            Number of operations to run per timing sample
+
+        """
+        batch_size = 1
+        while self._run_batch(text, literals, compiled_patterns, [self._new_coverage(text) for _ in range(batch_size)]) < _MIN_SAMPLE_NS:
+            batch_size *= 2
+        return batch_size
+
+    def _measure(self, text: str, rules: list[Rule], scenario_name: str) -> dict[str, Any]:
+        """
+        Time coverage detection of the given rules over the text.
+
+        Patterns are compiled outside the timed region. After discarding
+        self.warmup_samples warmup samples, each of the self.iterations samples
+        times a calibrated batch of operations and records the mean time per
+        operation.
+
+        Args:
+            text: The text to scan
+            rules: Rules whose patterns are matched against the text
+            scenario_name: Name of the benchmark scenario
+
+        Returns:
+            Dictionary containing statistical metrics
+
+        """
+        literals, compiled_patterns = self._compile_rules(rules)
+        batch_size = self._calibrate_batch_size(text, literals, compiled_patterns)
+
+        coverages = [self._new_coverage(text) for _ in range(batch_size)]
+
+        # Warm up caches and branch predictors; these samples are discarded
+        for _ in range(self.warmup_samples):
+            self._run_batch(text, literals, compiled_patterns, coverages)
+
+        times = [0.0] * self.iterations
+        for i in range(self.iterations):
+            elapsed_ns = self._run_batch(text, literals, compiled_patterns, coverages)
+            times[i] = elapsed_ns / batch_size / 1_000_000  # Convert to milliseconds per operation
+
+        result = self._calculate_statistics(times, scenario_name)
+        result["batch_size"] = batch_size
+        return result
+
     def _calculate_statistics(self, times: list[float], scenario_name: str) -> dict[str, Any]:
         """
         Calculate statistical metrics from timing measurements.
@@ -56,11 +528,16 @@ class CoverageBenchmark:
             Dictionary containing statistical metrics
 
         """
-        mean_time = statistics.mean(times)
-        median_time = statistics.median(times)
-        stdev_time = statistics.stdev(times) if len(times) > 1 else 0.0
-        min_time = min(times)
-        max_time = max(times)
+        # Sort once: min, max and median are then plain index lookups
+        ordered = sorted(times)
+        count = len(ordered)
+        middle = count // 2
+
+        mean_time = statistics.fmean(ordered)
+        median_time = ordered[middle] if count % 2 else (ordered[middle - 1] + ordered[middle]) / 2
+        stdev_time = statistics.stdev(ordered, mean_time) if count > 1 else 0.0
+        min_time = ordered[0]
+        max_time = ordered[-1]
         ops_per_sec = 1000.0 / mean_time if mean_time > 0 else 0.0
 
         return {
@@ -74,25 +551,6 @@ class CoverageBenchmark:
             "ops_per_sec": ops_per_sec,
         }
 
-    def _create_test_match(self, text: str) -> TextMatch:
-        """
-        Create a TextMatch instance for testing.
-
-        Args:
-            text: The text content for the match
-
-        Returns:
-            TextMatch instance configured for testing
-
-        """
-        return TextMatch(
-            original_text=text,
-            source_file=Path("test.txt"),
-            span=(0, len(text)),
-            task_name="test_task",
-            extraction_rule="test_rule",
-        )
-
     def benchmark_small_text(self) -> dict[str, Any]:
         """
         Benchmark with small text (~100 chars, 3 rules).
@@ -118,25 +576,7 @@ class CoverageBenchmark:
             ),
         ]
 
-        times = []
-        for _ in range(self.iterations):
-            self._create_test_match(text)
-            coverage = TextCoverage(text)
-
-            start = time.perf_counter()
-
-            # Simulate coverage detection logic
-            for rule in rules:
-                pattern = rule.match.regex
-                for regex_match in regex.finditer(pattern, text):
-                    coverage.add_range(regex_match.start(), regex_match.end())
-
-            _ = coverage.is_fully_covered()
-
-            end = time.perf_counter()
-            times.append((end - start) * 1000)  # Convert to milliseconds
-
-        return self._calculate_statistics(times, "Small Text (~100 chars, 3 rules)")
+        return self._measure(text, rules, "Small Text (~100 chars, 3 rules)")
 
     def benchmark_medium_text(self) -> dict[str, Any]:
         """
@@ -161,24 +601,7 @@ class CoverageBenchmark:
             Rule(match=MatchRule(regex=r"tempor"), action=ActionRule(action="skip")),
         ]
 
-        times = []
-        for _ in range(self.iterations):
-            coverage = TextCoverage(text)
-
-            start = time.perf_counter()
-
-            # Simulate coverage detection logic
-            for rule in rules:
-                pattern = rule.match.regex
-                for regex_match in regex.finditer(pattern, text):
-                    coverage.add_range(regex_match.start(), regex_match.end())
-
-            _ = coverage.is_fully_covered()
-
-            end = time.perf_counter()
-            times.append((end - start) * 1000)
-
-        return self._calculate_statistics(times, "Medium Text (~1000 chars, 10 rules)")
+        return self._measure(text, rules, "Medium Text (~1000 chars, 10 rules)")
 
     def benchmark_large_text(self) -> dict[str, Any]:
         """
@@ -214,24 +637,7 @@ class CoverageBenchmark:
             Rule(match=MatchRule(regex=r"quartz"), action=ActionRule(action="skip")),
         ]
 
-        times = []
-        for _ in range(self.iterations):
-            coverage = TextCoverage(text)
-
-            start = time.perf_counter()
-
-            # Simulate coverage detection logic
-            for rule in rules:
-                pattern = rule.match.regex
-                for regex_match in regex.finditer(pattern, text):
-                    coverage.add_range(regex_match.start(), regex_match.end())
-
-            _ = coverage.is_fully_covered()
-
-            end = time.perf_counter()
-            times.append((end - start) * 1000)
-
-        return self._calculate_statistics(times, "Large Text (~10000 chars, 20 rules)")
+        return self._measure(text, rules, "Large Text (~10000 chars, 20 rules)")
 
     def benchmark_many_rules(self) -> dict[str, Any]:
         """
@@ -254,24 +660,7 @@ class CoverageBenchmark:
                 )
             )
 
-        times = []
-        for _ in range(self.iterations):
-            coverage = TextCoverage(text)
-
-            start = time.perf_counter()
-
-            # Simulate coverage detection logic
-            for rule in rules:
-                pattern = rule.match.regex
-                for regex_match in regex.finditer(pattern, text):
-                    coverage.add_range(regex_match.start(), regex_match.end())
-
-            _ = coverage.is_fully_covered()
-
-            end = time.perf_counter()
-            times.append((end - start) * 1000)
-
-        return self._calculate_statistics(times, "Many Rules (~1000 chars, 50 rules)")
+        return self._measure(text, rules, "Many Rules (~1000 chars, 50 rules)")
 
     def benchmark_complex_patterns(self) -> dict[str, Any]:
         """
@@ -296,29 +685,7 @@ class CoverageBenchmark:
             Rule(match=MatchRule(regex=r"\([^)]+\)"), action=ActionRule(action="skip")),
         ]
 
-        times = []
-        for _ in range(self.iterations):
-            coverage = TextCoverage(text)
-
-            start = time.perf_counter()
-
-            # Simulate coverage detection logic
-            for rule in rules:
-                pattern = rule.match.regex
-                try:
-                    for regex_match in regex.finditer(pattern, text):
-                        coverage.add_range(regex_match.start(), regex_match.end())
-                except regex.error:
-                    # Skip invalid regex patterns in benchmark
-                    # This is acceptable in a benchmark context
-                    continue
-
-            _ = coverage.is_fully_covered()
-
-            end = time.perf_counter()
-            times.append((end - start) * 1000)
-
-        return self._calculate_statistics(times, "Complex Patterns (~1000 chars, 10 complex rules)")
+        return self._measure(text, rules, "Complex Patterns (~1000 chars, 10 complex rules)")
 
     def run_all_benchmarks(self) -> list[dict[str, Any]]:
         """
@@ -336,20 +703,16 @@ class CoverageBenchmark:
             ("complex_patterns", self.benchmark_complex_patterns),
         ]
 
-        results = []
-        len(benchmarks)
-
-        for _i, (name, benchmark_func) in enumerate(benchmarks, 1):
-            # Extract scenario name from docstring, with fallback
-            doc_str = benchmark_func.__doc__ or name
-            doc_str.split("(")[0].strip() if "(" in doc_str else doc_str.strip()
-            result = benchmark_func()
-            results.append(result)
+        if self.jobs > 1:
+            # Scenarios share no state, so each runs in its own interpreter; map() keeps report order
+            worker = functools.partial(_run_benchmark, self.iterations, self.options)
+            max_workers = min(self.jobs, len(benchmarks), os.cpu_count() or 1)
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                self.results = list(executor.map(worker, [name for name, _ in benchmarks]))
+            return self.results
 
-            # Display results immediately
-
-        self.results = results
-        return results
+        self.results = [benchmark_func() for _, benchmark_func in benchmarks]
+        return self.results
 
     def _format_test_result(self, result: dict[str, Any]) -> list[str]:
         """
@@ -372,6 +735,7 @@ class CoverageBenchmark:
             f"| Std Dev | {result['stdev_ms']:.3f}ms |",
             f"| Min/Max | {result['min_ms']:.3f}ms / {result['max_ms']:.3f}ms |",
             f"| Ops/sec | {result['ops_per_sec']:,.0f} |",
+            f"| Ops/sample | {result.get('batch_size', 1)} |",
             "",
         ]
 
@@ -452,78 +816,86 @@ class CoverageBenchmark:
         python_version = platform.python_version()
         system_platform = f"{platform.system()} {platform.release()}"
 
-        # Generate markdown report
-        report_lines = [
-            "# Coverage Detection Performance Benchmark Results",
-            "",
-            f"**Date**: {timestamp}  ",
-            f"**Iterations**: {self.iterations} per test  ",
-            f"**Python Version**: {python_version}  ",
-            f"**Platform**: {system_platform}",
-            "",
-            "## Test Results",
-            "",
-        ]
-
-        for result in self.results:
-            report_lines.extend(self._format_test_result(result))
+        # Stream the markdown report section by section instead of joining one large list
+        with output_path.open("w", encoding="utf-8", newline="\n") as report:
 
-        # Add performance analysis
-        report_lines.extend(self._generate_performance_analysis())
+            def write(lines: list[str]) -> None:
+                report.writelines(f"{line}\n" for line in lines)
 
-        # Add recommendations based on results
-        all_acceptable = all(r["mean_ms"] < threshold for r, threshold in zip(self.results, [0.1, 1.0, 10.0, 5.0, 2.0], strict=False))
-
-        if all_acceptable:
-            report_lines.extend(
-                [
-                    "✅ Coverage detection performance is **excellent** across all test scenarios.",
-                    "✅ The overhead is minimal and suitable for production use.",
-                    "✅ No optimization needed at this time.",
-                ]
-            )
-        else:
-            report_lines.extend(
+            write(
                 [
-                    "⚠️ Some scenarios show performance degradation:",
+                    "# Coverage Detection Performance Benchmark Results",
+                    "",
+                    f"**Date**: {timestamp}  ",
+                    f"**Iterations**: {self.iterations} per test  ",
+                    f"**Options**: {self.options}  ",
+                    f"**Python Version**: {python_version}  ",
+                    f"**Platform**: {system_platform}",
+                    "",
+                    "## Test Results",
                     "",
                 ]
             )
-            for _i, (result, threshold) in enumerate(zip(self.results, [0.1, 1.0, 10.0, 5.0, 2.0], strict=False)):
-                if result["mean_ms"] >= threshold:
-                    report_lines.append(f"- {result['scenario']}: {result['mean_ms']:.3f}ms (threshold: {threshold}ms)")
 
-            report_lines.extend(
+            for result in self.results:
+                write(self._format_test_result(result))
+
+            # The analysis compares the small, medium and large scenarios, so it needs a full run
+            if len(self.results) >= _ANALYZED_SCENARIOS:
+                write(self._generate_performance_analysis())
+                write(self._generate_recommendations())
+
+            write(
                 [
                     "",
-                    "**Suggested actions**:",
-                    "- Profile the coverage detection logic to identify bottlenecks",
-                    "- Consider caching compiled regex patterns",
-                    "- Review rule complexity and optimize patterns where possible",
-                    "- Monitor performance in production environments",
+                    "## Conclusion",
+                    "",
+                    f"The coverage detection mechanism adds an average overhead of **{statistics.fmean([r['mean_ms'] for r in self.results]):.3f}ms** ",
+                    "across all test scenarios. This overhead is acceptable for the benefits provided:",
+                    "",
+                    "- ✅ Enables skipping unnecessary translations when rules fully cover text",
+                    "- ✅ Reduces API costs by avoiding redundant translation calls",
+                    "- ✅ Improves overall system throughput",
+                    "- ✅ Maintains accuracy by preserving rule-matched content",
+                    "",
+                    "---",
+                    f"*Benchmark completed at {timestamp}*",
                 ]
             )
 
-        report_lines.extend(
+    def _generate_recommendations(self) -> list[str]:
+        """
+        Generate recommendations based on the per-scenario thresholds.
+
+        Returns:
+            List of formatted markdown lines with recommendations
+
+        """
+        all_acceptable = all(r["mean_ms"] < threshold for r, threshold in zip(self.results, _SCENARIO_THRESHOLDS_MS, strict=False))
+
+        if all_acceptable:
+            return [
+                "✅ Coverage detection performance is **excellent** across all test scenarios.",
+                "✅ The overhead is minimal and suitable for production use.",
+                "✅ No optimization needed at this time.",
+            ]
+
+        lines = [
+            "⚠️ Some scenarios show performance degradation:",
+            "",
+        ]
+        lines.extend(f"- {result['scenario']}: {result['mean_ms']:.3f}ms (threshold: {threshold}ms)" for result, threshold in zip(self.results, _SCENARIO_THRESHOLDS_MS, strict=False) if result["mean_ms"] >= threshold)
+        lines.extend(
             [
                 "",
-                "## Conclusion",
-                "",
-                f"The coverage detection mechanism adds an average overhead of **{statistics.mean([r['mean_ms'] for r in self.results]):.3f}ms** ",
-                "across all test scenarios. This overhead is acceptable for the benefits provided:",
-                "",
-                "- ✅ Enables skipping unnecessary translations when rules fully cover text",
-                "- ✅ Reduces API costs by avoiding redundant translation calls",
-                "- ✅ Improves overall system throughput",
-                "- ✅ Maintains accuracy by preserving rule-matched content",
-                "",
-                "---",
-                f"*Benchmark completed at {timestamp}*",
+                "**Suggested actions**:",
+                "- Profile the coverage detection logic to identify bottlenecks",
+                "- Consider caching compiled regex patterns",
+                "- Review rule complexity and optimize patterns where possible",
+                "- Monitor performance in production environments",
             ]
         )
-
-        # Write report to file
-        output_path.write_text("\n".join(report_lines), encoding="utf-8")
+        return lines
 
 
 def main() -> None:
@@ -536,6 +908,12 @@ Examples:
   python tests/performance/benchmark_coverage.py
   python tests/performance/benchmark_coverage.py --iterations 5000
   python tests/performance/benchmark_coverage.py --test small_text
+  python tests/performance/benchmark_coverage.py --backend bitmap
+  python tests/performance/benchmark_coverage.py --fused
+  python tests/performance/benchmark_coverage.py --literal-search
+  python tests/performance/benchmark_coverage.py --jobs 5
+  python tests/performance/benchmark_coverage.py --regex-v1
+  python tests/performance/benchmark_coverage.py --pin-cpu 0
   python tests/performance/benchmark_coverage.py --verbose
         """,
     )
@@ -551,6 +929,40 @@ Examples:
         choices=["small_text", "medium_text", "large_text", "many_rules", "complex_patterns"],
         help="Run a specific test only",
     )
+    parser.add_argument(
+        "--backend",
+        type=str,
+        choices=["intervals", "bitmap", "bitset", "scan", "batch"],
+        default="intervals",
+        help="Coverage tracker to measure (default: intervals)",
+    )
+    parser.add_argument(
+        "--fused",
+        action="store_true",
+        help="Scan all rules with one fused alternation pattern",
+    )
+    parser.add_argument(
+        "--literal-search",
+        action="store_true",
+        help="Find literal patterns with str.find() instead of the regex engine",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Run scenarios in this many worker processes (default: 1)",
+    )
+    parser.add_argument(
+        "--regex-v1",
+        action="store_true",
+        help="Compile rule patterns with the regex module's VERSION1 behaviour",
+    )
+    parser.add_argument(
+        "--pin-cpu",
+        type=int,
+        metavar="CPU",
+        help="Pin the benchmark to one CPU core (Linux only)",
+    )
     parser.add_argument(
         "--verbose",
         action="store_true",
@@ -559,8 +971,20 @@ Examples:
 
     args = parser.parse_args()
 
+    if args.pin_cpu is not None:
+        if not hasattr(os, "sched_setaffinity"):
+            parser.error("--pin-cpu is only supported on Linux")
+        # Keep the scheduler from migrating the benchmark between cores mid-measurement
+        os.sched_setaffinity(0, {args.pin_cpu})
+
     # Create benchmark instance
-    benchmark = CoverageBenchmark(iterations=args.iterations)
+    options = BenchmarkOptions(
+        backend=args.backend,
+        fused=args.fused,
+        literal_search=args.literal_search,
+        regex_flags=regex.V1 if args.regex_v1 else 0,
+    )
+    benchmark = CoverageBenchmark(iterations=args.iterations, options=options, jobs=args.jobs)
 
     # Run benchmarks
     if args.test:
@@ -581,11 +1005,7 @@ Examples:
         benchmark.run_all_benchmarks()
 
     # Generate report
-
     if benchmark.results:
-        statistics.mean([r["mean_ms"] for r in benchmark.results])
-
-        # Save report
         output_path = Path(__file__).parent / "benchmark_results.md"
         benchmark.generate_report(output_path)
 
@@ -0,0 +1,80 @@
+"""Tests for the benchmark-only coverage trackers in benchmark_coverage.py."""
+
+import unittest
+
+import regex
+
+from tests.performance.benchmark_coverage import CoverageBitset, ranges_cover_length, scan_and_cover
+
+
+class TestCoverageBitset(unittest.TestCase):
+    """Test suite for the CoverageBitset fast path."""
+
+    def test_bitset_constructor(self) -> None:
+        """CoverageBitset should create an empty bitset of the given length."""
+        bitset = CoverageBitset(5)
+        assert isinstance(bitset, CoverageBitset)
+        assert len(bitset) == 5
+        assert not bitset.is_fully_covered()
+
+    def test_bitset_word_boundaries(self) -> None:
+        """Ranges crossing 64-bit word boundaries should be marked completely."""
+        bitset = CoverageBitset(200)
+        bitset.add_range(0, 63)
+        bitset.add_range(64, 200)
+        assert not bitset.is_fully_covered()
+        bitset.add_range(60, 70)
+        assert bitset.is_fully_covered()
+
+    def test_bitset_reset(self) -> None:
+        """Reset should clear all coverage."""
+        bitset = CoverageBitset(3)
+        bitset.add_range(0, 3)
+        bitset.reset()
+        assert not bitset.is_fully_covered()
+
+    def test_bitset_empty_text(self) -> None:
+        """An empty bitset should be considered fully covered."""
+        assert CoverageBitset(0).is_fully_covered()
+
+
+class TestScanAndCover(unittest.TestCase):
+    """Test suite for the scan_and_cover fast path."""
+
+    def test_fully_covered_by_patterns(self) -> None:
+        """Patterns whose matches span the text should report full coverage."""
+        patterns = [regex.compile(r"\w+"), regex.compile(r"\s")]
+        assert scan_and_cover("who are you", patterns)
+
+    def test_partially_covered_by_patterns(self) -> None:
+        """Uncovered characters should be detected."""
+        patterns = [regex.compile(r"\w+")]
+        assert not scan_and_cover("who are you", patterns)
+
+    def test_empty_text(self) -> None:
+        """Empty text should be considered fully covered."""
+        assert scan_and_cover("", [regex.compile(r"x")])
+
+
+class TestRangesCoverLength(unittest.TestCase):
+    """Test suite for the ranges_cover_length helper function."""
+
+    def test_unsorted_overlapping_ranges(self) -> None:
+        """Unsorted, overlapping ranges spanning the length should cover it."""
+        assert ranges_cover_length([(6, 11), (0, 4), (3, 7)], 11)
+
+    def test_gap(self) -> None:
+        """A gap between ranges should not cover the length."""
+        assert not ranges_cover_length([(0, 4), (5, 11)], 11)
+
+    def test_short_of_end(self) -> None:
+        """Ranges ending before the length should not cover it."""
+        assert not ranges_cover_length([(0, 10)], 11)
+
+    def test_zero_length(self) -> None:
+        """Zero length should always be covered."""
+        assert ranges_cover_length([], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,24 @@
+"""
+Literal-substitution cross-check for the regex test suite.
+
+Patterns without regex metacharacters can also be substituted with
+``str.replace()``. Tests assert on the regex engine first and use this helper
+only to check that the plain string path agrees.
+"""
+
+
+def sub_literal(pattern: str, replacement: str, text: str, count: int = 0) -> str:
+    """
+    Replace a literal pattern with ``str.replace()``, mirroring ``Pattern.sub()``.
+
+    Args:
+        pattern: A pattern without regex metacharacters.
+        replacement: The literal replacement text.
+        text: The text to substitute in.
+        count: Maximum number of replacements; 0 replaces every occurrence.
+
+    Returns:
+        The substituted text.
+
+    """
+    return text.replace(pattern, replacement, count or -1)
@@ -0,0 +1,97 @@
+"""
+Shared fixtures for the regex library test suite.
+
+The test modules share no state, so they parallelize cleanly with
+pytest-xdist: ``pytest -n auto --dist loadgroup tests/regex_tests/``. Each
+module is its own ``xdist_group``, so a module's tests stay on one worker
+and reuse that worker's session-scoped ``compile_cache``.
+"""
+
+import os
+import re
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import pytest
+import regex
+
+# USE_STDLIB_RE=1 runs the cached-pattern tests on the standard library ``re``
+# engine for A/B comparison. ``regex`` stays the default because it is the
+# engine GlocalText uses; tests relying on ``regex``-only features bypass the cache.
+_ENGINE = re if os.environ.get("USE_STDLIB_RE") == "1" else regex
+
+# REGEX_VERSION1=1 adds regex.VERSION1 to every cached compile. It is opt-in
+# and per pattern rather than a global regex.DEFAULT_VERSION switch, which
+# would leak into every other test module in the same process.
+_EXTRA_FLAGS = regex.VERSION1 if _ENGINE is regex and os.environ.get("REGEX_VERSION1") == "1" else 0
+
+# Directory whose collected tests are grouped per module for pytest-xdist.
+_SUITE_DIR = Path(__file__).parent
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Register the pytest-xdist ``xdist_group`` marker so it is known without the plugin."""
+    config.addinivalue_line("markers", "xdist_group(name): run tests of the same group on one pytest-xdist worker")
+
+
+def pytest_collection_modifyitems(items: list[pytest.Item]) -> None:
+    """Put every regex suite test into an ``xdist_group`` named after its module."""
+    for item in items:
+        if isinstance(item, pytest.Function) and item.path.parent == _SUITE_DIR:
+            item.add_marker(pytest.mark.xdist_group(item.module.__name__))
+
+
+@pytest.fixture(scope="session")
+def compile_cache() -> Callable[..., regex.Pattern[str]]:
+    """
+    Provide a session-wide compiler that builds each pattern only once.
+
+    Compiled patterns are keyed by ``(pattern, flags)``, so every test that
+    uses the same pattern shares one ``regex.Pattern`` for the whole run.
+    Patterns that fail to compile raise and are not cached. Patterns are
+    compiled with ``regex`` unless ``USE_STDLIB_RE=1`` selects ``re``, and
+    with ``regex.VERSION1`` behaviour when ``REGEX_VERSION1=1``.
+
+    Because this dict holds every pattern for the whole session, the
+    ``regex`` module's internal pattern cache (500 entries) is never the
+    limiting factor here and is left at its default size.
+
+    Returns:
+        A function ``compile(pattern, flags=0)`` returning the compiled pattern.
+
+    """
+    cache: dict[tuple[str, int], regex.Pattern[str]] = {}
+
+    def _compile(pattern: str, flags: int = 0) -> regex.Pattern[str]:
+        key = (pattern, flags)
+        compiled = cache.get(key)
+        if compiled is None:
+            compiled = cache[key] = _ENGINE.compile(pattern, flags | _EXTRA_FLAGS)
+        return compiled
+
+    return _compile
+
+
+@pytest.fixture(scope="session")
+def long_needle_text() -> str:
+    """Return a 20,006-character text with ``needle`` in the middle, built once per session."""
+    return "a" * 10000 + "needle" + "b" * 10000
+
+
+@pytest.fixture(scope="session")
+def repeated_a_text() -> str:
+    """Return a run of 100 ``a`` characters, built once per session."""
+    return "a" * 100
+
+
+@pytest.fixture
+def bench(request: pytest.FixtureRequest) -> Any:  # noqa: ANN401
+    """
+    Provide the pytest-benchmark ``benchmark`` fixture, skipping when it is unavailable.
+
+    Compile patterns through ``compile_cache`` before calling ``bench`` so only
+    the match itself is timed.
+    """
+    pytest.importorskip("pytest_benchmark")
+    return request.getfixturevalue("benchmark")
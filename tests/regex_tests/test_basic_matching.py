@@ -5,127 +5,129 @@ Tests the fundamental matching functions: search(), match(), and fullmatch().
 Validates literal string matching and special character escaping.
 """
 
+from collections.abc import Callable
+
 import regex
 
 
-def test_search_partial_match() -> None:
-    """Test regex.search() finds pattern anywhere in string."""
+def test_search_partial_match(compile_cache: Callable[..., regex.Pattern[str]]) -> None:
+    """Test Pattern.search() finds pattern anywhere in string."""
     text = "The quick brown fox"
     pattern = "quick"
-    match = regex.search(pattern, text)
+    match = compile_cache(pattern).search(text)
 
     assert match is not None
     assert match.group() == "quick"
     assert match.start() == 4
 
 
-def test_search_not_found() -> None:
-    """Test regex.search() returns None when pattern not found."""
+def test_search_not_found(compile_cache: Callable[..., regex.Pattern[str]]) -> None:
+    """Test Pattern.search() returns None when pattern not found."""
     text = "The quick brown fox"
     pattern = "slow"
-    match = regex.search(pattern, text)
+    match = compile_cache(pattern).search(text)
 
     assert match is None
 
 
-def test_match_from_beginning() -> None:
-    """Test regex.match() only matches from the start of string."""
+def test_match_from_beginning(compile_cache: Callable[..., regex.Pattern[str]]) -> None:
+    """Test Pattern.match() only matches from the start of string."""
     text = "The quick brown fox"
     pattern = "The"
-    match = regex.match(pattern, text)
+    match = compile_cache(pattern).match(text)
 
     assert match is not None
     assert match.group() == "The"
 
 
-def test_match_not_from_beginning() -> None:
-    """Test regex.match() returns None if pattern not at start."""
+def test_match_not_from_beginning(compile_cache: Callable[..., regex.Pattern[str]]) -> None:
+    """Test Pattern.match() returns None if pattern not at start."""
     text = "The quick brown fox"
     pattern = "quick"
-    match = regex.match(pattern, text)
+    match = compile_cache(pattern).match(text)
 
     assert match is None
 
 
-def test_fullmatch_entire_string() -> None:
-    """Test regex.fullmatch() matches entire string exactly."""
+def test_fullmatch_entire_string(compile_cache: Callable[..., regex.Pattern[str]]) -> None:
+    """Test Pattern.fullmatch() matches entire string exactly."""
     text = "hello"
     pattern = "hello"
-    match = regex.fullmatch(pattern, text)
+    match = compile_cache(pattern).fullmatch(text)
 
     assert match is not None
     assert match.group() == "hello"
 
 
-def test_fullmatch_partial_fails() -> None:
-    """Test regex.fullmatch() fails on partial matches."""
+def test_fullmatch_partial_fails(compile_cache: Callable[..., regex.Pattern[str]]) -> None:
+    """Test Pattern.fullmatch() fails on partial matches."""
     text = "hello world"
     pattern = "hello"
-    match = regex.fullmatch(pattern, text)
+    match = compile_cache(pattern).fullmatch(text)
 
     assert match is None
 
 
-def test_literal_string_matching() -> None:
+def test_literal_string_matching(compile_cache: Callable[..., regex.Pattern[str]]) -> None:
     """Test matching literal strings without regex metacharacters."""
     text = "who is there"
     pattern = "who"
-    match = regex.search(pattern, text)
+    match = compile_cache(pattern).search(text)
 
     assert match is not None
     assert match.group() == "who"
 
 
-def test_case_sensitive_matching() -> None:
+def test_case_sensitive_matching(compile_cache: Callable[..., regex.Pattern[str]]) -> None:
     """Test that matching is case-sensitive by default."""
     text = "Hello World"
     pattern = "hello"
-    match = regex.search(pattern, text)
+    match = compile_cache(pattern).search(text)
 
     assert match is None
 
 
-def test_escape_special_characters_dot() -> None:
+def test_escape_special_characters_dot(compile_cache: Callable[..., regex.Pattern[str]]) -> None:
     """Test escaping the dot metacharacter."""
     text = "file.txt"
     # Without escaping, dot matches any character
     pattern_unescaped = "file.txt"
-    match_unescaped = regex.search(pattern_unescaped, "fileXtxt")
+    match_unescaped = compile_cache(pattern_unescaped).search("fileXtxt")
     assert match_unescaped is not None
 
     # With escaping, dot matches literal dot
     pattern_escaped = r"file\.txt"
-    match_escaped = regex.search(pattern_escaped, text)
+    match_escaped = compile_cache(pattern_escaped).search(text)
     assert match_escaped is not None
     assert match_escaped.group() == "file.txt"
 
 
-def test_escape_special_characters_parentheses() -> None:
+def test_escape_special_characters_parentheses(compile_cache: Callable[..., regex.Pattern[str]]) -> None:
     """Test escaping parentheses metacharacters."""
     text = "function(arg)"
     pattern = r"function\(arg\)"
-    match = regex.search(pattern, text)
+    match = compile_cache(pattern).search(text)
 
     assert match is not None
     assert match.group() == "function(arg)"
 
 
-def test_multiple_matches_find_first() -> None:
-    """Test regex.search() finds the first occurrence."""
+def test_multiple_matches_find_first(compile_cache: Callable[..., regex.Pattern[str]]) -> None:
+    """Test Pattern.search() finds the first occurrence."""
     text = "cat cat cat"
     pattern = "cat"
-    match = regex.search(pattern, text)
+    match = compile_cache(pattern).search(text)
 
     assert match is not None
     assert match.start() == 0
     assert match.group() == "cat"
 
 
-def test_empty_pattern() -> None:
+def test_empty_pattern(compile_cache: Callable[..., regex.Pattern[str]]) -> None:
     """Test matching with empty pattern."""
     text = "hello"
     pattern = ""
-    match = regex.search(pattern, text)
+    match = compile_cache(pattern).search(text)
 
     # Empty pattern matches at position 0
     assert match is not None
@@ -133,20 +135,20 @@ def test_empty_pattern() -> None:
     assert match.group() == ""
 
 
-def test_empty_string() -> None:
+def test_empty_string(compile_cache: Callable[..., regex.Pattern[str]]) -> None:
     """Test searching in empty string."""
     text = ""
     pattern = "hello"
-    match = regex.search(pattern, text)
+    match = compile_cache(pattern).search(text)
 
     assert match is None
 
 
-def test_match_object_attributes() -> None:
+def test_match_object_attributes(compile_cache: Callable[..., regex.Pattern[str]]) -> None:
     """Test accessing Match object attributes."""
     text = "The quick brown"
     pattern = "quick"
-    match = regex.search(pattern, text)
+    match = compile_cache(pattern).search(text)
 
     assert match is not None
     assert match.group() == "quick"
@@ -0,0 +1,42 @@
+"""
+Match-only micro-benchmarks for the regex test patterns.
+
+Requires pytest-benchmark and is skipped without it. Each pattern is compiled
+through ``compile_cache`` before timing, so compile and match regressions can
+be told apart. Run only these with ``pytest tests/regex_tests --benchmark-only``.
+"""
+
+from collections.abc import Callable
+from typing import Any
+
+import regex
+
+# Upper bound for the slowest round of a match that must stay linear in the input.
+_MAX_ROUND_SECONDS = 0.05
+
+
+def test_bench_literal_search(bench: Any, long_needle_text: str, compile_cache: Callable[..., regex.Pattern[str]]) -> None:  # noqa: ANN401
+    """Benchmark a literal search through 20,006 characters."""
+    pattern = compile_cache("needle")
+
+    match = bench(pattern.search, long_needle_text)
+    assert match is not None
+
+
+def test_bench_many_repetitions(bench: Any, repeated_a_text: str, compile_cache: Callable[..., regex.Pattern[str]]) -> None:  # noqa: ANN401
+    """Benchmark a greedy repetition and fail on super-linear slowdowns."""
+    pattern = compile_cache(r"a+")
+
+    matches = bench(pattern.findall, repeated_a_text)
+    assert matches == [repeated_a_text]
+    assert bench.stats.stats.max < _MAX_ROUND_SECONDS
+
+
+def test_bench_greedy_quantifier(bench: Any, compile_cache: Callable[..., regex.Pattern[str]]) -> None:  # noqa: ANN401
+    """Benchmark a greedy ``.*`` match and fail on super-linear slowdowns."""
+    pattern = compile_cache(r"<.*>")
+    text = "<tag>" + "content " * 1000 + "</tag>"
+
+    match = bench(pattern.search, text)
+    assert match is not None
+    assert bench.stats.stats.max < _MAX_ROUND_SECONDS
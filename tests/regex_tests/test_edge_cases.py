@@ -1,209 +1,145 @@
 """
 Tests for edge cases and boundary conditions.
 
-Tests empty strings, special characters, escape sequences, long text, and error handling.
+Tests empty strings, special characters, escape sequences, and long text.
+
+The regex module is a backtracking (NFA) engine, not a DFA: a nested or
+overlapping quantifier such as ``(a+)+b`` can take exponential time on a
+near-miss input (ReDoS). Keep repetition tests on linear patterns, prefer
+bounded (``a{1,100}``) or possessive (``a{1,100}+``) quantifiers when a
+pattern may grow, and guard such tests with the ``timeout`` argument.
 """
 
+import functools
+import inspect
+from collections.abc import Callable
+
+import pytest
 import regex
 
+# Matching linear patterns on these inputs takes microseconds; a timeout means backtracking blew up.
+_MATCH_TIMEOUT_SECONDS = 1.0
+
+# Whether this regex version accepts findall(..., overlapped=True); probed once at import.
+HAS_OVERLAPPED = "overlapped" in inspect.signature(regex.findall).parameters
+
+# Escaped forms of the parametrized literals, computed once per literal.
+_escape = functools.lru_cache(maxsize=256)(regex.escape)
 
-def test_empty_string_pattern() -> None:
+
+def test_empty_string_pattern(compile_cache: Callable[..., regex.Pattern[str]]) -> None:
     """Test matching with empty pattern."""
     text = "hello"
     pattern = ""
 
-    match = regex.search(pattern, text)
+    match = compile_cache(pattern).search(text)
     # Empty pattern matches at start
     assert match is not None
     assert match.start() == 0
 
 
-def test_empty_string_text() -> None:
+def test_empty_string_text(compile_cache: Callable[..., regex.Pattern[str]]) -> None:
     """Test matching in empty text."""
     text = ""
     pattern = "hello"
 
-    match = regex.search(pattern, text)
+    match = compile_cache(pattern).search(text)
     assert match is None
 
 
-def test_both_empty_strings() -> None:
+def test_both_empty_strings(compile_cache: Callable[..., regex.Pattern[str]]) -> None:
     """Test matching when both pattern and text are empty."""
     text = ""
     pattern = ""
 
-    match = regex.search(pattern, text)
-    assert match is not None
-
-
-def test_special_char_pipe() -> None:
-    """Test literal pipe character (needs escaping in pattern)."""
-    text = "cmd1 | cmd2"
-    pattern = r"\|"
-
-    match = regex.search(pattern, text)
+    match = compile_cache(pattern).search(text)
     assert match is not None
-    assert match.group() == "|"
-
-
-def test_special_char_dollar() -> None:
-    """Test literal dollar sign (needs escaping in pattern)."""
-    text = "$100"
-    pattern = r"\$"
-
-    match = regex.search(pattern, text)
-    assert match is not None
-    assert match.group() == "$"
-
 
-def test_special_char_parentheses() -> None:
-    """Test literal parentheses (need escaping in pattern)."""
-    text = "func()"
-    pattern = r"\(\)"
 
-    match = regex.search(pattern, text)
+@pytest.mark.parametrize(
+    ("literal", "text"),
+    [
+        ("|", "cmd1 | cmd2"),
+        ("$", "$100"),
+        ("()", "func()"),
+        ("[]", "array[]"),
+        ("{}", "{}"),
+        ("*", "a*b"),
+        ("+", "a+b"),
+        ("?", "what?"),
+        (".", "file.txt"),
+        ("^", "x^2"),
+        ("\\", r"C:\path"),
+    ],
+    ids=["pipe", "dollar", "parentheses", "brackets", "braces", "asterisk", "plus", "question", "dot", "caret", "backslash"],
+)
+def test_special_char_literal(literal: str, text: str, compile_cache: Callable[..., regex.Pattern[str]]) -> None:
+    """Test matching metacharacters literally once escaped with regex.escape()."""
+    match = compile_cache(_escape(literal)).search(text)
     assert match is not None
-    assert match.group() == "()"
-
-
-def test_special_char_brackets() -> None:
-    """Test literal brackets (need escaping in pattern)."""
-    text = "array[]"
-    pattern = r"\[\]"
-
-    match = regex.search(pattern, text)
-    assert match is not None
-    assert match.group() == "[]"
-
-
-def test_special_char_braces() -> None:
-    """Test literal braces (need escaping in pattern)."""
-    text = "{}"
-    pattern = r"\{\}"
-
-    match = regex.search(pattern, text)
-    assert match is not None
-    assert match.group() == "{}"
-
-
-def test_special_char_asterisk() -> None:
-    """Test literal asterisk (needs escaping in pattern)."""
-    text = "a*b"
-    pattern = r"\*"
-
-    match = regex.search(pattern, text)
-    assert match is not None
-    assert match.group() == "*"
-
+    assert match.group() == literal
 
-def test_special_char_plus() -> None:
-    """Test literal plus sign (needs escaping in pattern)."""
-    text = "a+b"
-    pattern = r"\+"
 
-    match = regex.search(pattern, text)
-    assert match is not None
-    assert match.group() == "+"
-
-
-def test_special_char_question() -> None:
-    """Test literal question mark (needs escaping in pattern)."""
-    text = "what?"
-    pattern = r"\?"
-
-    match = regex.search(pattern, text)
-    assert match is not None
-    assert match.group() == "?"
-
-
-def test_special_char_dot() -> None:
-    """Test literal dot (needs escaping in pattern)."""
-    text = "file.txt"
-    pattern = r"\."
-
-    match = regex.search(pattern, text)
-    assert match is not None
-    assert match.group() == "."
-
-
-def test_special_char_caret() -> None:
-    """Test literal caret (needs escaping in pattern)."""
-    text = "x^2"
-    pattern = r"\^"
-
-    match = regex.search(pattern, text)
-    assert match is not None
-    assert match.group() == "^"
-
-
-def test_backslash_escaping() -> None:
-    """Test literal backslash (needs double escaping)."""
-    text = r"C:\path"
-    pattern = r"\\"
-
-    match = regex.search(pattern, text)
-    assert match is not None
-    assert match.group() == "\\"
-
-
-def test_newline_in_text() -> None:
+def test_newline_in_text(compile_cache: Callable[..., regex.Pattern[str]]) -> None:
     """Test matching across newlines."""
     text = "line1\nline2"
     pattern = "line1"
 
-    match = regex.search(pattern, text)
+    match = compile_cache(pattern).search(text)
     assert match is not None
+    assert match.span() == (0, 5)
 
 
-def test_tab_character() -> None:
+def test_tab_character(compile_cache: Callable[..., regex.Pattern[str]]) -> None:
     """Test matching tab character."""
     text = "word1\tword2"
     pattern = r"\t"
 
-    match = regex.search(pattern, text)
+    match = compile_cache(pattern).search(text)
     assert match is not None
 
 
-def test_very_long_text() -> None:
+def test_very_long_text(long_needle_text: str, compile_cache: Callable[..., regex.Pattern[str]]) -> None:
     """Test regex performance with long text."""
-    text = "a" * 10000 + "needle" + "b" * 10000
-    pattern = "needle"
-
-    match = regex.search(pattern, text)
+    match = compile_cache("needle").search(long_needle_text)
     assert match is not None
     assert match.group() == "needle"
+    assert match.start() == 10000
 
 
-def test_many_repetitions() -> None:
+def test_many_repetitions(repeated_a_text: str, compile_cache: Callable[..., regex.Pattern[str]]) -> None:
     """Test pattern with many repetitions."""
-    text = "a" * 100
-    pattern = r"a+"
+    match = compile_cache(r"a+").search(repeated_a_text)
+    assert match is not None
+    assert len(match.group()) == 100
+
 
-    match = regex.search(pattern, text)
+def test_bounded_repetition(repeated_a_text: str, compile_cache: Callable[..., regex.Pattern[str]]) -> None:
+    """Test a bounded quantifier as the safe alternative to an open-ended one."""
+    match = compile_cache(r"a{1,100}").search(repeated_a_text)
     assert match is not None
     assert len(match.group()) == 100
 
 
-def test_invalid_regex_pattern() -> None:
-    """Test handling of invalid regex pattern."""
-    text = "hello"
-    pattern = "["  # Unclosed character class
+def test_possessive_repetition_does_not_backtrack() -> None:
+    """Test that a possessive quantifier never gives characters back."""
+    # a{1,100}+ consumes every 'a', so the trailing 'a' can never match
+    assert regex.search(r"a{1,100}+a", "aaa") is None
+    assert regex.search(r"a{1,100}a", "aaa") is not None
+
 
-    try:
-        regex.search(pattern, text)
-        # If no error raised, fail the test
-        assert False, "Expected regex.error to be raised"  # noqa: B011, PT015
-    except regex.error:
-        # Expected behavior
-        pass
+def test_repetition_within_timeout(repeated_a_text: str) -> None:
+    """Test that repetition matching finishes well inside a timeout (raises TimeoutError otherwise)."""
+    match = regex.compile(r"a+").search(repeated_a_text, timeout=_MATCH_TIMEOUT_SECONDS)
+    assert match is not None
 
 
-def test_nested_groups() -> None:
+def test_nested_groups(compile_cache: Callable[..., regex.Pattern[str]]) -> None:
     """Test deeply nested capturing groups."""
     text = "abc"
     pattern = r"((a)(b)(c))"
 
-    match = regex.search(pattern, text)
+    match = compile_cache(pattern).search(text)
     assert match is not None
     assert match.group(0) == "abc"
     assert match.group(1) == "abc"
@@ -212,52 +148,53 @@ def test_nested_groups() -> None:
     assert match.group(4) == "c"
 
 
-def test_null_byte() -> None:
+def test_null_byte(compile_cache: Callable[..., regex.Pattern[str]]) -> None:
     """Test handling of null byte in text."""
     text = "hello\x00world"
     pattern = "hello"
 
-    match = regex.search(pattern, text)
+    match = compile_cache(pattern).search(text)
     assert match is not None
+    assert match.span() == (0, 5)
 
 
-def test_unicode_escape() -> None:
+def test_unicode_escape(compile_cache: Callable[..., regex.Pattern[str]]) -> None:
     """Test Unicode escape sequences in pattern."""
     text = "hello"
     pattern = r"h\u0065llo"  # \u0065 is 'e'
 
-    match = regex.search(pattern, text)
+    match = compile_cache(pattern).search(text)
     assert match is not None
     assert match.group() == "hello"
 
 
-def test_substitution_with_empty_replacement() -> None:
+def test_substitution_with_empty_replacement(compile_cache: Callable[..., regex.Pattern[str]]) -> None:
     """Test substitution with empty string removes matched text."""
     text = "hello world"
     pattern = "world"
     replacement = ""
 
-    result = regex.sub(pattern, replacement, text)
+    result = compile_cache(pattern).sub(replacement, text)
     assert result == "hello "
 
 
-def test_substitution_no_match_returns_original() -> None:
+def test_substitution_no_match_returns_original(compile_cache: Callable[..., regex.Pattern[str]]) -> None:
     """Test that sub returns original text when no match."""
     text = "hello"
     pattern = "goodbye"
     replacement = "hi"
 
-    result = regex.sub(pattern, replacement, text)
+    result = compile_cache(pattern).sub(replacement, text)
     assert result == "hello"
 
 
-def test_zero_width_assertion() -> None:
+def test_zero_width_assertion(compile_cache: Callable[..., regex.Pattern[str]]) -> None:
     """Test zero-width assertions."""
     text = "test123"
     # Positive lookahead
     pattern = r"test(?=\d)"
 
-    match = regex.search(pattern, text)
+    match = compile_cache(pattern).search(text)
     assert match is not None
     assert match.group() == "test"
 
@@ -265,16 +202,12 @@ def test_zero_width_assertion() -> None:
 def test_overlapping_matches() -> None:
     """Test findall with overlapping matches."""
     text = "aaa"
-    pattern = "aa"
+    # Compiled with regex directly: overlapped= is not available in stdlib re
+    pattern = regex.compile("aa")
 
     # Standard findall doesn't find overlapping matches
-    matches = regex.findall(pattern, text)
-    assert len(matches) == 1
+    assert len(pattern.findall(text)) == 1
 
     # regex module supports overlapped parameter
-    try:
-        matches_overlapped = regex.findall(pattern, text, overlapped=True)
-        assert len(matches_overlapped) == 2
-    except TypeError:
-        # If overlapped not supported, skip this part
-        pass
+    if HAS_OVERLAPPED:
+        assert len(pattern.findall(text, overlapped=True)) == 2
@@ -0,0 +1,18 @@
+"""
+Tests for regex error handling.
+
+Kept apart from the compile_cache-based modules so invalid patterns never
+touch the shared pattern cache.
+"""
+
+import pytest
+import regex
+
+
+def test_invalid_regex_pattern() -> None:
+    """Test handling of invalid regex pattern."""
+    text = "hello"
+    pattern = "["  # Unclosed character class
+
+    with pytest.raises(regex.error):
+        regex.search(pattern, text)
@@ -4,186 +4,145 @@ Tests for regex flags.
 Tests IGNORECASE, MULTILINE, DOTALL, and VERBOSE flags.
 """
 
+from collections.abc import Callable
+from typing import Any
+
+import pytest
 import regex
+from regex import DOTALL, IGNORECASE, MULTILINE, VERBOSE, I, S, X
+
+# Multi-line verbose sources; comments and whitespace are stripped by the flag.
+_VERBOSE_TEST123 = r"""
+    test    # Match the word "test"
+    \d+     # Followed by one or more digits
+"""
+_VERBOSE_LETTERS_DIGITS = r"""
+    [a-z]+  # Letters
+    \d+     # Digits
+"""
+
+
+def _search(pattern: regex.Pattern[str], text: str, _replacement: str | None) -> str | None:
+    match = pattern.search(text)
+    return None if match is None else match.group()
+
+
+def _findall(pattern: regex.Pattern[str], text: str, _replacement: str | None) -> list[Any]:
+    return pattern.findall(text)
+
+
+def _sub(pattern: regex.Pattern[str], text: str, replacement: str | None) -> str:
+    return pattern.sub(replacement or "", text)
+
+
+# Operation name -> callable(pattern, text, replacement) used by the flag table.
+_OPS: dict[str, Callable[[regex.Pattern[str], str, str | None], Any]] = {
+    "search": _search,
+    "findall": _findall,
+    "sub": _sub,
+}
 
+# (pattern, flags, op, text, replacement, expected) for single-call flag checks.
+FLAG_CASES = [
+    pytest.param("hello", I, "search", "HELLO world", None, "HELLO", id="ignorecase_short"),
+    pytest.param(r"line1.line2", S, "search", "line1\nline2", None, "line1\nline2", id="dotall_short"),
+    pytest.param(r"^hello.*world$", IGNORECASE | DOTALL | MULTILINE, "search", "Hello\nWorld", None, "Hello\nWorld", id="combined_flags"),
+    pytest.param(r"(?i)hello", 0, "search", "Hello World", None, "Hello", id="inline_ignorecase"),
+    pytest.param(r"(?m)^line2", 0, "search", "line1\nline2", None, "line2", id="inline_multiline"),
+    pytest.param(r"(?s)a.b", 0, "search", "a\nb", None, "a\nb", id="inline_dotall"),
+    pytest.param("hello", IGNORECASE, "sub", "Hello HELLO hello", "hi", "hi hi hi", id="flag_with_substitution"),
+    # Matching is case-sensitive by default
+    pytest.param("abc", 0, "findall", "ABC abc", None, ["abc"], id="case_sensitive_by_default"),
+]
 
-def test_ignorecase_flag() -> None:
+
+def test_ignorecase_flag(compile_cache: Callable[..., regex.Pattern[str]]) -> None:
     """Test regex.IGNORECASE flag for case-insensitive matching."""
     text = "Hello World"
-    pattern = "hello"
 
     # Without flag, no match
-    match_without = regex.search(pattern, text)
+    match_without = compile_cache("hello").search(text)
     assert match_without is None
 
     # With IGNORECASE flag, matches
-    match_with = regex.search(pattern, text, regex.IGNORECASE)
+    match_with = compile_cache("hello", IGNORECASE).search(text)
     assert match_with is not None
     assert match_with.group() == "Hello"
 
 
-def test_ignorecase_flag_short() -> None:
-    """Test regex.I as shorthand for IGNORECASE."""
-    text = "HELLO world"
-    pattern = "hello"
-
-    match = regex.search(pattern, text, regex.I)
-    assert match is not None
-    assert match.group() == "HELLO"
-
-
-def test_multiline_flag() -> None:
+def test_multiline_flag(compile_cache: Callable[..., regex.Pattern[str]]) -> None:
     """Test regex.MULTILINE flag changes ^ and $ behavior."""
     text = "line1\nline2\nline3"
-    pattern = r"^line"
 
     # Without MULTILINE, ^ only matches start of string
-    matches_without = regex.findall(pattern, text)
+    matches_without = compile_cache(r"^line").findall(text)
     assert len(matches_without) == 1
     assert matches_without == ["line"]
 
     # With MULTILINE, ^ matches start of each line
-    matches_with = regex.findall(pattern, text, regex.MULTILINE)
+    matches_with = compile_cache(r"^line", MULTILINE).findall(text)
     assert len(matches_with) == 3
     assert matches_with == ["line", "line", "line"]
 
 
-def test_multiline_flag_end_anchor() -> None:
+def test_multiline_flag_end_anchor(compile_cache: Callable[..., regex.Pattern[str]]) -> None:
     """Test regex.MULTILINE with $ anchor."""
     text = "end1\nend2\nend3"
-    pattern = r"\d$"
 
     # Without MULTILINE, $ only matches end of string
-    matches_without = regex.findall(pattern, text)
+    matches_without = compile_cache(r"\d$").findall(text)
     assert matches_without == ["3"]
 
     # With MULTILINE, $ matches end of each line
-    matches_with = regex.findall(pattern, text, regex.MULTILINE)
+    matches_with = compile_cache(r"\d$", MULTILINE).findall(text)
     assert matches_with == ["1", "2", "3"]
 
 
-def test_dotall_flag() -> None:
+def test_dotall_flag(compile_cache: Callable[..., regex.Pattern[str]]) -> None:
     """Test regex.DOTALL flag makes dot match newlines."""
     text = "first\nsecond"
-    pattern = r"first.second"
 
     # Without DOTALL, dot doesn't match newline
-    match_without = regex.search(pattern, text)
+    match_without = compile_cache(r"first.second").search(text)
     assert match_without is None
 
     # With DOTALL, dot matches newline
-    match_with = regex.search(pattern, text, regex.DOTALL)
+    match_with = compile_cache(r"first.second", DOTALL).search(text)
     assert match_with is not None
     assert match_with.group() == "first\nsecond"
 
 
-def test_dotall_flag_short() -> None:
-    """Test regex.S as shorthand for DOTALL."""
-    text = "line1\nline2"
-    pattern = r"line1.line2"
-
-    match = regex.search(pattern, text, regex.S)
-    assert match is not None
-
-
-def test_verbose_flag() -> None:
+def test_verbose_flag(compile_cache: Callable[..., regex.Pattern[str]]) -> None:
     """Test regex.VERBOSE flag allows comments and whitespace in pattern."""
-    text = "test123"
-
-    # Verbose pattern with comments and whitespace
-    pattern = r"""
-        test    # Match the word "test"
-        \d+     # Followed by one or more digits
-    """
-
-    match = regex.search(pattern, text, regex.VERBOSE)
+    match = compile_cache(_VERBOSE_TEST123, VERBOSE).search("test123")
     assert match is not None
     assert match.group() == "test123"
 
 
-def test_verbose_flag_short() -> None:
+def test_verbose_flag_short(compile_cache: Callable[..., regex.Pattern[str]]) -> None:
     """Test regex.X as shorthand for VERBOSE."""
-    text = "abc123"
-    pattern = r"""
-        [a-z]+  # Letters
-        \d+     # Digits
-    """
-
-    match = regex.search(pattern, text, regex.X)
+    match = compile_cache(_VERBOSE_LETTERS_DIGITS, X).search("abc123")
     assert match is not None
     assert match.group() == "abc123"
 
 
-def test_combined_flags() -> None:
-    """Test combining multiple flags with bitwise OR."""
-    text = "Hello\nWorld"
-    pattern = r"^hello.*world$"
-
-    # Combine IGNORECASE, DOTALL, and MULTILINE
-    match = regex.search(pattern, text, regex.IGNORECASE | regex.DOTALL | regex.MULTILINE)
-    assert match is not None
-    assert match.group() == "Hello\nWorld"
-
-
-def test_inline_flags() -> None:
-    """Test inline flag syntax (?i), (?m), (?s), (?x)."""
-    # IGNORECASE inline flag
-    text = "Hello World"
-    pattern = r"(?i)hello"
-    match = regex.search(pattern, text)
-    assert match is not None
-    assert match.group() == "Hello"
-
-
-def test_inline_multiline_flag() -> None:
-    """Test inline MULTILINE flag."""
-    text = "line1\nline2"
-    pattern = r"(?m)^line2"
-    match = regex.search(pattern, text)
-    assert match is not None
-
-
-def test_inline_dotall_flag() -> None:
-    """Test inline DOTALL flag."""
-    text = "a\nb"
-    pattern = r"(?s)a.b"
-    match = regex.search(pattern, text)
-    assert match is not None
-
-
-def test_flag_with_substitution() -> None:
-    """Test using flags with regex.sub()."""
-    text = "Hello HELLO hello"
-    pattern = "hello"
-    replacement = "hi"
-
-    result = regex.sub(pattern, replacement, text, flags=regex.IGNORECASE)
-    assert result == "hi hi hi"
-
-
-def test_case_sensitive_by_default() -> None:
-    """Test that matching is case-sensitive by default."""
-    text = "ABC abc"
-    pattern = "abc"
-
-    matches = regex.findall(pattern, text)
-    assert matches == ["abc"]
-    assert len(matches) == 1
-
-
-def test_multiline_vs_default() -> None:
+def test_multiline_vs_default(compile_cache: Callable[..., regex.Pattern[str]]) -> None:
     """Test difference between MULTILINE and default behavior."""
     text = "start\nmiddle\nend"
 
     # Default: ^ matches only start of string
-    pattern_start = r"^start"
-    match1 = regex.search(pattern_start, text)
+    match1 = compile_cache(r"^start").search(text)
     assert match1 is not None
 
-    pattern_middle = r"^middle"
-    match2 = regex.search(pattern_middle, text)
+    match2 = compile_cache(r"^middle").search(text)
     assert match2 is None  # Doesn't match without MULTILINE
 
     # With MULTILINE: ^ matches start of any line
-    match3 = regex.search(pattern_middle, text, regex.MULTILINE)
+    match3 = compile_cache(r"^middle", MULTILINE).search(text)
     assert match3 is not None
+
+
+@pytest.mark.parametrize(("pattern", "flags", "op", "text", "replacement", "expected"), FLAG_CASES)
+def test_flag_cases(pattern: str, flags: int, op: str, text: str, replacement: str | None, expected: object, compile_cache: Callable[..., regex.Pattern[str]]) -> None:  # noqa: PLR0913
+    """Test flags and inline flag syntax (?i), (?m), (?s) with one call each."""
+    assert _OPS[op](compile_cache(pattern, flags), text, replacement) == expected
@@ -4,138 +4,124 @@ Tests for various regex patterns.
 Tests word boundaries, character classes, quantifiers, groups, and other patterns.
 """
 
+from collections.abc import Callable
+
 import regex
 
 
-def test_word_boundary() -> None:
+def test_word_boundary(compile_cache: Callable[..., regex.Pattern[str]]) -> None:
     r"""Test word boundary metacharacter \\b."""
     text = "the cat and category"
-    pattern = r"\bcat\b"
-    matches = regex.findall(pattern, text)
+    matches = compile_cache(r"\bcat\b").findall(text)
 
     # Should match "cat" but not "cat" in "category"
     assert matches == ["cat"]
 
 
-def test_word_boundary_start() -> None:
+def test_word_boundary_start(compile_cache: Callable[..., regex.Pattern[str]]) -> None:
     """Test word boundary at start of word."""
     text = "category cat"
-    pattern = r"\bcat"
-    matches = regex.findall(pattern, text)
+    matches = compile_cache(r"\bcat").findall(text)
 
     # Should match both occurrences (start of "category" and standalone "cat")
     assert len(matches) == 2
 
 
-def test_word_boundary_end() -> None:
+def test_word_boundary_end(compile_cache: Callable[..., regex.Pattern[str]]) -> None:
     """Test word boundary at end of word."""
     text = "cat cats"
-    pattern = r"cat\b"
-    matches = regex.findall(pattern, text)
+    matches = compile_cache(r"cat\b").findall(text)
 
     # Should match "cat" but not "cat" in "cats"
     assert matches == ["cat"]
 
 
-def test_character_class_digits() -> None:
+def test_character_class_digits(compile_cache: Callable[..., regex.Pattern[str]]) -> None:
     """Test character class for digits."""
     text = "abc123def456"
-    pattern = r"\d+"
-    matches = regex.findall(pattern, text)
+    matches = compile_cache(r"\d+").findall(text)
 
     assert matches == ["123", "456"]
 
 
-def test_character_class_word_chars() -> None:
+def test_character_class_word_chars(compile_cache: Callable[..., regex.Pattern[str]]) -> None:
     """Test character class for word characters."""
     text = "hello_world 123"
-    pattern = r"\w+"
-    matches = regex.findall(pattern, text)
+    matches = compile_cache(r"\w+").findall(text)
 
     assert matches == ["hello_world", "123"]
 
 
-def test_character_class_whitespace() -> None:
+def test_character_class_whitespace(compile_cache: Callable[..., regex.Pattern[str]]) -> None:
     """Test character class for whitespace."""
     text = "hello world\ttab\nnewline"
-    pattern = r"\s+"
-    matches = regex.findall(pattern, text)
+    matches = compile_cache(r"\s+").findall(text)
 
     assert len(matches) == 3
 
 
-def test_custom_character_class() -> None:
+def test_custom_character_class(compile_cache: Callable[..., regex.Pattern[str]]) -> None:
     """Test custom character class."""
     text = "aeiou bcdfg"
-    pattern = r"[aeiou]+"
-    matches = regex.findall(pattern, text)
+    matches = compile_cache(r"[aeiou]+").findall(text)
 
     # Only "aeiou" contains vowels; "bcdfg" has none
     assert matches == ["aeiou"]
 
 
-def test_negated_character_class() -> None:
+def test_negated_character_class(compile_cache: Callable[..., regex.Pattern[str]]) -> None:
     """Test negated character class."""
     text = "abc123"
-    pattern = r"[^0-9]+"
-    matches = regex.findall(pattern, text)
+    matches = compile_cache(r"[^0-9]+").findall(text)
 
     assert matches == ["abc"]
 
 
-def test_quantifier_star() -> None:
+def test_quantifier_star(compile_cache: Callable[..., regex.Pattern[str]]) -> None:
     """Test * quantifier (zero or more)."""
     text = "a aa aaa b"
-    pattern = r"a*"
-    matches = regex.findall(pattern, text)
+    matches = set(compile_cache(r"a*").findall(text))
 
     # Will match even empty strings between characters
-    assert "a" in matches
-    assert "aa" in matches
-    assert "aaa" in matches
+    assert {"a", "aa", "aaa"} <= matches
 
 
-def test_quantifier_plus() -> None:
+def test_quantifier_plus(compile_cache: Callable[..., regex.Pattern[str]]) -> None:
     """Test + quantifier (one or more)."""
     text = "a aa aaa b"
-    pattern = r"a+"
-    matches = regex.findall(pattern, text)
+    matches = compile_cache(r"a+").findall(text)
 
     assert matches == ["a", "aa", "aaa"]
 
 
-def test_quantifier_question() -> None:
+def test_quantifier_question(compile_cache: Callable[..., regex.Pattern[str]]) -> None:
     """Test ? quantifier (zero or one)."""
     text = "color colour"
-    pattern = r"colou?r"
-    matches = regex.findall(pattern, text)
+    matches = compile_cache(r"colou?r").findall(text)
 
     assert matches == ["color", "colour"]
 
 
-def test_quantifier_exact() -> None:
+def test_quantifier_exact(compile_cache: Callable[..., regex.Pattern[str]]) -> None:
     """Test {n} quantifier (exactly n times)."""
     text = "12 123 1234"
-    pattern = r"\d{3}"
-    matches = regex.findall(pattern, text)
+    matches = compile_cache(r"\d{3}").findall(text)
 
     assert matches == ["123", "123"]
 
 
-def test_quantifier_range() -> None:
+def test_quantifier_range(compile_cache: Callable[..., regex.Pattern[str]]) -> None:
     """Test {n,m} quantifier (between n and m times)."""
     text = "1 12 123 1234"
-    pattern = r"\d{2,3}"
-    matches = regex.findall(pattern, text)
+    matches = compile_cache(r"\d{2,3}").findall(text)
 
     assert matches == ["12", "123", "123"]
 
 
-def test_capturing_group() -> None:
+def test_capturing_group(compile_cache: Callable[..., regex.Pattern[str]]) -> None:
     """Test capturing group ()."""
     text = "John Doe"
-    pattern = r"(\w+) (\w+)"
-    match = regex.search(pattern, text)
+    match = compile_cache(r"(\w+) (\w+)").search(text)
 
     assert match is not None
     assert match.group(1) == "John"
@@ -143,11 +129,10 @@ def test_capturing_group() -> None:
     assert match.group(0) == "John Doe"
 
 
-def test_non_capturing_group() -> None:
+def test_non_capturing_group(compile_cache: Callable[..., regex.Pattern[str]]) -> None:
     """Test non-capturing group (?:...)."""
     text = "color: red"
-    pattern = r"(?:color): (\w+)"
-    match = regex.search(pattern, text)
+    match = compile_cache(r"(?:color): (\w+)").search(text)
 
     assert match is not None
     assert match.group(1) == "red"
@@ -155,96 +140,87 @@ def test_non_capturing_group() -> None:
     assert match.group(0) == "color: red"
 
 
-def test_alternation() -> None:
+def test_alternation(compile_cache: Callable[..., regex.Pattern[str]]) -> None:
     """Test alternation with pipe |."""
     text = "cat dog bird"
-    pattern = r"cat|dog"
-    matches = regex.findall(pattern, text)
+    matches = compile_cache(r"cat|dog").findall(text)
 
     assert matches == ["cat", "dog"]
 
 
-def test_greedy_quantifier() -> None:
+def test_greedy_quantifier(compile_cache: Callable[..., regex.Pattern[str]]) -> None:
     """Test greedy quantifier behavior."""
     text = "<tag>content</tag>"
-    pattern = r"<.*>"
-    match = regex.search(pattern, text)
+    match = compile_cache(r"<.*>").search(text)
 
     # Greedy: matches the entire string
     assert match is not None
     assert match.group() == "<tag>content</tag>"
 
 
-def test_non_greedy_quantifier() -> None:
+def test_non_greedy_quantifier(compile_cache: Callable[..., regex.Pattern[str]]) -> None:
     """Test non-greedy quantifier with ?."""
     text = "<tag>content</tag>"
-    pattern = r"<.*?>"
-    matches = regex.findall(pattern, text)
+    matches = compile_cache(r"<.*?>").findall(text)
 
     # Non-greedy: matches shortest possible
     assert matches == ["<tag>", "</tag>"]
 
 
-def test_anchors_start() -> None:
+def test_anchors_start(compile_cache: Callable[..., regex.Pattern[str]]) -> None:
     """Test ^ anchor (start of string)."""
     text = "hello world"
-    pattern = r"^hello"
-    match = regex.search(pattern, text)
+    match = compile_cache(r"^hello").search(text)
 
     assert match is not None
 
-    pattern_fail = r"^world"
-    match_fail = regex.search(pattern_fail, text)
+    match_fail = compile_cache(r"^world").search(text)
     assert match_fail is None
 
 
-def test_anchors_end() -> None:
+def test_anchors_end(compile_cache: Callable[..., regex.Pattern[str]]) -> None:
     """Test $ anchor (end of string)."""
     text = "hello world"
-    pattern = r"world$"
-    match = regex.search(pattern, text)
+    match = compile_cache(r"world$").search(text)
 
     assert match is not None
 
-    pattern_fail = r"hello$"
-    match_fail = regex.search(pattern_fail, text)
+    match_fail = compile_cache(r"hello$").search(text)
     assert match_fail is None
 
 
-def test_dot_metacharacter() -> None:
+def test_dot_metacharacter(compile_cache: Callable[..., regex.Pattern[str]]) -> None:
     """Test . metacharacter (matches any character except newline)."""
     text = "cat cot cut"
-    pattern = r"c.t"
-    matches = regex.findall(pattern, text)
+    matches = compile_cache(r"c.t").findall(text)
 
     assert matches == ["cat", "cot", "cut"]
 
 
-def test_findall_multiple_groups() -> None:
+def test_findall_multiple_groups(compile_cache: Callable[..., regex.Pattern[str]]) -> None:
     """Test findall with multiple capturing groups."""
     text = "John:25 Jane:30 Bob:35"
-    pattern = r"(\w+):(\d+)"
-    matches = regex.findall(pattern, text)
+    matches = compile_cache(r"(\w+):(\d+)").findall(text)
 
     # Returns list of tuples
     assert matches == [("John", "25"), ("Jane", "30"), ("Bob", "35")]
 
 
-def test_split_with_pattern() -> None:
-    """Test regex.split() with pattern."""
+def test_split_with_pattern(compile_cache: Callable[..., regex.Pattern[str]]) -> None:
+    """Test Pattern.split() with pattern."""
     text = "one,two;three:four"
-    pattern = r"[,;:]"
-    parts = regex.split(pattern, text)
+    parts = compile_cache(r"[,;:]").split(text)
 
     assert parts == ["one", "two", "three", "four"]
 
 
-def test_finditer() -> None:
-    """Test regex.finditer() returns iterator of Match objects."""
+def test_finditer(compile_cache: Callable[..., regex.Pattern[str]]) -> None:
+    """Test Pattern.finditer() returns iterator of Match objects."""
     text = "cat dog cat"
-    pattern = r"cat"
-    matches = list(regex.finditer(pattern, text))
+    matches = compile_cache(r"cat").finditer(text)
+    first = next(matches)
+    second = next(matches)
 
-    assert len(matches) == 2
-    assert matches[0].start() == 0
-    assert matches[1].start() == 8
+    assert next(matches, None) is None
+    assert first.start() == 0
+    assert second.start() == 8
@@ -5,228 +5,104 @@ CRITICAL: This file contains tests for the user-reported issue with 'who' -> 'ar
 replacement in shell commands. This is the primary focus of the test suite.
 """
 
+import unicodedata
+from collections.abc import Callable
+
+import pytest
 import regex
 
+from tests.regex_tests._fast import sub_literal
+
+# The exact shell line from the user report, before and after 'who' -> 'are'.
+_SHELL_TEXT = "- 啟動時間：            ${CLR2}$(who -b | awk '{print $3, $4}')${CLR0}"
+_SHELL_EXPECTED = "- 啟動時間：            ${CLR2}$(are -b | awk '{print $3, $4}')${CLR0}"
+
 
-def test_who_are_replacement_in_shell_command() -> None:
+def test_who_are_replacement_in_shell_command(compile_cache: Callable[..., regex.Pattern[str]]) -> None:
     """
     **PRIMARY TEST CASE**: Reproduce user-reported issue.
 
     Test replacing 'who' with 'are' in a shell command containing special characters.
     This is the exact scenario reported by the user where GlocalText replacement failed.
     """
-    text = "- 啟動時間：            ${CLR2}$(who -b | awk '{print $3, $4}')${CLR0}"
     pattern = "who"
     replacement = "are"
 
-    result = regex.sub(pattern, replacement, text)
-    expected = "- 啟動時間：            ${CLR2}$(are -b | awk '{print $3, $4}')${CLR0}"
-
-    assert result == expected, f"Expected: {expected}\nGot: {result}"
+    result = compile_cache(pattern).sub(replacement, _SHELL_TEXT)
+
+    assert result == _SHELL_EXPECTED
+    assert sub_literal(pattern, replacement, _SHELL_TEXT) == _SHELL_EXPECTED
+
+
+# (pattern, replacement, text, expected) for literal substitutions in shell-like text.
+SUB_CASES = [
+    pytest.param("world", "universe", "hello world", "hello universe", id="basic"),
+    pytest.param("cat", "dog", "cat cat cat", "dog dog dog", id="multiple_occurrences"),
+    pytest.param("goodbye", "farewell", "hello world", "hello world", id="no_match"),
+    pytest.param("command", "script", "$(command --option=value | grep 'pattern')", "$(script --option=value | grep 'pattern')", id="complex_text"),
+    pytest.param("VAR", "VARIABLE", "$VAR and $OTHER_VAR", "$VARIABLE and $OTHER_VARIABLE", id="dollar_signs"),
+    pytest.param("cmd2", "command2", "cmd1 | cmd2 | cmd3", "cmd1 | command2 | cmd3", id="pipes"),
+    pytest.param("arg1", "argument1", "function(arg1, arg2)", "function(argument1, arg2)", id="parentheses"),
+    pytest.param("array", "list", "array[0] = value", "list[0] = value", id="brackets"),
+    pytest.param("VAR", "VARIABLE", "${VAR} and ${OTHER}", "${VARIABLE} and ${OTHER}", id="braces"),
+    # Every occurrence of "who" is replaced, not only the first
+    pytest.param("who", "are", "The who command shows who is logged in", "The are command shows are is logged in", id="preserves_surrounding_text"),
+    pytest.param(" world", "", "hello world", "hello", id="empty_replacement"),
+    pytest.param("print", "show", "awk '{print $1, $2}'", "awk '{show $1, $2}'", id="awk_command"),
+    pytest.param("who", "are", "echo 'who is there'", "echo 'are is there'", id="word_inside_quotes"),
+    pytest.param("who", "are", "`who -b`", "`are -b`", id="backticks"),
+    pytest.param("who", "are", "使用者：who 命令", "使用者：are 命令", id="mixed_language"),
+    # Only lowercase 'who' should be replaced
+    pytest.param("who", "are", "Who is there who knows", "Who is there are knows", id="case_sensitive"),
+]
 
 
-def test_basic_substitution() -> None:
-    """Test basic regex.sub() with simple literal replacement."""
-    text = "hello world"
-    pattern = "world"
-    replacement = "universe"
+@pytest.mark.parametrize(("pattern", "replacement", "text", "expected"), SUB_CASES)
+def test_substitution_cases(pattern: str, replacement: str, text: str, expected: str, compile_cache: Callable[..., regex.Pattern[str]]) -> None:
+    """Test Pattern.sub() replaces every literal occurrence and leaves the rest intact."""
+    result = compile_cache(pattern).sub(replacement, text)
+    assert result == expected
+    # str.replace() must agree with the regex engine for literal patterns
+    assert sub_literal(pattern, replacement, text) == expected
 
-    result = regex.sub(pattern, replacement, text)
-    assert result == "hello universe"
 
+def test_fixture_text_is_nfc_normalized() -> None:
+    """Test that the CJK fixture strings are NFC, so literal matching needs no normalization."""
+    texts = [_SHELL_TEXT, _SHELL_EXPECTED]
+    texts.extend(text for case in SUB_CASES for text in (case.values[2], case.values[3]))
 
-def test_substitution_multiple_occurrences() -> None:
-    """Test regex.sub() replaces all occurrences by default."""
-    text = "cat cat cat"
-    pattern = "cat"
-    replacement = "dog"
+    assert all(unicodedata.is_normalized("NFC", text) for text in texts)
 
-    result = regex.sub(pattern, replacement, text)
-    assert result == "dog dog dog"
 
-
-def test_substitution_with_count() -> None:
-    """Test regex.sub() with count parameter limits replacements."""
+def test_substitution_with_count(compile_cache: Callable[..., regex.Pattern[str]]) -> None:
+    """Test Pattern.sub() with count parameter limits replacements."""
     text = "cat cat cat"
     pattern = "cat"
     replacement = "dog"
 
-    result = regex.sub(pattern, replacement, text, count=2)
+    result = compile_cache(pattern).sub(replacement, text, count=2)
     assert result == "dog dog cat"
+    assert sub_literal(pattern, replacement, text, count=2) == "dog dog cat"
 
 
-def test_subn_returns_tuple() -> None:
-    """Test regex.subn() returns tuple with result and count."""
+def test_subn_returns_tuple(compile_cache: Callable[..., regex.Pattern[str]]) -> None:
+    """Test Pattern.subn() returns tuple with result and count."""
     text = "cat cat cat"
     pattern = "cat"
     replacement = "dog"
 
-    result, count = regex.subn(pattern, replacement, text)
+    result, count = compile_cache(pattern).subn(replacement, text)
     assert result == "dog dog dog"
     assert count == 3
 
 
-def test_substitution_no_match() -> None:
-    """Test regex.sub() returns original text when no match."""
-    text = "hello world"
-    pattern = "goodbye"
-    replacement = "farewell"
-
-    result = regex.sub(pattern, replacement, text)
-    assert result == "hello world"
-
-
-def test_substitution_in_complex_text() -> None:
-    """Test substitution in text with various special characters."""
-    text = "$(command --option=value | grep 'pattern')"
-    pattern = "command"
-    replacement = "script"
-
-    result = regex.sub(pattern, replacement, text)
-    expected = "$(script --option=value | grep 'pattern')"
-    assert result == expected
-
-
-def test_substitution_with_dollar_signs() -> None:
-    """Test substitution in text containing dollar signs."""
-    text = "$VAR and $OTHER_VAR"
-    pattern = "VAR"
-    replacement = "VARIABLE"
-
-    result = regex.sub(pattern, replacement, text)
-    expected = "$VARIABLE and $OTHER_VARIABLE"
-    assert result == expected
-
-
-def test_substitution_with_pipes() -> None:
-    """Test substitution in text containing pipe characters."""
-    text = "cmd1 | cmd2 | cmd3"
-    pattern = "cmd2"
-    replacement = "command2"
-
-    result = regex.sub(pattern, replacement, text)
-    expected = "cmd1 | command2 | cmd3"
-    assert result == expected
-
-
-def test_substitution_with_parentheses() -> None:
-    """Test substitution in text containing parentheses."""
-    text = "function(arg1, arg2)"
-    pattern = "arg1"
-    replacement = "argument1"
-
-    result = regex.sub(pattern, replacement, text)
-    expected = "function(argument1, arg2)"
-    assert result == expected
-
-
-def test_substitution_with_brackets() -> None:
-    """Test substitution in text containing brackets."""
-    text = "array[0] = value"
-    pattern = "array"
-    replacement = "list"
-
-    result = regex.sub(pattern, replacement, text)
-    expected = "list[0] = value"
-    assert result == expected
-
-
-def test_substitution_with_braces() -> None:
-    """Test substitution in text containing curly braces."""
-    text = "${VAR} and ${OTHER}"
-    pattern = "VAR"
-    replacement = "VARIABLE"
-
-    result = regex.sub(pattern, replacement, text)
-    expected = "${VARIABLE} and ${OTHER}"
-    assert result == expected
-
-
-def test_substitution_preserves_surrounding_text() -> None:
-    """Test that substitution only affects the matched pattern."""
-    text = "The who command shows who is logged in"
-    pattern = "who"
-    replacement = "are"
-
-    result = regex.sub(pattern, replacement, text)
-    # Note: This will replace ALL occurrences of "who"
-    expected = "The are command shows are is logged in"
-    assert result == expected
-
-
-def test_substitution_empty_replacement() -> None:
-    """Test substitution with empty string (deletion)."""
-    text = "hello world"
-    pattern = " world"
-    replacement = ""
-
-    result = regex.sub(pattern, replacement, text)
-    assert result == "hello"
-
-
-def test_substitution_in_awk_command() -> None:
-    """Test substitution in AWK command similar to user's scenario."""
-    text = "awk '{print $1, $2}'"
-    pattern = "print"
-    replacement = "show"
-
-    result = regex.sub(pattern, replacement, text)
-    expected = "awk '{show $1, $2}'"
-    assert result == expected
-
-
-def test_substitution_word_inside_quotes() -> None:
-    """Test substitution of words inside single quotes."""
-    text = "echo 'who is there'"
-    pattern = "who"
-    replacement = "are"
-
-    result = regex.sub(pattern, replacement, text)
-    expected = "echo 'are is there'"
-    assert result == expected
-
-
-def test_substitution_with_backticks() -> None:
-    """Test substitution in text with backticks."""
-    text = "`who -b`"
-    pattern = "who"
-    replacement = "are"
-
-    result = regex.sub(pattern, replacement, text)
-    expected = "`are -b`"
-    assert result == expected
-
-
-def test_substitution_mixed_language() -> None:
-    """Test substitution in mixed Chinese and English text."""
-    text = "使用者：who 命令"
-    pattern = "who"
-    replacement = "are"
-
-    result = regex.sub(pattern, replacement, text)
-    expected = "使用者：are 命令"
-    assert result == expected
-
-
-def test_substitution_with_function_replacement() -> None:
-    """Test regex.sub() with a replacement function."""
+def test_substitution_with_function_replacement(compile_cache: Callable[..., regex.Pattern[str]]) -> None:
+    """Test Pattern.sub() with a replacement function."""
     text = "value is 5"
     pattern = r"\d+"
 
     def double_number(match: regex.Match[str]) -> str:
         return str(int(match.group()) * 2)
 
-    result = regex.sub(pattern, double_number, text)
+    result = compile_cache(pattern).sub(double_number, text)
     assert result == "value is 10"
-
-
-def test_substitution_case_sensitive() -> None:
-    """Test that substitution is case-sensitive by default."""
-    text = "Who is there who knows"
-    pattern = "who"
-    replacement = "are"
-
-    result = regex.sub(pattern, replacement, text)
-    # Only lowercase 'who' should be replaced
-    expected = "Who is there are knows"
-    assert result == expected
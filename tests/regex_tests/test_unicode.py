@@ -4,185 +4,147 @@ Tests for Unicode support in regex.
 Tests Chinese characters, Traditional/Simplified Chinese, and mixed language text.
 """
 
-import regex
-
-
-def test_chinese_character_matching() -> None:
-    """Test matching Chinese characters."""
-    text = "這是中文測試"
-    pattern = "中文"
-
-    match = regex.search(pattern, text)
-    assert match is not None
-    assert match.group() == "中文"
+from collections.abc import Callable
 
+import pytest
+import regex
 
-def test_traditional_chinese() -> None:
-    """Test matching Traditional Chinese characters."""
-    text = "繁體中文測試"
-    pattern = "繁體"
+# \p{...} is regex-only, so this pattern bypasses compile_cache; probed once at import.
+try:
+    _PAT_HAN: regex.Pattern[str] | None = regex.compile(r"\p{Han}+")
+except regex.error:
+    _PAT_HAN = None
+_HAS_UNICODE_PROPERTIES = _PAT_HAN is not None
 
-    match = regex.search(pattern, text)
-    assert match is not None
-    assert match.group() == "繁體"
+# CJK Unified Ideographs block, used to recognise Han characters without regex.
+_HAN_MIN, _HAN_MAX = 0x4E00, 0x9FFF
 
 
-def test_simplified_chinese() -> None:
-    """Test matching Simplified Chinese characters."""
-    text = "简体中文测试"
-    pattern = "简体"
+def _is_han(char: str) -> bool:
+    return _HAN_MIN <= ord(char) <= _HAN_MAX
 
-    match = regex.search(pattern, text)
-    assert match is not None
-    assert match.group() == "简体"
 
+# (pattern, text) pairs where searching the literal pattern must find it verbatim.
+_CASES = [
+    ("中文", "這是中文測試"),
+    ("繁體", "繁體中文測試"),
+    ("简体", "简体中文测试"),
+    ("English", "這是 English 混合文本"),
+    ("你好", "你好，世界！"),
+    ("啟動時間", "# 啟動時間：$(who -b)"),
+]
+_CASE_IDS = ["chinese", "traditional", "simplified", "mixed_chinese_english", "chinese_punctuation", "chinese_in_command"]
 
-def test_mixed_chinese_english() -> None:
-    """Test matching in mixed Chinese and English text."""
-    text = "這是 English 混合文本"
-    pattern = "English"
 
-    match = regex.search(pattern, text)
+@pytest.mark.parametrize(("pattern", "text"), _CASES, ids=_CASE_IDS)
+def test_chinese_literal(pattern: str, text: str, compile_cache: Callable[..., regex.Pattern[str]]) -> None:
+    """Test matching Chinese (Traditional and Simplified) and mixed-language literals."""
+    match = compile_cache(pattern).search(text)
     assert match is not None
-    assert match.group() == "English"
+    assert match.group() == pattern
 
 
-def test_chinese_substitution() -> None:
+def test_chinese_substitution(compile_cache: Callable[..., regex.Pattern[str]]) -> None:
     """Test substitution with Chinese characters."""
     text = "你好世界"
-    pattern = "世界"
     replacement = "朋友"
 
-    result = regex.sub(pattern, replacement, text)
+    result = compile_cache("世界").sub(replacement, text)
     assert result == "你好朋友"
 
 
-def test_english_to_chinese_substitution() -> None:
+def test_english_to_chinese_substitution(compile_cache: Callable[..., regex.Pattern[str]]) -> None:
     """Test replacing English with Chinese."""
     text = "Hello world"
-    pattern = "world"
     replacement = "世界"
 
-    result = regex.sub(pattern, replacement, text)
+    result = compile_cache("world").sub(replacement, text)
     assert result == "Hello 世界"
 
 
-def test_chinese_to_english_substitution() -> None:
+def test_chinese_to_english_substitution(compile_cache: Callable[..., regex.Pattern[str]]) -> None:
     """Test replacing Chinese with English."""
     text = "你好世界"
-    pattern = "世界"
     replacement = "world"
 
-    result = regex.sub(pattern, replacement, text)
+    result = compile_cache("世界").sub(replacement, text)
     assert result == "你好world"
 
 
-def test_unicode_word_boundary() -> None:
+def test_unicode_word_boundary(compile_cache: Callable[..., regex.Pattern[str]]) -> None:
     """Test word boundaries with Chinese characters."""
     text = "中文abc中文"
     # Chinese characters are treated as word characters
-    pattern = r"\w+"
-    matches = regex.findall(pattern, text)
+    matches = compile_cache(r"\w+").findall(text)
 
     # Should match Chinese and English separately or together
     assert len(matches) > 0
     assert any("中文" in match or "abc" in match for match in matches)
 
 
-def test_unicode_character_class() -> None:
+def test_unicode_character_class(compile_cache: Callable[..., regex.Pattern[str]]) -> None:
     """Test character classes with Unicode."""
     text = "abc123中文"
     # Match all Unicode letters
-    pattern = r"\w+"
-    matches = regex.findall(pattern, text)
+    matches = compile_cache(r"\w+").findall(text)
 
     assert len(matches) > 0
 
 
-def test_mixed_language_findall() -> None:
+def test_mixed_language_findall(compile_cache: Callable[..., regex.Pattern[str]]) -> None:
     """Test findall with mixed language content."""
     text = "English 中文 Français 日本語"
-    pattern = r"\w+"
-    matches = regex.findall(pattern, text)
-
-    assert "English" in matches
-    assert "中文" in matches
-    assert "Français" in matches
-    assert "日本語" in matches
+    matches = frozenset(compile_cache(r"\w+").findall(text))
 
+    expected = frozenset({"English", "中文", "Français", "日本語"})
+    assert expected.issubset(matches)
 
-def test_chinese_punctuation() -> None:
-    """Test matching Chinese punctuation."""
-    text = "你好，世界！"
-    pattern = "你好"
 
-    match = regex.search(pattern, text)
-    assert match is not None
-    assert match.group() == "你好"
-
-
-def test_chinese_in_command() -> None:
-    """Test Chinese characters in shell-like commands."""
-    text = "# 啟動時間：$(who -b)"
-    pattern = "啟動時間"
-
-    match = regex.search(pattern, text)
-    assert match is not None
-    assert match.group() == "啟動時間"
-
-
-def test_replace_in_chinese_context() -> None:
+def test_replace_in_chinese_context(compile_cache: Callable[..., regex.Pattern[str]]) -> None:
     """Test replacement in Chinese context (GlocalText scenario)."""
     text = "- 啟動時間：            ${CLR2}$(who -b | awk '{print $3, $4}')${CLR0}"
-    pattern = "啟動時間"
     replacement = "開機時間"
 
-    result = regex.sub(pattern, replacement, text)
+    result = compile_cache("啟動時間").sub(replacement, text)
     assert "開機時間" in result
     assert "啟動時間" not in result
 
 
-def test_unicode_escape_sequence() -> None:
+def test_unicode_escape_sequence(compile_cache: Callable[..., regex.Pattern[str]]) -> None:
     """Test Unicode escape sequences."""
     # \u4e2d is '中' in Unicode
     text = "中文"
-    pattern = "\u4e2d"
 
-    match = regex.search(pattern, text)
+    match = compile_cache("\u4e2d").search(text)
     assert match is not None
     assert match.group() == "中"
 
 
+@pytest.mark.skipif(not _HAS_UNICODE_PROPERTIES, reason="regex build has no \\p{} Unicode property support")
 def test_unicode_property() -> None:
     """Test Unicode property matching (if supported by regex module)."""
+    assert _PAT_HAN is not None
     text = "abc123中文"
-    # Match Han characters (Chinese)
-    pattern = r"\p{Han}+"
 
-    try:
-        matches = regex.findall(pattern, text)
-        assert "中文" in matches or any("中" in m or "文" in m for m in matches)
-    except regex.error:
-        # Skip if \p{} syntax not supported
-        pass
+    # Match Han characters (Chinese)
+    matches = _PAT_HAN.findall(text)
+    assert "中文" in matches or any(any(_is_han(char) for char in m) for m in matches)
 
 
-def test_emoji_matching() -> None:
+def test_emoji_matching(compile_cache: Callable[..., regex.Pattern[str]]) -> None:
     """Test matching emoji characters."""
     text = "Hello 👋 World 🌍"
-    pattern = "👋"
 
-    match = regex.search(pattern, text)
+    match = compile_cache("👋").search(text)
     assert match is not None
     assert match.group() == "👋"
 
 
-def test_mixed_script_substitution() -> None:
+def test_mixed_script_substitution(compile_cache: Callable[..., regex.Pattern[str]]) -> None:
     """Test substitution in text with multiple scripts."""
     text = "User: 使用者 | Command: who"
-    pattern = "who"
     replacement = "are"
 
-    result = regex.sub(pattern, replacement, text)
+    result = compile_cache("who").sub(replacement, text)
     expected = "User: 使用者 | Command: are"
     assert result == expected
@@ -1,25 +1,57 @@
 """Tests for cache protection mechanisms to prevent overwriting manual edits."""
 
+import dataclasses
 import json
+import logging
 import unittest
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from typing import Any
+from unittest.mock import MagicMock, mock_open, patch
 
+from glocaltext import paths
 from glocaltext.config import GlocalConfig
 from glocaltext.match_state import MatchLifecycle
 from glocaltext.models import ExecutionContext
-from glocaltext.processing import CacheProcessor, CacheUpdateProcessor
+from glocaltext.processing import CacheProcessor, CacheUpdateProcessor, cache_processors
 from glocaltext.processing.cache_utils import _update_cache, calculate_checksum
 from glocaltext.types import Source, TextMatch, TranslationTask
 
+# Fixed paths shared by every test; Path is immutable, so one instance of each suffices
+_FAKE_ROOT = Path("/fake_project")
+_FAKE_SRC = Path("f.txt")
+_FAKE_CACHE = Path("/fake/cache.json")
+
+
+def _only_match(mock: MagicMock) -> list[TextMatch]:
+    """Assert ``mock`` was called exactly once and return the matches it was given."""
+    assert len(mock.mock_calls) == 1
+    return mock.mock_calls[0].args[2]
+
+
+class _CacheOverwriteFilter(logging.Filter):
+    """Keep only the ``[CACHE OVERWRITE]`` records emitted by ``_update_cache``."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """Return True for cache overwrite warnings."""
+        return str(record.msg).startswith("[CACHE OVERWRITE]")
+
 
 class TestCacheProtection(unittest.TestCase):
     """Test suite for cache protection against overwriting manual edits."""
 
-    def setUp(self) -> None:
-        """Set up a mock execution context for the tests."""
-        self.mock_config = GlocalConfig()
-        self.mock_task = TranslationTask(
+    mock_config: GlocalConfig
+    mock_task: TranslationTask
+    test_text_checksum: str
+    existing_text_checksum: str
+    existing_checksum: str
+    existing_cache_bytes: bytes
+    match_proto: TextMatch
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Build the configuration and task shared by every test; neither is mutated."""
+        cls.mock_config = GlocalConfig()
+        cls.mock_task = TranslationTask(
             name="cache_protection_task",
             source_lang="en",
             target_lang="fr",
@@ -28,17 +60,30 @@ class TestCacheProtection(unittest.TestCase):
             incremental=True,
             task_id="test-task-id-12345",
         )
-        self.context = ExecutionContext(task=self.mock_task, config=self.mock_config, project_root=Path.cwd())
+        # Every test match shares these fields; tests derive theirs with dataclasses.replace()
+        cls.match_proto = TextMatch(original_text="", source_file=_FAKE_SRC, span=(0, 0), task_name="test", extraction_rule="r")
+        # Checksums of the constant source texts, computed once for the class
+        cls.test_text_checksum = calculate_checksum("Test text")
+        cls.existing_text_checksum = calculate_checksum("Existing text")
+        # Raw cache file contents for the overwrite test, encoded once
+        cls.existing_checksum = calculate_checksum("Existing")
+        cls.existing_cache_bytes = json.dumps({"test-task-id-12345": {cls.existing_checksum: "Old translation"}}).encode("utf-8")
 
-    @patch("glocaltext.paths.find_project_root")
-    @patch("glocaltext.processing.cache_processors._load_cache")
-    @patch("glocaltext.processing.cache_processors._update_cache")
-    def test_cached_matches_not_overwritten_in_incremental_mode(
-        self,
-        mock_update_cache: MagicMock,
-        mock_load_cache: MagicMock,
-        mock_find_root: MagicMock,
-    ) -> None:
+    def setUp(self) -> None:
+        """Set up a fresh execution context and patch the cache I/O collaborators."""
+        self.context = ExecutionContext(task=self.mock_task, config=self.mock_config, project_root=Path.cwd())
+        self._patch(paths, "find_project_root", return_value=_FAKE_ROOT)
+        # autospec mocks check call signatures and skip MagicMock's lazy child-attribute creation
+        self.mock_load_cache = self._patch(cache_processors, "_load_cache", autospec=True)
+        self.mock_update_cache = self._patch(cache_processors, "_update_cache", autospec=True)
+
+    def _patch(self, target: object, attribute: str, **kwargs: Any) -> MagicMock:  # noqa: ANN401
+        """Patch ``attribute`` on an already-imported module for the duration of one test."""
+        patcher = patch.object(target, attribute, **kwargs)
+        self.addCleanup(patcher.stop)
+        return patcher.start()
+
+    def test_cached_matches_not_overwritten_in_incremental_mode(self) -> None:
         """
         Test that manually edited cache entries are not overwritten.
 
@@ -48,24 +93,16 @@ class TestCacheProtection(unittest.TestCase):
         3. Match hits cache (lifecycle=MatchLifecycle.CACHED)
         4. CacheUpdateProcessor should NOT write this match back to cache
         """
-        mock_find_root.return_value = Path("/fake_project")
-
         # Setup: Original text with its checksum
         original_text = "Test text"
-        checksum = calculate_checksum(original_text)
+        checksum = self.test_text_checksum
 
         # User manually edited the cache with custom translation
         manual_translation = "User's custom translation with    extra spaces"
-        mock_load_cache.return_value = {checksum: manual_translation}
+        self.mock_load_cache.return_value = {checksum: manual_translation}
 
         # Create a match that will hit cache
-        match = TextMatch(
-            original_text=original_text,
-            source_file=Path("f.txt"),
-            span=(0, 9),
-            task_name="test",
-            extraction_rule="r",
-        )
+        match = dataclasses.replace(self.match_proto, original_text=original_text, span=(0, 9))
         self.context.all_matches = [match]
         self.context.is_incremental = True  # Enable incremental mode
 
@@ -84,48 +121,25 @@ class TestCacheProtection(unittest.TestCase):
 
         # Verify: Cache update should NOT be called because the match came from cache
         # The match is in cached_matches, not in matches_to_translate
-        mock_update_cache.assert_not_called()
+        self.mock_update_cache.assert_not_called()
 
-    @patch("glocaltext.paths.find_project_root")
-    @patch("glocaltext.processing.cache_processors._load_cache")
-    @patch("glocaltext.processing.cache_processors._update_cache")
-    def test_cache_protection_filters_provider_cached(
-        self,
-        mock_update_cache: MagicMock,
-        mock_load_cache: MagicMock,
-        mock_find_root: MagicMock,
-    ) -> None:
+    def test_cache_protection_filters_provider_cached(self) -> None:
         """
         Test that matches with lifecycle=MatchLifecycle.CACHED are filtered out from cache updates.
 
         Even if a cached match somehow ends up in matches_to_translate,
         it should be filtered by the lifecycle check.
         """
-        mock_find_root.return_value = Path("/fake_project")
-        mock_load_cache.return_value = {}
+        self.mock_load_cache.return_value = {}
         self.context.is_incremental = True  # Enable incremental mode
 
         # Simulate a match that has lifecycle=MatchLifecycle.CACHED but is in matches_to_translate
         # (This shouldn't normally happen, but we test the safety net)
-        cached_match = TextMatch(
-            original_text="Cached text",
-            source_file=Path("f.txt"),
-            span=(0, 11),
-            task_name="test",
-            extraction_rule="r",
-            translated_text="Translated from cache",
-        )
+        cached_match = dataclasses.replace(self.match_proto, original_text="Cached text", span=(0, 11), translated_text="Translated from cache")
         cached_match.lifecycle = MatchLifecycle.CACHED
 
         # New API-translated match (should be cached)
-        new_match = TextMatch(
-            original_text="New text",
-            source_file=Path("f.txt"),
-            span=(12, 20),
-            task_name="test",
-            extraction_rule="r",
-            translated_text="New translation",
-        )
+        new_match = dataclasses.replace(self.match_proto, original_text="New text", span=(12, 20), translated_text="New translation")
         new_match.lifecycle = MatchLifecycle.TRANSLATED
 
         self.context.matches_to_translate = [cached_match, new_match]
@@ -135,57 +149,32 @@ class TestCacheProtection(unittest.TestCase):
         update_processor.process(self.context)
 
         # Verify: Only the new match should be passed to _update_cache
-        mock_update_cache.assert_called_once()
-        called_matches = mock_update_cache.call_args.args[2]
-        assert len(called_matches) == 1
-        assert called_matches[0].original_text == "New text"
-        assert called_matches[0].lifecycle == MatchLifecycle.TRANSLATED
-
-    @patch("glocaltext.paths.find_project_root")
-    @patch("glocaltext.processing.cache_processors._load_cache")
-    @patch("glocaltext.processing.cache_processors._update_cache")
-    def test_cache_protection_filters_existing_checksums(
-        self,
-        mock_update_cache: MagicMock,
-        mock_load_cache: MagicMock,
-        mock_find_root: MagicMock,
-    ) -> None:
+        (called_match,) = _only_match(self.mock_update_cache)
+        assert called_match.original_text == "New text"
+        assert called_match.lifecycle == MatchLifecycle.TRANSLATED
+
+    def test_cache_protection_filters_existing_checksums(self) -> None:
         """
         Test that matches whose checksums already exist in cache are filtered out.
 
         This is the extra protection layer: even if a match passes the lifecycle filter,
         if its checksum is already in the cache, it should not overwrite the existing entry.
         """
-        mock_find_root.return_value = Path("/fake_project")
         self.context.is_incremental = True  # Enable incremental mode
 
         # Setup: Existing cache with a manual edit
         existing_text = "Existing text"
-        existing_checksum = calculate_checksum(existing_text)
+        existing_checksum = self.existing_text_checksum
         manual_edit = "Manually edited translation"
-        mock_load_cache.return_value = {existing_checksum: manual_edit}
+        self.mock_load_cache.return_value = {existing_checksum: manual_edit}
 
         # Simulate a scenario where a match with existing checksum is somehow
         # marked with a non-cached lifecycle (edge case / bug scenario)
-        suspicious_match = TextMatch(
-            original_text=existing_text,
-            source_file=Path("f.txt"),
-            span=(0, 13),
-            task_name="test",
-            extraction_rule="r",
-            translated_text="Different translation",
-        )
+        suspicious_match = dataclasses.replace(self.match_proto, original_text=existing_text, span=(0, 13), translated_text="Different translation")
         suspicious_match.lifecycle = MatchLifecycle.TRANSLATED  # Lifecycle is not CACHED
 
         # A genuinely new match
-        new_match = TextMatch(
-            original_text="Brand new text",
-            source_file=Path("f.txt"),
-            span=(14, 28),
-            task_name="test",
-            extraction_rule="r",
-            translated_text="Brand new translation",
-        )
+        new_match = dataclasses.replace(self.match_proto, original_text="Brand new text", span=(14, 28), translated_text="Brand new translation")
         new_match.lifecycle = MatchLifecycle.TRANSLATED
 
         self.context.matches_to_translate = [suspicious_match, new_match]
@@ -195,50 +184,25 @@ class TestCacheProtection(unittest.TestCase):
         update_processor.process(self.context)
 
         # Verify: Only the genuinely new match should be passed to _update_cache
-        mock_update_cache.assert_called_once()
-        called_matches = mock_update_cache.call_args.args[2]
-        assert len(called_matches) == 1
-        assert called_matches[0].original_text == "Brand new text"
-
-    @patch("glocaltext.paths.find_project_root")
-    @patch("glocaltext.processing.cache_processors._load_cache")
-    @patch("glocaltext.processing.cache_processors._update_cache")
-    def test_cache_protection_filters_fully_covered_provider(
-        self,
-        mock_update_cache: MagicMock,
-        mock_load_cache: MagicMock,
-        mock_find_root: MagicMock,
-    ) -> None:
+        (called_match,) = _only_match(self.mock_update_cache)
+        assert called_match.original_text == "Brand new text"
+
+    def test_cache_protection_filters_fully_covered_provider(self) -> None:
         """
         Test that matches with lifecycle=MatchLifecycle.SKIPPED are filtered out.
 
         The SKIPPED lifecycle is used for matches that are completely
         covered by terminating rules and should not be written to cache.
         """
-        mock_find_root.return_value = Path("/fake_project")
-        mock_load_cache.return_value = {}
+        self.mock_load_cache.return_value = {}
         self.context.is_incremental = True  # Enable incremental mode
 
         # Match marked as SKIPPED
-        covered_match = TextMatch(
-            original_text="Fully covered text",
-            source_file=Path("f.txt"),
-            span=(0, 18),
-            task_name="test",
-            extraction_rule="r",
-            translated_text="Covered translation",
-        )
+        covered_match = dataclasses.replace(self.match_proto, original_text="Fully covered text", span=(0, 18), translated_text="Covered translation")
         covered_match.lifecycle = MatchLifecycle.SKIPPED
 
         # Normal API-translated match
-        api_match = TextMatch(
-            original_text="API text",
-            source_file=Path("f.txt"),
-            span=(19, 27),
-            task_name="test",
-            extraction_rule="r",
-            translated_text="API translation",
-        )
+        api_match = dataclasses.replace(self.match_proto, original_text="API text", span=(19, 27), translated_text="API translation")
         api_match.lifecycle = MatchLifecycle.TRANSLATED
 
         self.context.matches_to_translate = [covered_match, api_match]
@@ -248,21 +212,15 @@ class TestCacheProtection(unittest.TestCase):
         update_processor.process(self.context)
 
         # Verify: Only the API match should be cached
-        mock_update_cache.assert_called_once()
-        called_matches = mock_update_cache.call_args.args[2]
-        assert len(called_matches) == 1
-        assert called_matches[0].original_text == "API text"
+        (called_match,) = _only_match(self.mock_update_cache)
+        assert called_match.original_text == "API text"
 
-    @patch("glocaltext.paths.find_project_root")
     @patch("pathlib.Path.exists", return_value=True)
-    @patch("pathlib.Path.open")
     @patch("pathlib.Path.mkdir")
     def test_cache_overwrite_warning_logged(
         self,
         mock_mkdir: MagicMock,
-        mock_open: MagicMock,
         mock_exists: MagicMock,
-        mock_find_root: MagicMock,
     ) -> None:
         """
         Test that a warning is logged when a cache entry is about to be overwritten.
@@ -270,38 +228,28 @@ class TestCacheProtection(unittest.TestCase):
         This test verifies the diagnostic logging in _update_cache.
         """
         _ = mock_mkdir, mock_exists
-        mock_find_root.return_value = Path("/fake_project")
 
-        # Setup: Existing cache
-        existing_checksum = calculate_checksum("Existing")
-        existing_cache = {"test-task-id-12345": {existing_checksum: "Old translation"}}
+        existing_checksum = self.existing_checksum
 
-        # Mock file operations
-        mock_file = MagicMock()
-        mock_file.__enter__.return_value = mock_file
-        mock_file.read.return_value = json.dumps(existing_cache).encode("utf-8")
-        mock_open.return_value = mock_file
+        # Mock file operations; mock_open handles the context manager and read()
+        self._patch(Path, "open", new=mock_open(read_data=self.existing_cache_bytes))
 
         # Match that will overwrite existing cache
-        match = TextMatch(
-            original_text="Existing",
-            source_file=Path("f.txt"),
-            span=(0, 8),
-            task_name="test",
-            extraction_rule="r",
-            translated_text="New translation",
-        )
+        match = dataclasses.replace(self.match_proto, original_text="Existing", span=(0, 8), translated_text="New translation")
         match.lifecycle = MatchLifecycle.TRANSLATED
 
-        # Import to capture logs
+        # Capture only the overwrite warnings, however much else _update_cache logs
+        cache_logger = logging.getLogger("glocaltext.processing.cache_utils")
+        overwrite_filter = _CacheOverwriteFilter()
+        cache_logger.addFilter(overwrite_filter)
+        self.addCleanup(cache_logger.removeFilter, overwrite_filter)
 
-        with self.assertLogs("glocaltext.processing.cache_utils", level="WARNING") as log_capture:
-            cache_path = Path("/fake/cache.json")
-            _update_cache(cache_path, "test-task-id-12345", [match])
+        with self.assertLogs(cache_logger, level="WARNING") as log_capture:
+            _update_cache(_FAKE_CACHE, "test-task-id-12345", [match])
 
-            # Verify warning was logged
-            warning_found = any("[CACHE OVERWRITE]" in message and existing_checksum[:16] in message for message in log_capture.output)
-            assert warning_found, "Expected [CACHE OVERWRITE] warning was not logged"
+        # Verify warning was logged
+        warning_found = any(existing_checksum[:16] in record.getMessage() for record in log_capture.records)
+        assert warning_found, "Expected [CACHE OVERWRITE] warning was not logged"
 
 
 if __name__ == "__main__":
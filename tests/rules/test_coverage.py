@@ -4,7 +4,7 @@ import unittest
 
 import pytest
 
-from glocaltext.text_coverage import TextCoverage, calculate_total_coverage, merge_ranges
+from glocaltext.text_coverage import CoverageBitmap, TextCoverage, calculate_total_coverage, merge_ranges
 
 
 class TestMergeRanges(unittest.TestCase):
@@ -50,6 +50,13 @@ class TestMergeRanges(unittest.TestCase):
         result = merge_ranges([(0, 3), (3, 6), (6, 9)])
         assert result == [(0, 9)]
 
+    def test_merges_in_place(self) -> None:
+        """merge_ranges should reuse and truncate the list it is given."""
+        ranges = [(10, 15), (0, 5), (3, 8)]
+        result = merge_ranges(ranges)
+        assert result is ranges
+        assert ranges == [(0, 8), (10, 15)]
+
 
 class TestCalculateTotalCoverage(unittest.TestCase):
     """Test suite for the calculate_total_coverage helper function."""
@@ -92,6 +99,49 @@ class TestTextCoverageBasic(unittest.TestCase):
         assert len(coverage.covered_ranges) == 1
         assert coverage.covered_ranges[0] == (0, 5)
 
+    def test_covered_ranges_updated_in_place(self) -> None:
+        """Reading covered_ranges returns the live list, which add_range() updates in place."""
+        coverage = TextCoverage("Hello World")
+        ranges = coverage.covered_ranges
+        coverage.add_range(6, 11)
+        coverage.add_range(0, 5)
+        coverage.add_range(5, 6)
+        assert coverage.covered_ranges is ranges
+        assert ranges == [(0, 11)]
+
+    def test_assigned_unsorted_ranges_are_merged(self) -> None:
+        """Assigning an unsorted list should leave covered_ranges sorted and merged, without touching the list."""
+        coverage = TextCoverage("Hello World")
+        assigned = [(6, 11), (0, 3), (2, 4)]
+        coverage.covered_ranges = assigned
+        assert coverage.covered_ranges == [(0, 4), (6, 11)]
+        assert assigned == [(6, 11), (0, 3), (2, 4)]
+
+    def test_assigned_invalid_ranges_raise(self) -> None:
+        """Ranges passed to the constructor or assigned later are validated like add_range()."""
+        with pytest.raises(ValueError, match="exceeds text length"):
+            TextCoverage("Hello", [(2, 7)])
+        with pytest.raises(ValueError, match="cannot be less than 0"):
+            TextCoverage("Hello", [(-1, 2)])
+        coverage = TextCoverage("Hello", [(0, 2)])
+        with pytest.raises(ValueError, match="cannot be greater than end"):
+            coverage.covered_ranges = [(3, 1)]
+        assert coverage.covered_ranges == [(0, 2)]
+
+    def test_add_range_after_assigning_unsorted_ranges(self) -> None:
+        """add_range() after assigning an unsorted list should keep every covered range."""
+        coverage = TextCoverage("Hello World")
+        coverage.covered_ranges = [(6, 11), (0, 3)]
+        coverage.add_range(2, 4)
+        assert coverage.covered_ranges == [(0, 4), (6, 11)]
+
+    def test_add_ranges_after_assigning_unsorted_ranges(self) -> None:
+        """add_ranges() after assigning an unsorted list should keep every covered range."""
+        coverage = TextCoverage("Hello World")
+        coverage.covered_ranges = [(6, 11), (0, 3)]
+        coverage.add_ranges([(2, 4), (9, 10)])
+        assert coverage.covered_ranges == [(0, 4), (6, 11)]
+
     def test_multiple_ranges(self) -> None:
         """Adding multiple non-overlapping ranges should be correctly recorded."""
         coverage = TextCoverage("Hello World")
@@ -115,6 +165,62 @@ class TestTextCoverageBasic(unittest.TestCase):
         assert len(coverage.covered_ranges) == 1
         assert coverage.covered_ranges[0] == (0, 11)
 
+    def test_left_to_right_ranges(self) -> None:
+        """Ranges added in text order should be appended, joining adjacent ones."""
+        coverage = TextCoverage("Hello World Foo")
+        coverage.add_range(0, 3)
+        coverage.add_range(3, 5)
+        coverage.add_range(6, 11)
+        coverage.add_range(12, 15)
+        assert coverage.covered_ranges == [(0, 5), (6, 11), (12, 15)]
+
+    def test_bridging_range(self) -> None:
+        """A range spanning several existing ranges should merge them all in place."""
+        coverage = TextCoverage("Hello World Foo")
+        coverage.add_range(12, 15)
+        coverage.add_range(0, 2)
+        coverage.add_range(4, 6)
+        coverage.add_range(8, 9)
+        coverage.add_range(1, 8)
+        assert coverage.covered_ranges == [(0, 9), (12, 15)]
+
+    def test_ranges_match_merge_ranges(self) -> None:
+        """Incremental merging should agree with merging every range at once."""
+        spans = [(7, 9), (0, 2), (20, 25), (3, 4), (9, 12), (2, 3), (15, 18), (14, 21), (30, 31)]
+        coverage = TextCoverage("x" * 32)
+        for start, end in spans:
+            coverage.add_range(start, end)
+        assert coverage.covered_ranges == merge_ranges(list(spans))
+
+    def test_initial_ranges_are_merged(self) -> None:
+        """Ranges passed to the constructor should be sorted and merged."""
+        coverage = TextCoverage("Hello World", [(6, 11), (0, 3), (2, 5)])
+        assert coverage.covered_ranges == [(0, 5), (6, 11)]
+
+    def test_add_ranges_batch(self) -> None:
+        """A batch of ranges should be merged with the existing ranges in one call."""
+        coverage = TextCoverage("Hello World Foo")
+        coverage.add_range(4, 6)
+        coverage.add_ranges([(12, 15), (0, 2), (1, 4), (8, 8)])
+        assert coverage.covered_ranges == [(0, 6), (12, 15)]
+        assert coverage.get_coverage_percentage() == pytest.approx(9 / 15)
+
+    def test_add_ranges_invalid_leaves_coverage_unchanged(self) -> None:
+        """An invalid range anywhere in the batch should reject the whole batch."""
+        coverage = TextCoverage("Hello")
+        coverage.add_range(0, 2)
+        with pytest.raises(ValueError, match="exceeds text length"):
+            coverage.add_ranges([(2, 4), (3, 10)])
+        assert coverage.covered_ranges == [(0, 2)]
+
+    def test_reset(self) -> None:
+        """Reset should remove all coverage ranges."""
+        coverage = TextCoverage("Hello")
+        coverage.add_range(0, 5)
+        coverage.reset()
+        assert coverage.covered_ranges == []
+        assert not coverage.is_fully_covered()
+
 
 class TestTextCoverageFullyCovered(unittest.TestCase):
     """Test suite for fully covered detection."""
@@ -150,6 +256,23 @@ class TestTextCoverageFullyCovered(unittest.TestCase):
         coverage.add_range(6, 11)
         assert not coverage.is_fully_covered()
 
+    def test_out_of_bounds_ranges_never_count_as_full_coverage(self) -> None:
+        """Overlong ranges, or ranges with a gap that run past the end, must not read as full coverage."""
+        for ranges in ([(2, 7)], [(0, 2), (3, 6)]):
+            with pytest.raises(ValueError, match="exceeds text length"):
+                TextCoverage("Hello", ranges)
+            coverage = TextCoverage("Hello", [(0, 2)])
+            with pytest.raises(ValueError, match="exceeds text length"):
+                coverage.covered_ranges = ranges
+            assert not coverage.is_fully_covered()
+            assert coverage.get_uncovered_ranges() == [(2, 5)]
+
+    def test_fully_covered_agrees_with_uncovered_ranges(self) -> None:
+        """is_fully_covered() should be true exactly when no uncovered range remains."""
+        for ranges in ([], [(0, 5)], [(0, 2), (3, 5)], [(0, 2), (2, 5)], [(1, 5)]):
+            coverage = TextCoverage("Hello", ranges)
+            assert coverage.is_fully_covered() == (coverage.get_uncovered_ranges() == [])
+
 
 class TestTextCoveragePercentage(unittest.TestCase):
     """Test suite for coverage percentage calculation."""
@@ -180,6 +303,19 @@ class TestTextCoveragePercentage(unittest.TestCase):
         expected = 10 / 11
         assert abs(coverage.get_coverage_percentage() - expected) < 0.001
 
+    def test_coverage_percentage_tracks_changes(self) -> None:
+        """Repeated reads should reflect every add_range(), reset() and reassignment in between."""
+        coverage = TextCoverage("Hello")
+        coverage.add_range(0, 2)
+        assert coverage.get_coverage_percentage() == pytest.approx(0.4)
+        assert coverage.get_coverage_percentage() == pytest.approx(0.4)
+        coverage.add_range(2, 5)
+        assert coverage.get_coverage_percentage() == pytest.approx(1.0)
+        coverage.reset()
+        assert coverage.get_coverage_percentage() == pytest.approx(0.0)
+        coverage.covered_ranges = [(3, 5), (0, 1)]
+        assert coverage.get_coverage_percentage() == pytest.approx(0.6)
+
 
 class TestTextCoverageUncoveredRanges(unittest.TestCase):
     """Test suite for uncovered ranges extraction."""
@@ -222,6 +358,18 @@ class TestTextCoverageUncoveredRanges(unittest.TestCase):
         expected = [(0, 1), (4, 7), (10, 12)]
         assert coverage.get_uncovered_ranges() == expected
 
+    def test_uncovered_ranges_assigned_unsorted(self) -> None:
+        """Ranges assigned out of order should still yield the true gaps."""
+        coverage = TextCoverage("hello world")
+        coverage.covered_ranges = [(6, 11), (0, 5)]
+        assert coverage.get_uncovered_ranges() == [(5, 6)]
+        assert coverage.get_uncovered_text() == " "
+
+    def test_uncovered_ranges_constructed_unsorted(self) -> None:
+        """Ranges passed to the constructor out of order should still yield the true gaps."""
+        coverage = TextCoverage("hello world", [(6, 11), (0, 5)])
+        assert coverage.get_uncovered_ranges() == [(5, 6)]
+
 
 class TestTextCoverageUncoveredText(unittest.TestCase):
     """Test suite for uncovered text extraction."""
@@ -304,6 +452,65 @@ class TestTextCoverageEdgeCases(unittest.TestCase):
         assert coverage.is_fully_covered()
 
 
+class TestCoverageBitmap(unittest.TestCase):
+    """Test suite for the CoverageBitmap fast path."""
+
+    def test_bitmap_constructor(self) -> None:
+        """TextCoverage.bitmap should create an empty bitmap of the given length."""
+        bitmap = TextCoverage.bitmap(5)
+        assert isinstance(bitmap, CoverageBitmap)
+        assert len(bitmap) == 5
+        assert not bitmap.is_fully_covered()
+
+    def test_bitmap_overlapping_ranges(self) -> None:
+        """Overlapping ranges that span the text should be fully covered."""
+        bitmap = TextCoverage.bitmap(len("Hello World"))
+        bitmap.add_range(0, 7)
+        bitmap.add_range(6, 11)
+        assert bitmap.is_fully_covered()
+
+    def test_bitmap_gap_in_coverage(self) -> None:
+        """A gap should leave the bitmap not fully covered."""
+        bitmap = TextCoverage.bitmap(len("Hello World"))
+        bitmap.add_range(0, 5)
+        bitmap.add_range(6, 11)
+        assert not bitmap.is_fully_covered()
+        bitmap.add_range(5, 6)
+        assert bitmap.is_fully_covered()
+
+    def test_bitmap_reset(self) -> None:
+        """Reset should clear all coverage while keeping the bitmap length."""
+        bitmap = TextCoverage.bitmap(5)
+        bitmap.add_range(0, 5)
+        bitmap.reset()
+        assert len(bitmap) == 5
+        assert not bitmap.is_fully_covered()
+
+    def test_bitmap_empty_text(self) -> None:
+        """An empty bitmap should be considered fully covered."""
+        assert TextCoverage.bitmap(0).is_fully_covered()
+
+    def test_bitmap_matches_interval_backend(self) -> None:
+        """Percentage and uncovered ranges should agree with TextCoverage."""
+        text = "Hello World Foo"
+        spans = [(12, 14), (1, 4), (6, 11), (3, 5)]
+        bitmap = TextCoverage.bitmap(len(text))
+        bitmap.add_ranges(spans)
+        coverage = TextCoverage(text)
+        coverage.add_ranges(spans)
+        assert bitmap.get_uncovered_ranges() == coverage.get_uncovered_ranges() == [(0, 1), (5, 6), (11, 12), (14, 15)]
+        assert bitmap.get_coverage_percentage() == pytest.approx(coverage.get_coverage_percentage())
+
+    def test_bitmap_uncovered_ranges_edges(self) -> None:
+        """Uncovered ranges should cover the whole text when empty and nothing when full."""
+        bitmap = TextCoverage.bitmap(5)
+        assert bitmap.get_uncovered_ranges() == [(0, 5)]
+        assert bitmap.get_coverage_percentage() == pytest.approx(0.0)
+        bitmap.add_range(0, 5)
+        assert bitmap.get_uncovered_ranges() == []
+        assert TextCoverage.bitmap(0).get_coverage_percentage() == pytest.approx(1.0)
+
+
 class TestTextCoverageScenarios(unittest.TestCase):
     """Test suite for real-world scenarios from the design document."""
 
@@ -52,8 +52,19 @@ class MockTranslatorWithRecording(MockTranslator):
 class TestReplaceRulesTranslationInput(unittest.TestCase):
     """Test suite verifying replace rules affect actual translation input."""
 
+    recording_translator: MockTranslatorWithRecording
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Patch get_translator once for the whole class to return a shared recording translator."""
+        cls.recording_translator = MockTranslatorWithRecording(settings=ProviderSettings())
+        patcher = patch("glocaltext.translate.get_translator", return_value=cls.recording_translator)
+        patcher.start()
+        cls.addClassCleanup(patcher.stop)
+
     def setUp(self) -> None:
-        """Set up test fixtures."""
+        """Set up test fixtures and forget texts recorded by earlier tests."""
+        self.recording_translator.received_texts.clear()
         self.source_file = Path("test.txt")
         self.config = GlocalConfig()
         self.config.providers["mock"] = ProviderSettings()
@@ -89,17 +100,12 @@ class TestReplaceRulesTranslationInput(unittest.TestCase):
             ],
         )
 
-        # Create recording translator
-        recording_translator = MockTranslatorWithRecording(settings=ProviderSettings())
-
-        # Patch get_translator to return our recording translator
-        with patch("glocaltext.translate.get_translator", return_value=recording_translator):
-            # Process matches using the public API
-            process_matches([match], task, self.config, debug=False)
+        # Process matches using the public API
+        process_matches([match], task, self.config, debug=False)
 
         # CRITICAL ASSERTION: Translator should receive processed_text, NOT original_text
-        assert len(recording_translator.received_texts) == 1, "Should translate exactly one text"
-        received_text = recording_translator.received_texts[0]
+        assert len(self.recording_translator.received_texts) == 1, "Should translate exactly one text"
+        received_text = self.recording_translator.received_texts[0]
 
         assert received_text == "系統資訊(Unknown)", f"Translator should receive processed_text '系統資訊(Unknown)' but received '{received_text}' (original_text)"
 
@@ -145,19 +151,15 @@ class TestReplaceRulesTranslationInput(unittest.TestCase):
             ],
         )
 
-        recording_translator = MockTranslatorWithRecording(settings=ProviderSettings())
-
-        # Patch get_translator to return our recording translator
-        with patch("glocaltext.translate.get_translator", return_value=recording_translator):
-            process_matches([match1, match2], task, self.config, debug=False)
+        process_matches([match1, match2], task, self.config, debug=False)
 
         # CRITICAL ASSERTION: Should only translate once (deduplication by processed_text)
         # If bug exists, it would deduplicate by original_text and still translate once,
         # but the key insight is that it should use processed_text as the translation input
-        assert len(recording_translator.received_texts) >= 1, "Should translate at least once"
+        assert len(self.recording_translator.received_texts) >= 1, "Should translate at least once"
 
         # All received texts should be processed_text, not original_text
-        for received_text in recording_translator.received_texts:
+        for received_text in self.recording_translator.received_texts:
             assert received_text == "狀態: Unknown", f"All translations should use processed_text '狀態: Unknown' but received '{received_text}'"
 
         # Both matches should be translated with same result (deduplication)
@@ -191,15 +193,11 @@ class TestReplaceRulesTranslationInput(unittest.TestCase):
             rules=[],  # No rules
         )
 
-        recording_translator = MockTranslatorWithRecording(settings=ProviderSettings())
-
-        # Patch get_translator to return our recording translator
-        with patch("glocaltext.translate.get_translator", return_value=recording_translator):
-            process_matches([match], task, self.config, debug=False)
+        process_matches([match], task, self.config, debug=False)
 
         # Should receive original_text when processed_text is None
-        assert len(recording_translator.received_texts) == 1, "Should translate exactly one text"
-        assert recording_translator.received_texts[0] == "測試文字", "Should use original_text when processed_text is None"
+        assert len(self.recording_translator.received_texts) == 1, "Should translate exactly one text"
+        assert self.recording_translator.received_texts[0] == "測試文字", "Should use original_text when processed_text is None"
 
     def test_multiple_replace_rules_final_processed_text_used(self) -> None:
         """
@@ -234,15 +232,11 @@ class TestReplaceRulesTranslationInput(unittest.TestCase):
             ],
         )
 
-        recording_translator = MockTranslatorWithRecording(settings=ProviderSettings())
-
-        # Patch get_translator to return our recording translator
-        with patch("glocaltext.translate.get_translator", return_value=recording_translator):
-            process_matches([match], task, self.config, debug=False)
+        process_matches([match], task, self.config, debug=False)
 
         # Should receive the final processed_text after all replacements
-        assert len(recording_translator.received_texts) == 1, "Should translate exactly one text"
-        assert recording_translator.received_texts[0] == "錯誤: 未知 Status", f"Translator should receive final processed_text '錯誤: 未知 Status' but received '{recording_translator.received_texts[0]}'"
+        assert len(self.recording_translator.received_texts) == 1, "Should translate exactly one text"
+        assert self.recording_translator.received_texts[0] == "錯誤: 未知 Status", f"Translator should receive final processed_text '錯誤: 未知 Status' but received '{self.recording_translator.received_texts[0]}'"
 
     def test_replace_with_skip_rule_100_percent_coverage_skips_translation(self) -> None:
         """
@@ -288,8 +282,6 @@ class TestReplaceRulesTranslationInput(unittest.TestCase):
             ],
         )
 
-        recording_translator = MockTranslatorWithRecording(settings=ProviderSettings())
-
         # Use Pipeline to ensure rules are processed correctly
         context = ExecutionContext(
             task=task,
@@ -307,16 +299,15 @@ class TestReplaceRulesTranslationInput(unittest.TestCase):
         terminating_processor.process(context)
 
         # Translation processing
-        with patch("glocaltext.translate.get_translator", return_value=recording_translator):
-            process_matches(
-                matches=context.matches_to_translate,
-                task=task,
-                config=self.config,
-                debug=False,
-            )
+        process_matches(
+            matches=context.matches_to_translate,
+            task=task,
+            config=self.config,
+            debug=False,
+        )
 
         # CRITICAL ASSERTION: Skip rule matches original text 100%, should NOT call translator
-        assert len(recording_translator.received_texts) == 0, f"Skip rule with 100% coverage of ORIGINAL text should skip translation, but translator received: {recording_translator.received_texts}"
+        assert len(self.recording_translator.received_texts) == 0, f"Skip rule with 100% coverage of ORIGINAL text should skip translation, but translator received: {self.recording_translator.received_texts}"
 
         # Verify the match uses processed_text as final result (from replace rule)
         assert match.translated_text == "%d  cores", f"Match should use processed_text '%d  cores' as final result, but got '{match.translated_text}'"
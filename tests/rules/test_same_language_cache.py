@@ -1,194 +1,183 @@
-"""Regression test for Phase 6: Same Language Cache Missing Bug."""
+"""
+Regression test for Phase 6: Same Language Cache Missing Bug.
 
-import unittest
+Bug Description:
+When source_lang == target_lang, matches are correctly marked as SKIPPED
+with SKIP_SAME_LANGUAGE reason, but they are not written to cache because
+CacheUpdateProcessor filters out ALL SKIPPED matches.
+
+This causes the same texts to be re-processed on every execution instead
+of being read from cache.
+"""
+
+import sys
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
 
+from glocaltext import paths
 from glocaltext.config import GlocalConfig
 from glocaltext.match_state import SKIP_SAME_LANGUAGE, SKIP_USER_RULE, MatchLifecycle
 from glocaltext.models import ExecutionContext
-from glocaltext.processing import CacheUpdateProcessor, TranslationProcessor
+from glocaltext.processing import CacheUpdateProcessor, TranslationProcessor, cache_processors
 from glocaltext.types import Source, TextMatch, TranslationTask
 
+pytestmark = pytest.mark.unit
+
+_FAKE_ROOT = Path("/fake_project")
+_SOURCE_FILE = Path("test.txt")
+
+# Processors keep no per-run state (everything lives on the context), so one instance serves every test
+_TRANSLATION = TranslationProcessor()
+_CACHE_UPDATE = CacheUpdateProcessor()
+
+
+def _match(text: str, start: int, *, translated_text: str | None = None) -> TextMatch:
+    """Build a match for text found at start in the shared source file."""
+    return TextMatch(
+        original_text=text,
+        source_file=_SOURCE_FILE,
+        span=(start, start + len(text)),
+        task_name="test",
+        extraction_rule="r",
+        translated_text=translated_text,
+    )
+
+
+@pytest.fixture(scope="module")
+def mock_config() -> GlocalConfig:
+    """Provide a default config shared by every test; the processors only read it."""
+    return GlocalConfig()
+
+
+@pytest.fixture(scope="module")
+def mock_task_same_lang() -> TranslationTask:
+    """Provide an incremental task whose source and target language are the same."""
+    return TranslationTask(
+        name="same_lang_task",
+        source_lang="en",
+        target_lang="en",  # Same language!
+        translator="mock",
+        source=Source(include=["*.txt"]),
+        incremental=True,
+        task_id="test-same-lang-id",
+    )
 
-class TestSameLanguageCacheBug(unittest.TestCase):
+
+@pytest.fixture
+def context(mock_config: GlocalConfig, mock_task_same_lang: TranslationTask) -> ExecutionContext:
+    """Provide a fresh execution context; its match lists are mutated by each test."""
+    return ExecutionContext(task=mock_task_same_lang, config=mock_config, project_root=Path.cwd())
+
+
+@pytest.fixture
+def cache_io(monkeypatch: pytest.MonkeyPatch) -> SimpleNamespace:
+    """Replace project-root lookup and cache file I/O with stubs; _update_cache calls are recorded."""
+    update_calls: list[tuple[Any, ...]] = []
+    monkeypatch.setattr(paths, "find_project_root", lambda *_args, **_kwargs: _FAKE_ROOT)
+    monkeypatch.setattr(cache_processors, "_load_cache", lambda *_args, **_kwargs: {})  # Empty cache initially
+    monkeypatch.setattr(cache_processors, "_update_cache", lambda *args, **_kwargs: update_calls.append(args))
+    return SimpleNamespace(update_calls=update_calls)
+
+
+def test_same_language_matches_should_be_cached(context: ExecutionContext, cache_io: SimpleNamespace) -> None:
     """
-    Test suite for the Same Language Cache Missing Bug (Phase 6).
+    Test that same language SKIPPED matches ARE written to cache.
 
-    Bug Description:
-    When source_lang == target_lang, matches are correctly marked as SKIPPED
-    with SKIP_SAME_LANGUAGE reason, but they are not written to cache because
-    CacheUpdateProcessor filters out ALL SKIPPED matches.
+    Scenario:
+    1. source_lang == target_lang (e.g., both "en")
+    2. TranslationProcessor marks matches as SKIPPED + SKIP_SAME_LANGUAGE
+    3. CacheUpdateProcessor SHOULD write these to cache
+    4. Next run should read from cache instead of re-processing
 
-    This causes the same texts to be re-processed on every execution instead
-    of being read from cache.
+    Expected: Same language matches should be cached for performance.
     """
+    context.is_incremental = True  # Enable incremental mode
+
+    # Create matches for same language scenario
+    match1 = _match("Hello World", 0)
+    match2 = _match("Another text", 12)
+
+    context.matches_to_translate = [match1, match2]
+
+    # Run TranslationProcessor - should mark as SKIPPED
+    _TRANSLATION.process(context)
+
+    # Verify matches were marked correctly
+    assert match1.lifecycle == MatchLifecycle.SKIPPED
+    assert match1.skip_reason == SKIP_SAME_LANGUAGE
+    assert match1.translated_text == match1.original_text
+    assert match2.lifecycle == MatchLifecycle.SKIPPED
+    assert match2.skip_reason == SKIP_SAME_LANGUAGE
+    assert match2.translated_text == match2.original_text
+
+    # Run CacheUpdateProcessor - should write these to cache
+    _CACHE_UPDATE.process(context)
+
+    # CRITICAL ASSERTION: Same language matches SHOULD be cached
+    # This test will FAIL before the fix, PASS after the fix
+    assert len(cache_io.update_calls) == 1
+
+    # Verify the matches passed to _update_cache
+    called_matches = cache_io.update_calls[0][2]
+    assert len(called_matches) == 2, f"Expected 2 matches to be cached, got {len(called_matches)}"
+
+    # Verify the cached content
+    cached_texts = {m.original_text for m in called_matches}
+    assert "Hello World" in cached_texts
+    assert "Another text" in cached_texts
+
+
+@pytest.mark.usefixtures("cache_io")
+def test_empty_text_skipped_matches_should_be_cached(context: ExecutionContext) -> None:
+    """
+    Test that empty text SKIPPED matches are also cached.
+
+    Empty/whitespace-only texts should be cached to avoid re-processing.
+    """
+    # This will be filtered as empty by TranslationProcessor
+    empty_match = _match("   ", 0)  # Whitespace only
+
+    context.matches_to_translate = [empty_match]
+
+    # Run TranslationProcessor - moves empty matches to terminated_matches
+    _TRANSLATION.process(context)
+
+    # Empty matches are moved to terminated_matches, not left in matches_to_translate
+    assert len(context.matches_to_translate) == 0
+    assert len(context.terminated_matches) == 1
+    assert context.terminated_matches[0].lifecycle == MatchLifecycle.SKIPPED
+
+    # CacheUpdateProcessor only processes matches_to_translate
+    # Empty matches are in terminated_matches, so they won't be cached
+    # This is actually CORRECT behavior - empty matches don't need caching
+    # because they're filtered before reaching the cache check
+
+
+def test_user_rule_skipped_matches_not_cached(context: ExecutionContext, cache_io: SimpleNamespace) -> None:
+    """
+    Test that user rule SKIPPED matches are NOT cached.
+
+    User-defined skip rules should not be cached because the rules
+    might change between runs.
+    """
+    context.is_incremental = True  # Enable incremental mode
+
+    # Create a match that was skipped by user rule
+    user_skip_match = _match("Skip this", 0, translated_text="Skip this")  # Would have translated_text
+    user_skip_match.lifecycle = MatchLifecycle.SKIPPED
+    user_skip_match.skip_reason = SKIP_USER_RULE
+
+    context.matches_to_translate = [user_skip_match]
+
+    # Run CacheUpdateProcessor
+    _CACHE_UPDATE.process(context)
 
-    def setUp(self) -> None:
-        """Set up test context."""
-        self.mock_config = GlocalConfig()
-        self.mock_task = TranslationTask(
-            name="same_lang_task",
-            source_lang="en",
-            target_lang="en",  # Same language!
-            translator="mock",
-            source=Source(include=["*.txt"]),
-            incremental=True,
-            task_id="test-same-lang-id",
-        )
-        self.context = ExecutionContext(task=self.mock_task, config=self.mock_config, project_root=Path.cwd())
-
-    @patch("glocaltext.paths.find_project_root")
-    @patch("glocaltext.processing.cache_processors._load_cache")
-    @patch("glocaltext.processing.cache_processors._update_cache")
-    def test_same_language_matches_should_be_cached(
-        self,
-        mock_update_cache: MagicMock,
-        mock_load_cache: MagicMock,
-        mock_find_root: MagicMock,
-    ) -> None:
-        """
-        Test that same language SKIPPED matches ARE written to cache.
-
-        Scenario:
-        1. source_lang == target_lang (e.g., both "en")
-        2. TranslationProcessor marks matches as SKIPPED + SKIP_SAME_LANGUAGE
-        3. CacheUpdateProcessor SHOULD write these to cache
-        4. Next run should read from cache instead of re-processing
-
-        Expected: Same language matches should be cached for performance.
-        """
-        mock_find_root.return_value = Path("/fake_project")
-        mock_load_cache.return_value = {}  # Empty cache initially
-        self.context.is_incremental = True  # Enable incremental mode
-
-        # Create matches for same language scenario
-        match1 = TextMatch(
-            original_text="Hello World",
-            source_file=Path("test.txt"),
-            span=(0, 11),
-            task_name="test",
-            extraction_rule="r",
-        )
-        match2 = TextMatch(
-            original_text="Another text",
-            source_file=Path("test.txt"),
-            span=(12, 24),
-            task_name="test",
-            extraction_rule="r",
-        )
-
-        self.context.matches_to_translate = [match1, match2]
-
-        # Run TranslationProcessor - should mark as SKIPPED
-        translation_processor = TranslationProcessor()
-        translation_processor.process(self.context)
-
-        # Verify matches were marked correctly
-        assert match1.lifecycle == MatchLifecycle.SKIPPED
-        assert match1.skip_reason == SKIP_SAME_LANGUAGE
-        assert match1.translated_text == match1.original_text
-        assert match2.lifecycle == MatchLifecycle.SKIPPED
-        assert match2.skip_reason == SKIP_SAME_LANGUAGE
-        assert match2.translated_text == match2.original_text
-
-        # Run CacheUpdateProcessor - should write these to cache
-        update_processor = CacheUpdateProcessor()
-        update_processor.process(self.context)
-
-        # CRITICAL ASSERTION: Same language matches SHOULD be cached
-        # This test will FAIL before the fix, PASS after the fix
-        mock_update_cache.assert_called_once()
-
-        # Verify the matches passed to _update_cache
-        called_matches = mock_update_cache.call_args.args[2]
-        assert len(called_matches) == 2, f"Expected 2 matches to be cached, got {len(called_matches)}"
-
-        # Verify the cached content
-        cached_texts = {m.original_text for m in called_matches}
-        assert "Hello World" in cached_texts
-        assert "Another text" in cached_texts
-
-    @patch("glocaltext.paths.find_project_root")
-    @patch("glocaltext.processing.cache_processors._load_cache")
-    def test_empty_text_skipped_matches_should_be_cached(
-        self,
-        mock_load_cache: MagicMock,
-        mock_find_root: MagicMock,
-    ) -> None:
-        """
-        Test that empty text SKIPPED matches are also cached.
-
-        Empty/whitespace-only texts should be cached to avoid re-processing.
-        """
-        mock_find_root.return_value = Path("/fake_project")
-        mock_load_cache.return_value = {}
-
-        # This will be filtered as empty by TranslationProcessor
-        empty_match = TextMatch(
-            original_text="   ",  # Whitespace only
-            source_file=Path("test.txt"),
-            span=(0, 3),
-            task_name="test",
-            extraction_rule="r",
-        )
-
-        self.context.matches_to_translate = [empty_match]
-
-        # Run TranslationProcessor - moves empty matches to terminated_matches
-        translation_processor = TranslationProcessor()
-        translation_processor.process(self.context)
-
-        # Empty matches are moved to terminated_matches, not left in matches_to_translate
-        assert len(self.context.matches_to_translate) == 0
-        assert len(self.context.terminated_matches) == 1
-        assert self.context.terminated_matches[0].lifecycle == MatchLifecycle.SKIPPED
-
-        # CacheUpdateProcessor only processes matches_to_translate
-        # Empty matches are in terminated_matches, so they won't be cached
-        # This is actually CORRECT behavior - empty matches don't need caching
-        # because they're filtered before reaching the cache check
-
-    @patch("glocaltext.paths.find_project_root")
-    @patch("glocaltext.processing.cache_processors._load_cache")
-    @patch("glocaltext.processing.cache_processors._update_cache")
-    def test_user_rule_skipped_matches_not_cached(
-        self,
-        mock_update_cache: MagicMock,
-        mock_load_cache: MagicMock,
-        mock_find_root: MagicMock,
-    ) -> None:
-        """
-        Test that user rule SKIPPED matches are NOT cached.
-
-        User-defined skip rules should not be cached because the rules
-        might change between runs.
-        """
-        mock_find_root.return_value = Path("/fake_project")
-        mock_load_cache.return_value = {}
-        self.context.is_incremental = True  # Enable incremental mode
-
-        # Create a match that was skipped by user rule
-        user_skip_match = TextMatch(
-            original_text="Skip this",
-            source_file=Path("test.txt"),
-            span=(0, 9),
-            task_name="test",
-            extraction_rule="r",
-            translated_text="Skip this",  # Would have translated_text
-        )
-        user_skip_match.lifecycle = MatchLifecycle.SKIPPED
-        user_skip_match.skip_reason = SKIP_USER_RULE
-
-        self.context.matches_to_translate = [user_skip_match]
-
-        # Run CacheUpdateProcessor
-        update_processor = CacheUpdateProcessor()
-        update_processor.process(self.context)
-
-        # User rule skips should NOT be cached
-        mock_update_cache.assert_not_called()
+    # User rule skips should NOT be cached
+    assert cache_io.update_calls == []
 
 
 if __name__ == "__main__":
-    unittest.main()
+    sys.exit(pytest.main([__file__, "-x", "--tb=short", "-p", "no:cacheprovider"]))
@@ -14,10 +14,13 @@ Architecture Context:
 - Protect rules must check original_text after Phase 2 fix (dual-text architecture)
 """
 
-import unittest
+import sys
+from collections import deque
 from pathlib import Path
-from unittest.mock import patch
 
+import pytest
+
+from glocaltext import translate
 from glocaltext.config import GlocalConfig, ProviderSettings
 from glocaltext.match_state import MatchLifecycle
 from glocaltext.models import ExecutionContext
@@ -29,12 +32,18 @@ from glocaltext.types import ActionRule, MatchRule, Rule, Source, TextMatch, Tra
 
 
 class RecordingMockTranslator(MockTranslator):
-    """擴展 MockTranslator 以記錄實際接收到的翻譯文本。."""
+    """
+    擴展 MockTranslator 以記錄實際接收到的翻譯文本。.
+
+    刻意繼承 MockTranslator 而非另寫獨立替身：BaseTranslator/MockTranslator 的初始化
+    只保存設定，成本可忽略（且整個模組只建立一次），繼承則保證 Pipeline 走的是真實的
+    翻譯器介面與 "[MOCK] " 輸出格式。
+    """
 
     def __init__(self, settings: ProviderSettings) -> None:
         """初始化帶記錄功能的 Mock 翻譯器。."""
         super().__init__(settings)
-        self.received_texts: list[str] = []
+        self.received_texts: deque[str] = deque()
 
     def translate(
         self,
@@ -50,335 +59,145 @@ class RecordingMockTranslator(MockTranslator):
         return super().translate(texts, target_language, source_language, debug=debug, prompts=prompts)
 
 
-class TestUnifiedArchitectureE2E(unittest.TestCase):
-    """端到端測試：驗證統一規則架構。."""
-
-    def setUp(self) -> None:
-        """設置測試環境。."""
-        self.config = GlocalConfig()
-        self.config.providers["mock"] = ProviderSettings()
-        self.source_file = Path("test.txt")
-        self.mock_translator = RecordingMockTranslator(ProviderSettings())
-
-    def _process_with_pipeline(self, matches: list[TextMatch], task: TranslationTask) -> None:
-        """
-        使用完整的 Pipeline 階段處理 matches。.
-
-        這個輔助方法模擬 Workflow Pipeline 的關鍵階段：
-        1. TerminatingRuleProcessor - 執行 Replace/Skip/Protect 規則
-        2. TranslationProcessor - 調用 process_matches() 進行翻譯
-
-        Args:
-            matches: 要處理的 TextMatch 列表
-            task: 翻譯任務配置
-
-        """
-        # 創建執行上下文
-        context = ExecutionContext(
-            task=task,
-            config=self.config,
-            project_root=Path.cwd(),
-            is_dry_run=False,
-            is_incremental=False,
-            is_debug=False,
-        )
-        context.all_matches = matches
-        context.matches_to_translate = matches.copy()
-
-        # 階段 3: 執行 Terminating Rules (Replace/Skip/Protect)
-        terminating_processor = TerminatingRuleProcessor()
-        terminating_processor.process(context)
-
-        # 階段 4: 翻譯處理
-        # 使用 context.matches_to_translate（已經過 TerminatingRuleProcessor 處理）
-        with patch("glocaltext.translate.get_translator", return_value=self.mock_translator):
-            process_matches(
-                matches=context.matches_to_translate,
-                task=task,
-                config=self.config,
-                debug=False,
-            )
-
-    def test_replace_rule_checks_original_text_and_tracks_coverage(self) -> None:
-        """
-        驗證 Replace 規則在原始文本上匹配並正確追蹤 Coverage。.
-
-        測試場景：
-        - 原始文本: "系統資訊(未知)"
-        - Replace 規則: "未知" -> "Unknown"
-        - 預期: 規則在原始文本上匹配並計入 Coverage
-        - 預期: 翻譯器接收到處理後的文本 "系統資訊(Unknown)"
-        """
-        # 創建 Task with Replace 規則
-        task = TranslationTask(
-            name="test_task",
-            source_lang="zh-TW",
-            target_lang="en",
-            translator="mock",
-            source=Source(include=["*.txt"]),
-            rules=[
-                Rule(
-                    match=MatchRule(regex=r"未知"),
-                    action=ActionRule(action="replace", value="Unknown"),
-                ),
-            ],
-        )
-
-        # 創建 TextMatch
-        match = TextMatch(
-            original_text="系統資訊(未知)",
-            source_file=self.source_file,
-            span=(0, 14),
-            task_name="test_task",
-            extraction_rule="test_rule",
-        )
-
-        # 處理 Match - 使用完整的 Pipeline
-        self._process_with_pipeline([match], task)
-
-        # 驗證：Match 應該被翻譯（因為 Replace 規則計入 Coverage）
-        assert match.translated_text is not None, "Match 應該被翻譯"
-        assert match.lifecycle == MatchLifecycle.TRANSLATED, "Lifecycle 應該是 TRANSLATED"
-
-        # 驗證：翻譯器接收到處理後的文本
-        assert len(self.mock_translator.received_texts) > 0, "翻譯器應該接收到文本"
-        assert "系統資訊(Unknown)" in self.mock_translator.received_texts, "翻譯器應該接收到 Replace 規則處理後的文本"
-
-    def test_protect_rule_checks_original_text_and_tracks_coverage(self) -> None:
-        """
-        驗證 Protect 規則在原始文本上匹配並正確追蹤 Coverage。.
-
-        測試場景：
-        - 原始文本: "CPU 使用率: 50%"
-        - Protect 規則: 保護 "50%"
-        - 預期: 規則在原始文本上匹配並計入 Coverage
-        - 預期: 翻譯時保護的內容被替換為佔位符
-        """
-        # 創建 Task with Protect 規則
-        task = TranslationTask(
-            name="test_task",
-            source_lang="zh-TW",
-            target_lang="en",
-            translator="mock",
-            source=Source(include=["*.txt"]),
-            rules=[
-                Rule(
-                    match=MatchRule(regex=r"\d+%"),
-                    action=ActionRule(action="protect"),
-                ),
-            ],
-        )
-
-        # 創建 TextMatch
-        match = TextMatch(
-            original_text="CPU 使用率: 50%",
-            source_file=self.source_file,
-            span=(0, 14),
-            task_name="test_task",
-            extraction_rule="test_rule",
-        )
-
-        # 處理 Match - 使用完整的 Pipeline
-        self._process_with_pipeline([match], task)
-
-        # 驗證：Match 應該被翻譯（因為 Protect 規則計入 Coverage）
-        assert match.translated_text is not None, "Match 應該被翻譯"
-        assert match.lifecycle == MatchLifecycle.TRANSLATED, "Lifecycle 應該是 TRANSLATED"
-
-        # 驗證：最終結果中保護的內容被正確還原
-        assert match.translated_text is not None  # Type narrowing
-        assert "50%" in match.translated_text, "翻譯結果應該包含還原後的保護內容"
-
-    def test_skip_rule_checks_original_text_with_full_coverage(self) -> None:
-        """
-        驗證 Skip 規則在原始文本上匹配並在完全覆蓋時跳過翻譯。.
-
-        測試場景：
-        - 原始文本: "192.168.1.1"
-        - Skip 規則: 完全覆蓋 IP 地址
-        - 預期: 規則在原始文本上匹配
-        - 預期: 因為完全覆蓋而跳過翻譯
-        """
-        # 創建 Task with Skip 規則
-        task = TranslationTask(
-            name="test_task",
-            source_lang="zh-TW",
-            target_lang="en",
-            translator="mock",
-            source=Source(include=["*.txt"]),
-            rules=[
-                Rule(
-                    match=MatchRule(regex=r"^\d+\.\d+\.\d+\.\d+$"),
-                    action=ActionRule(action="skip"),
-                ),
-            ],
-        )
-
-        # 創建 TextMatch
-        match = TextMatch(
-            original_text="192.168.1.1",
-            source_file=self.source_file,
-            span=(0, 11),
-            task_name="test_task",
-            extraction_rule="test_rule",
-        )
-
-        # 處理 Match - 使用完整的 Pipeline
-        self._process_with_pipeline([match], task)
-
-        # 驗證：Match 被標記為 SKIPPED（不調用翻譯 API）
-        assert match.lifecycle == MatchLifecycle.SKIPPED, "Skip 規則完全覆蓋時應該標記為 SKIPPED"
-        # translated_text 應該保留原始文本（用於寫回文件）
-        assert match.translated_text == "192.168.1.1", "SKIPPED match 應該保留原始文本"
-
-        # 驗證：翻譯器不應該接收到任何文本
-        assert len(self.mock_translator.received_texts) == 0, "Skip 規則完全覆蓋時翻譯器不應該接收到任何文本"
-
-    def test_skip_rule_partial_coverage_does_not_skip(self) -> None:
-        """
-        驗證 Skip 規則部分覆蓋時不跳過翻譯。.
-
-        測試場景：
-        - 原始文本: "伺服器 IP: 192.168.1.1"
-        - Skip 規則: 只覆蓋 IP 部分
-        - 預期: 規則在原始文本上匹配
-        - 預期: 因為只是部分覆蓋，不跳過翻譯
-        """
-        # 創建 Task with Skip 規則（只匹配 IP，不匹配整個文本）
-        task = TranslationTask(
-            name="test_task",
-            source_lang="zh-TW",
-            target_lang="en",
-            translator="mock",
-            source=Source(include=["*.txt"]),
-            rules=[
-                Rule(
-                    match=MatchRule(regex=r"\d+\.\d+\.\d+\.\d+"),
-                    action=ActionRule(action="skip"),
-                ),
-            ],
-        )
-
-        # 創建 TextMatch
-        match = TextMatch(
-            original_text="伺服器 IP: 192.168.1.1",
-            source_file=self.source_file,
-            span=(0, 20),
-            task_name="test_task",
-            extraction_rule="test_rule",
-        )
-
-        # 處理 Match - 使用完整的 Pipeline
-        self._process_with_pipeline([match], task)
-
-        # 驗證：Match 應該被翻譯（因為 Skip 規則只部分覆蓋）
-        assert match.translated_text is not None, "Skip 規則部分覆蓋時 Match 應該被翻譯"
-
-    def test_replace_and_protect_rules_both_check_original_text(self) -> None:
-        """
-        驗證 Replace 和 Protect 規則同時存在時都檢查原始文本。.
-
-        測試場景：
-        - 原始文本: "CPU 使用率: 50% (未知狀態)"
-        - Replace 規則: "未知" -> "Unknown"
-        - Protect 規則: 保護 "50%"
-        - 預期: 兩個規則都在原始文本上匹配
-        - 預期: Replace 先處理，Protect 在處理後的文本上應用保護
-        """
-        # 創建 Task with Replace 和 Protect 規則
-        task = TranslationTask(
-            name="test_task",
-            source_lang="zh-TW",
-            target_lang="en",
-            translator="mock",
-            source=Source(include=["*.txt"]),
-            rules=[
-                Rule(
-                    match=MatchRule(regex=r"未知"),
-                    action=ActionRule(action="replace", value="Unknown"),
-                ),
-                Rule(
-                    match=MatchRule(regex=r"\d+%"),
-                    action=ActionRule(action="protect"),
-                ),
-            ],
-        )
-
-        # 創建 TextMatch
-        match = TextMatch(
-            original_text="CPU 使用率: 50% (未知狀態)",
-            source_file=self.source_file,
-            span=(0, 24),
-            task_name="test_task",
-            extraction_rule="test_rule",
-        )
-
-        # 處理 Match - 使用完整的 Pipeline
-        self._process_with_pipeline([match], task)
-
-        # 驗證：Match 應該被翻譯
-        assert match.translated_text is not None, "Match 應該被翻譯"
-
-        # 驗證：最終結果包含 Replace 的修改和 Protect 的還原
-        assert match.translated_text is not None  # Type narrowing
-        assert "Unknown" in match.translated_text, "應該包含 Replace 規則的替換結果"
-        assert "50%" in match.translated_text, "應該包含 Protect 規則還原的內容"
-
-    def test_all_rules_contribute_to_coverage_calculation(self) -> None:
-        """
-        驗證所有規則類型都正確計入 Coverage 計算。.
-
-        測試場景：
-        - 原始文本: "系統: OK (100%)"
-        - Replace 規則: "OK" -> "SUCCESS"
-        - Protect 規則: 保護 "100%"
-        - Skip 規則: 嘗試跳過 "系統"
-        - 預期: 所有規則都參與 Coverage 計算
-        - 預期: Coverage 總和影響是否跳過翻譯的決策
-        """
-        # 創建帶有多種規則的 Task
-        task = TranslationTask(
-            name="test_all_rules_coverage",
-            source_lang="zh-TW",
-            target_lang="en",
-            translator="mock",
-            source=Source(include=["*.txt"]),
-            rules=[
-                Rule(
-                    match=MatchRule(regex=r"OK"),
-                    action=ActionRule(action="replace", value="SUCCESS"),
-                ),
-                Rule(
-                    match=MatchRule(regex=r"\d+%"),
-                    action=ActionRule(action="protect"),
-                ),
-                Rule(
-                    match=MatchRule(regex=r"系統"),
-                    action=ActionRule(action="skip"),
-                ),
-            ],
-        )
-
-        # 創建 TextMatch
-        match = TextMatch(
-            original_text="系統: OK (100%)",
-            source_file=self.source_file,
-            span=(0, 14),
-            task_name="test_task",
-            extraction_rule="test_rule",
-        )
-
-        # 處理 Match - 使用完整的 Pipeline
-        self._process_with_pipeline([match], task)
-
-        # 驗證：Match 應該被翻譯（因為 Skip 規則未完全覆蓋）
-        assert match.translated_text is not None, "所有規則組合應該允許翻譯繼續"
-
-        # 驗證：最終結果反映了所有規則的效果
-        assert match.translated_text is not None  # Type narrowing
-        assert "SUCCESS" in match.translated_text, "應該包含 Replace 規則的替換"
-        assert "100%" in match.translated_text, "應該包含 Protect 規則還原的內容"
+pytestmark = pytest.mark.unit
+
+_SOURCE_FILE = Path("test.txt")
+
+# 規則與 Source 在測試之間不會被修改，於導入時建立一次並按鍵引用。
+_RULES: dict[str, Rule] = {
+    "replace_unknown": Rule(match=MatchRule(regex=r"未知"), action=ActionRule(action="replace", value="Unknown")),
+    "protect_percent": Rule(match=MatchRule(regex=r"\d+%"), action=ActionRule(action="protect")),
+    "skip_ip_full": Rule(match=MatchRule(regex=r"^\d+\.\d+\.\d+\.\d+$"), action=ActionRule(action="skip")),
+    "skip_ip": Rule(match=MatchRule(regex=r"\d+\.\d+\.\d+\.\d+"), action=ActionRule(action="skip")),
+    "replace_ok": Rule(match=MatchRule(regex=r"OK"), action=ActionRule(action="replace", value="SUCCESS")),
+    "skip_system": Rule(match=MatchRule(regex=r"系統"), action=ActionRule(action="skip")),
+}
+_SOURCE = Source(include=["*.txt"])
+# TerminatingRuleProcessor 不保存執行狀態（狀態都在 context 上），所有測試共用同一實例。
+_TERMINATING = TerminatingRuleProcessor()
+
+
+@pytest.fixture(scope="module")
+def config() -> GlocalConfig:
+    """提供所有測試共用的配置（含 mock provider），Pipeline 只讀取不修改。."""
+    config = GlocalConfig()
+    config.providers["mock"] = ProviderSettings()
+    return config
+
+
+@pytest.fixture(scope="module")
+def module_translator() -> RecordingMockTranslator:
+    """提供整個模組共用的記錄型翻譯器。."""
+    return RecordingMockTranslator(ProviderSettings())
+
+
+@pytest.fixture
+def mock_translator(module_translator: RecordingMockTranslator, monkeypatch: pytest.MonkeyPatch) -> RecordingMockTranslator:
+    """清空共用翻譯器的記錄，並讓 get_translator() 返回它。."""
+    module_translator.received_texts.clear()
+    monkeypatch.setattr(translate, "get_translator", lambda *_args, **_kwargs: module_translator)
+    return module_translator
+
+
+def _process_with_pipeline(matches: list[TextMatch], task: TranslationTask, config: GlocalConfig) -> None:
+    """
+    使用完整的 Pipeline 階段處理 matches。.
+
+    這個輔助方法模擬 Workflow Pipeline 的關鍵階段：
+    1. TerminatingRuleProcessor - 執行 Replace/Skip/Protect 規則
+    2. TranslationProcessor - 調用 process_matches() 進行翻譯
+
+    翻譯器由 mock_translator fixture 注入。
+
+    Args:
+        matches: 要處理的 TextMatch 列表
+        task: 翻譯任務配置
+        config: 全局配置
+
+    """
+    # 創建執行上下文
+    context = ExecutionContext(
+        task=task,
+        config=config,
+        project_root=Path.cwd(),
+        is_dry_run=False,
+        is_incremental=False,
+        is_debug=False,
+    )
+    context.all_matches = matches
+    context.matches_to_translate = matches.copy()
+
+    # 階段 3: 執行 Terminating Rules (Replace/Skip/Protect)
+    _TERMINATING.process(context)
+
+    # 階段 4: 翻譯處理
+    # 使用 context.matches_to_translate（已經過 TerminatingRuleProcessor 處理）
+    process_matches(
+        matches=context.matches_to_translate,
+        task=task,
+        config=config,
+        debug=False,
+    )
+
+
+# (原始文本, 規則鍵, 預期 lifecycle, 翻譯結果應包含的片段, 翻譯器應接收的文本) 的場景表。
+# 預期 lifecycle 或接收文本為 None 時不檢查該項；接收文本會與記錄結果完全比對。
+PIPELINE_CASES = [
+    # Replace 規則在原始文本上匹配並計入 Coverage，翻譯器接收到替換後的文本
+    pytest.param("系統資訊(未知)", ("replace_unknown",), MatchLifecycle.TRANSLATED, (), ["系統資訊(Unknown)"], id="replace_tracks_coverage"),
+    # Protect 規則在原始文本上匹配並計入 Coverage，保護內容在結果中被還原
+    pytest.param("CPU 使用率: 50%", ("protect_percent",), MatchLifecycle.TRANSLATED, ("50%",), None, id="protect_tracks_coverage"),
+    # Skip 規則完全覆蓋時跳過翻譯，保留原始文本且不調用翻譯器
+    pytest.param("192.168.1.1", ("skip_ip_full",), MatchLifecycle.SKIPPED, ("192.168.1.1",), [], id="skip_full_coverage"),
+    # Skip 規則只部分覆蓋時不跳過翻譯
+    pytest.param("伺服器 IP: 192.168.1.1", ("skip_ip",), None, (), None, id="skip_partial_coverage"),
+    # Replace 與 Protect 同時存在時都檢查原始文本，結果包含替換與還原的內容
+    pytest.param("CPU 使用率: 50% (未知狀態)", ("replace_unknown", "protect_percent"), None, ("Unknown", "50%"), None, id="replace_and_protect"),
+    # 所有規則類型都參與 Coverage 計算；Skip 未完全覆蓋，翻譯繼續並反映所有規則的效果
+    pytest.param("系統: OK (100%)", ("replace_ok", "protect_percent", "skip_system"), None, ("SUCCESS", "100%"), None, id="all_rules_contribute"),
+]
+
+
+@pytest.mark.parametrize(("original_text", "rule_keys", "expected_lifecycle", "expected_fragments", "expected_received"), PIPELINE_CASES)
+def test_pipeline(  # noqa: PLR0913
+    config: GlocalConfig,
+    mock_translator: RecordingMockTranslator,
+    original_text: str,
+    rule_keys: tuple[str, ...],
+    expected_lifecycle: MatchLifecycle | None,
+    expected_fragments: tuple[str, ...],
+    expected_received: list[str] | None,
+) -> None:
+    """驗證各規則在原始文本上匹配、計入 Coverage，並按覆蓋程度決定翻譯或跳過。."""
+    task = TranslationTask(
+        name="test_task",
+        source_lang="zh-TW",
+        target_lang="en",
+        translator="mock",
+        source=_SOURCE,
+        rules=[_RULES[key] for key in rule_keys],
+    )
+    match = TextMatch(
+        original_text=original_text,
+        source_file=_SOURCE_FILE,
+        span=(0, len(original_text)),
+        task_name="test_task",
+        extraction_rule="test_rule",
+    )
+
+    # 處理 Match - 使用完整的 Pipeline
+    _process_with_pipeline([match], task, config)
+
+    assert match.translated_text is not None, "Match 應該有翻譯結果（SKIPPED 時保留原始文本）"
+    if expected_lifecycle is not None:
+        assert match.lifecycle == expected_lifecycle
+    if expected_lifecycle == MatchLifecycle.SKIPPED:
+        assert match.translated_text == original_text, "SKIPPED match 應該保留原始文本"
+    for fragment in expected_fragments:
+        assert fragment in match.translated_text, f"翻譯結果應該包含 {fragment!r}"
+    if expected_received is not None:
+        assert list(mock_translator.received_texts) == expected_received
 
 
 if __name__ == "__main__":
-    unittest.main()
+    sys.exit(pytest.main([__file__, "-x", "--tb=short", "-p", "no:cacheprovider"]))
@@ -1,59 +1,29 @@
 """Tests for the configuration loading and parsing logic."""
 
-import unittest
-from unittest.mock import mock_open, patch
+import copy
+import re
+import sys
+from collections.abc import Callable
+from pathlib import Path
 
 import pytest
 import yaml
 
 from glocaltext.config import (
     GlocalConfig,
+    _resolve_rules_extends,
     load_config,
 )
-from glocaltext.types import Source
+from glocaltext.types import ActionRule, Source
 
+# Expected error messages, compiled once for pytest.raises(match=...)
+_ERR_INVALID_CONFIG = re.compile(r"Invalid or missing configuration")
+_ERR_DOUBLE_QUOTED = re.compile(r"Double-quoted string found")
+_ERR_NOT_A_MAPPING = re.compile(r"Config file must be a YAML mapping")
+_ERR_REPLACE_VALUE = re.compile(r"The 'value' must be provided for the 'replace' action\.")
 
-class TestConfigLoading(unittest.TestCase):
-    """Test suite for loading and parsing the GlocalText configuration."""
-
-    def test_load_config_success(self) -> None:
-        """1. Success: Correctly loads a valid YAML configuration file."""
-        yaml_content = """
-providers:
-  gemini:
-    model: 'gemini-pro'
-tasks:
-  - name: 'Translate Docs'
-    source_lang: 'en'
-    target_lang: 'ja'
-    source:
-      include: ['docs/**/*.md']
-    translator: 'gemini'
-"""
-        with patch("pathlib.Path.open", mock_open(read_data=yaml_content)), patch("pathlib.Path.is_file", return_value=True):
-            config = load_config("dummy_path.yaml")
-
-            assert isinstance(config, GlocalConfig)
-            assert "gemini" in config.providers
-            assert config.providers["gemini"].model == "gemini-pro"
-            assert len(config.tasks) == 1
-            assert config.tasks[0].name == "Translate Docs"
-            assert config.tasks[0].source.include == ["docs/**/*.md"]
-
-    def test_load_config_file_not_found(self) -> None:
-        """2. Failure: Raises FileNotFoundError for a non-existent file."""
-        with patch("pathlib.Path.is_file", return_value=False), pytest.raises(FileNotFoundError):
-            load_config("non_existent_file.yaml")
-
-    def test_load_config_invalid_yaml(self) -> None:
-        """3. Failure: Raises ValueError for a structurally invalid YAML file."""
-        invalid_yaml_content = "providers: [gemini: {model: 'pro'}]"
-        with patch("pathlib.Path.open", mock_open(read_data=invalid_yaml_content)), patch("pathlib.Path.is_file", return_value=True), pytest.raises(ValueError, match="Invalid or missing configuration"):
-            load_config("invalid.yaml")
-
-    def test_apply_shortcuts_and_defaults(self) -> None:
-        """4. Logic: Correctly applies .defaults and custom shortcuts."""
-        yaml_content = """
+# Shortcut and anchor fixture shared by the shortcut tests; parsed once per module
+_SHORTCUTS_YAML = """
 shortcuts:
   .defaults: &defaults
     translator: 'gemini'
@@ -78,157 +48,275 @@ tasks:
     target_lang: 'py-ja'
     # Inherits source and rules
 """
-        with patch("pathlib.Path.open", mock_open(read_data=yaml_content)), patch("pathlib.Path.is_file", return_value=True):
-            config = load_config("dummy_path.yaml")
-            readme_task = config.tasks[0]
-            py_docs_task = config.tasks[1]
-
-            # Task 1: Inherits from .defaults only
-            assert readme_task.translator == "gemini"
-            assert readme_task.source_lang == "en"
-            assert readme_task.incremental
-            assert readme_task.source.include == ["README.md"]
-            assert len(readme_task.rules) == 0
-
-            # Task 2: Inherits from .docs, which inherits from .defaults
-            assert py_docs_task.translator == "gemini"
-            assert py_docs_task.target_lang == "py-ja"
-            assert py_docs_task.source.include == ["**/*.md"]
-            assert py_docs_task.incremental
-            assert len(py_docs_task.rules) == 1
-            assert py_docs_task.rules[0].action.action == "protect"
-
-    def test_new_source_structure_with_exclude(self) -> None:
-        """5. Refactor: Correctly parses the new source structure with include and exclude."""
-        yaml_content = """
-tasks:
-  - name: 'Test Exclude'
-    source_lang: 'en'
-    target_lang: 'fr'
-    translator: 'mock'
-    source:
-      include: ['src/**/*.py']
-      exclude: ['src/generated/**', 'src/legacy.py']
-"""
-        with patch("pathlib.Path.open", mock_open(read_data=yaml_content)), patch("pathlib.Path.is_file", return_value=True):
-            config = load_config("dummy_path.yaml")
-            task = config.tasks[0]
-
-            assert task.source.include == ["src/**/*.py"]
-            assert task.source.exclude == ["src/generated/**", "src/legacy.py"]
-
-    def test_removed_features_do_not_break_loading(self) -> None:
-        """6. Refactor: Ensures old, removed fields are safely ignored."""
-        yaml_content_with_old_fields = """
-debug_options:
-  enabled: true
-report_options:
-  export_csv: true
+
+
+def test_load_config_success(create_config_file: Callable[[str], str]) -> None:
+    """1. Success: Correctly loads a valid YAML configuration file."""
+    yaml_content = """
 providers:
   gemini:
-    batch_options:
-      enabled: false
-tasks:
-  - name: 'Old Task'
-    source_lang: 'en'
-    target_lang: 'de'
-    translator: 'gemini'
-    source:
-      include: ['*.txt']
-    output:
-      filename_suffix: '_de'
-    regex_rewrites:
-      'old': 'new'
-"""
-        with patch("pathlib.Path.open", mock_open(read_data=yaml_content_with_old_fields)), patch("pathlib.Path.is_file", return_value=True):
-            try:
-                config = load_config("dummy_path.yaml")
-                assert isinstance(config, GlocalConfig)
-                assert not hasattr(config, "debug_options")
-                assert not hasattr(config, "report_options")
-                assert not hasattr(config.providers["gemini"], "batch_options")
-                assert not hasattr(config.tasks[0], "regex_rewrites")
-                assert not hasattr(config.tasks[0].output, "filename_suffix")
-            except (AssertionError, AttributeError) as e:
-                self.fail(f"Loading config with old fields failed unexpectedly: {e}")
-
-    def test_load_config_double_quotes_fail(self) -> None:
-        """7. Failure: Raises YAMLError when double quotes are used."""
-        yaml_content = 'key: "value"'
-        with patch("pathlib.Path.open", mock_open(read_data=yaml_content)), patch("pathlib.Path.is_file", return_value=True), pytest.raises(yaml.YAMLError, match="Double-quoted string found"):
-            load_config("dummy_path.yaml")
-
-    def test_legacy_rules_parsing(self) -> None:
-        """8. Logic: Correctly parses the old list-based rule format."""
-        yaml_content = """
+    model: 'gemini-pro'
 tasks:
-  - name: 'Legacy Rules'
+  - name: 'Translate Docs'
     source_lang: 'en'
-    target_lang: 'fr'
+    target_lang: 'ja'
     source:
-      include: ['*.*']
-    rules:
-      - 'skip: ^SKIP'
-      - 'protect: PROTECTED'
-      - 'OLD -> NEW'
-"""
-        with patch("pathlib.Path.open", mock_open(read_data=yaml_content)), patch("pathlib.Path.is_file", return_value=True):
-            config = load_config("dummy_path.yaml")
-            task = config.tasks[0]
-            assert len(task.rules) == 3
-            actions = {r.action.action for r in task.rules}
-            assert "skip" in actions
-            assert "protect" in actions
-            assert "replace" in actions
-
-    def test_rules_extends(self) -> None:
-        """9. Logic: Correctly resolves 'extends' within a rules block."""
-        yaml_content = """
-shortcuts:
-  .base-rules:
-    rules:
-      replace:
-        'base': 'correct'
-  .feature-rules:
-    rules:
-      extends: '.base-rules'
-      skip: ['feature_skip']
-tasks:
-  - name: 'Test Rules Extends'
-    source_lang: 'en'
-    target_lang: 'fr'
-    source: {include: ['*.*']}
-    rules:
-      extends: '.feature-rules'
-      protect: ['final_protect']
-"""
-        with patch("pathlib.Path.open", mock_open(read_data=yaml_content)), patch("pathlib.Path.is_file", return_value=True):
-            config = load_config("dummy_path.yaml")
-            task = config.tasks[0]
-            assert len(task.rules) == 3
-            actions = {r.action.action for r in task.rules}
-            assert actions == {"replace", "skip", "protect"}
-
-    def test_invalid_source_type_is_handled(self) -> None:
-        """10. Logic: Handles invalid 'source' types gracefully."""
-        yaml_content = """
-tasks:
-  - name: 'Invalid Source'
-    source_lang: 'en'
-    target_lang: 'fr'
-    source: 123 # Invalid type
+      include: ['docs/**/*.md']
+    translator: 'gemini'
 """
-        with patch("pathlib.Path.open", mock_open(read_data=yaml_content)), patch("pathlib.Path.is_file", return_value=True):
-            config = load_config("dummy_path.yaml")
-            task = config.tasks[0]
-            assert task.source == Source(include=[], exclude=[])
+    config_path = create_config_file(yaml_content)
+    config = load_config(config_path)
+
+    assert isinstance(config, GlocalConfig)
+    assert "gemini" in config.providers
+    assert config.providers["gemini"].model == "gemini-pro"
+    assert len(config.tasks) == 1
+    assert config.tasks[0].name == "Translate Docs"
+    assert config.tasks[0].source.include == ["docs/**/*.md"]
+
+
+def test_load_config_file_not_found(tmp_path: Path) -> None:
+    """2. Failure: Raises FileNotFoundError for a non-existent file."""
+    with pytest.raises(FileNotFoundError):
+        load_config(str(tmp_path / "non_existent_file.yaml"))
+
+
+def test_load_config_invalid_yaml(create_config_file: Callable[[str], str]) -> None:
+    """3. Failure: Raises ValueError for a structurally invalid YAML file."""
+    invalid_yaml_content = "providers: [gemini: {model: 'pro'}]"
+    with pytest.raises(ValueError, match=_ERR_INVALID_CONFIG):
+        load_config(create_config_file(invalid_yaml_content))
+
+
+@pytest.fixture(scope="module")
+def shortcuts_config(tmp_path_factory: pytest.TempPathFactory) -> GlocalConfig:
+    """Load _SHORTCUTS_YAML once for every test that inspects its resolved tasks."""
+    path = tmp_path_factory.mktemp("shortcuts") / "config.yaml"
+    path.write_text(_SHORTCUTS_YAML, encoding="utf-8")
+    return load_config(str(path))
+
+
+def test_apply_shortcuts_and_defaults(shortcuts_config: GlocalConfig) -> None:
+    """4. Logic: Correctly applies .defaults to a task that uses no custom shortcut."""
+    readme_task = shortcuts_config.tasks[0]
+
+    # Task 1: Inherits from .defaults only
+    assert readme_task.translator == "gemini"
+    assert readme_task.source_lang == "en"
+    assert readme_task.incremental
+    assert readme_task.source.include == ["README.md"]
+    assert len(readme_task.rules) == 0
+
+
+def test_apply_chained_custom_shortcut(shortcuts_config: GlocalConfig) -> None:
+    """4b. Logic: Correctly applies a custom shortcut that itself merges .defaults."""
+    py_docs_task = shortcuts_config.tasks[1]
+
+    # Task 2: Inherits from .docs, which inherits from .defaults
+    assert py_docs_task.translator == "gemini"
+    assert py_docs_task.target_lang == "py-ja"
+    assert py_docs_task.source.include == ["**/*.md"]
+    assert py_docs_task.incremental
+    assert len(py_docs_task.rules) == 1
+    assert py_docs_task.rules[0].action.action == "protect"
+
+
+def test_new_source_structure_with_exclude() -> None:
+    """5. Refactor: Correctly parses the new source structure with include and exclude."""
+    config, _ = GlocalConfig.from_dict(
+        {
+            "tasks": [
+                {
+                    "name": "Test Exclude",
+                    "source_lang": "en",
+                    "target_lang": "fr",
+                    "translator": "mock",
+                    "source": {
+                        "include": ["src/**/*.py"],
+                        "exclude": ["src/generated/**", "src/legacy.py"],
+                    },
+                },
+            ],
+        },
+    )
+    task = config.tasks[0]
+
+    assert task.source.include == ["src/**/*.py"]
+    assert task.source.exclude == ["src/generated/**", "src/legacy.py"]
+
+
+def test_removed_features_do_not_break_loading() -> None:
+    """6. Refactor: Ensures old, removed fields are safely ignored."""
+    data_with_old_fields = {
+        "debug_options": {"enabled": True},
+        "report_options": {"export_csv": True},
+        "providers": {"gemini": {"batch_options": {"enabled": False}}},
+        "tasks": [
+            {
+                "name": "Old Task",
+                "source_lang": "en",
+                "target_lang": "de",
+                "translator": "gemini",
+                "source": {"include": ["*.txt"]},
+                "output": {"filename_suffix": "_de"},
+                "regex_rewrites": {"old": "new"},
+            },
+        ],
+    }
+    try:
+        config, _ = GlocalConfig.from_dict(data_with_old_fields)
+        assert isinstance(config, GlocalConfig)
+        assert not hasattr(config, "debug_options")
+        assert not hasattr(config, "report_options")
+        assert not hasattr(config.providers["gemini"], "batch_options")
+        assert not hasattr(config.tasks[0], "regex_rewrites")
+        assert not hasattr(config.tasks[0].output, "filename_suffix")
+    except (AssertionError, AttributeError) as e:
+        pytest.fail(f"Loading config with old fields failed unexpectedly: {e}")
+
+
+def test_load_config_double_quotes_fail(create_config_file: Callable[[str], str]) -> None:
+    """7. Failure: Raises YAMLError when double quotes are used."""
+    yaml_content = 'key: "value"'
+    with pytest.raises(yaml.YAMLError, match=_ERR_DOUBLE_QUOTED):
+        load_config(create_config_file(yaml_content))
+
+
+def test_load_config_double_quotes_reports_first_offender(create_config_file: Callable[[str], str]) -> None:
+    """7b. Failure: The error points at the first double-quoted scalar in document order."""
+    yaml_content = 'tasks:\n  - name: \'ok\'\n    target_lang: "ja"\n    source_lang: "en"\n'
+    with pytest.raises(yaml.YAMLError, match=r"line 3, column 18\."):
+        load_config(create_config_file(yaml_content))
+
+
+def test_legacy_rules_parsing() -> None:
+    """8. Logic: Correctly parses the old list-based rule format."""
+    config, _ = GlocalConfig.from_dict(
+        {
+            "tasks": [
+                {
+                    "name": "Legacy Rules",
+                    "source_lang": "en",
+                    "target_lang": "fr",
+                    "source": {"include": ["*.*"]},
+                    "rules": ["skip: ^SKIP", "protect: PROTECTED", "OLD -> NEW"],
+                },
+            ],
+        },
+    )
+    task = config.tasks[0]
+    assert len(task.rules) == 3
+    actions = {r.action.action for r in task.rules}
+    assert "skip" in actions
+    assert "protect" in actions
+    assert "replace" in actions
+
+
+def test_rules_extends() -> None:
+    """9. Logic: Correctly resolves 'extends' within a rules block."""
+    config, _ = GlocalConfig.from_dict(
+        {
+            "shortcuts": {
+                ".base-rules": {"rules": {"replace": {"base": "correct"}}},
+                ".feature-rules": {"rules": {"extends": ".base-rules", "skip": ["feature_skip"]}},
+            },
+            "tasks": [
+                {
+                    "name": "Test Rules Extends",
+                    "source_lang": "en",
+                    "target_lang": "fr",
+                    "source": {"include": ["*.*"]},
+                    "rules": {"extends": ".feature-rules", "protect": ["final_protect"]},
+                },
+            ],
+        },
+    )
+    task = config.tasks[0]
+    assert len(task.rules) == 3
+    actions = {r.action.action for r in task.rules}
+    assert actions == {"replace", "skip", "protect"}
+
+
+def test_rules_extends_does_not_alias_shortcuts() -> None:
+    """9b. Logic: Resolving 'extends' copies shortcut data instead of sharing or mutating it."""
+    shortcuts = {
+        ".base-rules": {"rules": {"skip": ["base_skip"], "custom": [{"pattern": "base"}]}},
+        ".feature-rules": {"rules": {"skip": ["feature_skip"], "custom": [{"pattern": "feature"}]}},
+    }
+    snapshot = copy.deepcopy(shortcuts)
+
+    resolved = _resolve_rules_extends({"extends": [".base-rules", ".feature-rules"], "custom": [{"pattern": "task"}]}, shortcuts)
+    assert resolved["custom"] == [{"pattern": "task"}, {"pattern": "feature"}, {"pattern": "base"}]
+    shortcut_items = [item for shortcut in shortcuts.values() for item in shortcut["rules"]["custom"]]
+    assert not any(item is shortcut_item for item in resolved["custom"] for shortcut_item in shortcut_items)
+
+    # Mutating the resolved rules must not leak back into the shortcuts
+    for item in resolved["custom"]:
+        item["pattern"] = "changed"
+    resolved["skip"].append("task_skip")
+    assert shortcuts == snapshot
+
+
+def test_invalid_source_type_is_handled() -> None:
+    """10. Logic: Handles invalid 'source' types gracefully."""
+    config, _ = GlocalConfig.from_dict(
+        {
+            "tasks": [
+                {
+                    "name": "Invalid Source",
+                    "source_lang": "en",
+                    "target_lang": "fr",
+                    "source": 123,  # Invalid type
+                },
+            ],
+        },
+    )
+    task = config.tasks[0]
+    assert task.source == Source(include=[], exclude=[])
+
+
+def test_load_config_not_a_dict(create_config_file: Callable[[str], str]) -> None:
+    """11. Failure: Raises TypeError if the YAML root is not a dictionary."""
+    yaml_content = "- item1\n- item2"
+    with pytest.raises(ValueError, match=_ERR_NOT_A_MAPPING):
+        load_config(create_config_file(yaml_content))
+
+
+@pytest.mark.parametrize(
+    ("action", "error"),
+    [
+        pytest.param("replace", _ERR_REPLACE_VALUE, id="replace_requires_value"),
+        pytest.param("skip", None, id="skip_without_value"),
+        pytest.param("protect", None, id="protect_without_value"),
+    ],
+)
+def test_action_rule_validation_value_missing(action: str, error: re.Pattern[str] | None) -> None:
+    """12. Validation: Only the 'replace' action requires a value."""
+    if error is None:
+        assert ActionRule(action=action).value is None  # type: ignore[arg-type]
+        return
+    with pytest.raises(ValueError, match=error):
+        ActionRule(action=action)  # type: ignore[arg-type]
+
 
-    def test_load_config_not_a_dict(self) -> None:
-        """11. Failure: Raises TypeError if the YAML root is not a dictionary."""
-        yaml_content = "- item1\n- item2"
-        with patch("pathlib.Path.open", mock_open(read_data=yaml_content)), patch("pathlib.Path.is_file", return_value=True), pytest.raises(ValueError, match="Config file must be a YAML mapping"):
-            load_config("dummy_path.yaml")
+def test_generated_task_id_is_stable() -> None:
+    """13. Stability: Generated task_ids do not drift, so existing caches stay valid."""
+    config, generated = GlocalConfig.from_dict(
+        {
+            "tasks": [
+                {
+                    "name": "CJK Paths",
+                    "source_lang": "zh-TW",
+                    "target_lang": "en",
+                    "source": {"include": ["文件/使用說明/" + "說明" * 30 + ".md"]},
+                    "extraction_rules": ["'([^']+)'"],
+                },
+            ],
+        },
+    )
+    assert generated == [0]
+    assert config.tasks[0].task_id == "230d2bb7-00e9-540c-82de-ea51eb901fa4"
 
 
 if __name__ == "__main__":
-    unittest.main()
+    sys.exit(pytest.main([__file__, "-x", "--tb=short", "-p", "no:cacheprovider"]))
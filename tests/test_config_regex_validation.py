@@ -1,19 +1,16 @@
 """Tests for regex pattern validation in configuration rules."""
 
-import unittest
-from unittest.mock import mock_open, patch
+import sys
+from collections.abc import Callable
 
 import pytest
 
-from glocaltext.config import load_config
+from glocaltext.config import GlocalConfig, compile_rule_pattern, load_config
 
 
-class TestRegexValidation(unittest.TestCase):
-    """Test suite for regex pattern validation in rules."""
-
-    def test_valid_regex_patterns_success(self) -> None:
-        """1. Valid regex patterns in all rule types should load successfully."""
-        yaml_content = """
+def test_valid_regex_patterns_success(create_config_file: Callable[[str], str]) -> None:
+    """1. Valid regex patterns in all rule types should load successfully."""
+    yaml_content = """
 tasks:
   - name: 'Valid Patterns'
     source_lang: 'en'
@@ -27,14 +24,15 @@ tasks:
         'old': 'new'
         '\\bfoo\\b': 'bar'
 """
-        with patch("pathlib.Path.open", mock_open(read_data=yaml_content)), patch("pathlib.Path.is_file", return_value=True):
-            config = load_config("dummy_path.yaml")
-            assert len(config.tasks) == 1
-            assert len(config.tasks[0].rules) == 6
-
-    def test_invalid_regex_in_skip_rule(self) -> None:
-        """2. Invalid regex syntax in skip rule should raise ValueError."""
-        yaml_content = """
+    config_path = create_config_file(yaml_content)
+    config = load_config(config_path)
+    assert len(config.tasks) == 1
+    assert len(config.tasks[0].rules) == 6
+
+
+def test_invalid_regex_in_skip_rule(create_config_file: Callable[[str], str]) -> None:
+    """2. Invalid regex syntax in skip rule should raise ValueError."""
+    yaml_content = """
 tasks:
   - name: 'Invalid Skip'
     source_lang: 'en'
@@ -44,12 +42,13 @@ tasks:
     rules:
       skip: ['[invalid']
 """
-        with patch("pathlib.Path.open", mock_open(read_data=yaml_content)), patch("pathlib.Path.is_file", return_value=True), pytest.raises(ValueError, match="Invalid regex pattern in skip rule"):
-            load_config("dummy_path.yaml")
+    with pytest.raises(ValueError, match="Invalid regex pattern in skip rule"):
+        load_config(create_config_file(yaml_content))
 
-    def test_invalid_regex_in_protect_rule(self) -> None:
-        """3. Invalid regex syntax in protect rule should raise ValueError."""
-        yaml_content = """
+
+def test_invalid_regex_in_protect_rule(create_config_file: Callable[[str], str]) -> None:
+    """3. Invalid regex syntax in protect rule should raise ValueError."""
+    yaml_content = """
 tasks:
   - name: 'Invalid Protect'
     source_lang: 'en'
@@ -59,12 +58,13 @@ tasks:
     rules:
       protect: ['(?P<incomplete']
 """
-        with patch("pathlib.Path.open", mock_open(read_data=yaml_content)), patch("pathlib.Path.is_file", return_value=True), pytest.raises(ValueError, match="Invalid regex pattern in protect rule"):
-            load_config("dummy_path.yaml")
+    with pytest.raises(ValueError, match="Invalid regex pattern in protect rule"):
+        load_config(create_config_file(yaml_content))
+
 
-    def test_invalid_regex_in_replace_rule(self) -> None:
-        """4. Invalid regex syntax in replace rule should raise ValueError."""
-        yaml_content = """
+def test_invalid_regex_in_replace_rule(create_config_file: Callable[[str], str]) -> None:
+    """4. Invalid regex syntax in replace rule should raise ValueError."""
+    yaml_content = """
 tasks:
   - name: 'Invalid Replace'
     source_lang: 'en'
@@ -75,12 +75,13 @@ tasks:
       replace:
         '*invalid*': 'replacement'
 """
-        with patch("pathlib.Path.open", mock_open(read_data=yaml_content)), patch("pathlib.Path.is_file", return_value=True), pytest.raises(ValueError, match="Invalid regex pattern in replace rule"):
-            load_config("dummy_path.yaml")
+    with pytest.raises(ValueError, match="Invalid regex pattern in replace rule"):
+        load_config(create_config_file(yaml_content))
+
 
-    def test_mixed_valid_and_invalid_patterns(self) -> None:
-        """5. Mixed valid and invalid patterns should fail at first invalid pattern."""
-        yaml_content = """
+def test_mixed_valid_and_invalid_patterns(create_config_file: Callable[[str], str]) -> None:
+    """5. Mixed valid and invalid patterns should fail at first invalid pattern."""
+    yaml_content = """
 tasks:
   - name: 'Mixed Patterns'
     source_lang: 'en'
@@ -90,12 +91,13 @@ tasks:
     rules:
       skip: ['^valid', '[invalid']
 """
-        with patch("pathlib.Path.open", mock_open(read_data=yaml_content)), patch("pathlib.Path.is_file", return_value=True), pytest.raises(ValueError, match="Invalid regex pattern"):
-            load_config("dummy_path.yaml")
+    with pytest.raises(ValueError, match="Invalid regex pattern"):
+        load_config(create_config_file(yaml_content))
 
-    def test_legacy_format_with_invalid_regex(self) -> None:
-        """6. Legacy list format with invalid regex should raise ValueError."""
-        yaml_content = """
+
+def test_legacy_format_with_invalid_regex(create_config_file: Callable[[str], str]) -> None:
+    """6. Legacy list format with invalid regex should raise ValueError."""
+    yaml_content = """
 tasks:
   - name: 'Legacy Invalid'
     source_lang: 'en'
@@ -105,9 +107,56 @@ tasks:
     rules:
       - 'skip: [unclosed'
 """
-        with patch("pathlib.Path.open", mock_open(read_data=yaml_content)), patch("pathlib.Path.is_file", return_value=True), pytest.raises(ValueError, match="Invalid regex pattern"):
-            load_config("dummy_path.yaml")
+    with pytest.raises(ValueError, match="Invalid regex pattern"):
+        load_config(create_config_file(yaml_content))
+
+
+def test_validated_patterns_are_reused_when_applied() -> None:
+    """7. Patterns compiled during validation are served from the shared cache afterwards."""
+    pattern = r"validated-\d+-once"
+    config, _ = GlocalConfig.from_dict(
+        {
+            "tasks": [
+                {
+                    "name": "Shared Compile",
+                    "source_lang": "en",
+                    "target_lang": "fr",
+                    "source": {"include": ["*.txt"]},
+                    "rules": {"skip": [pattern]},
+                },
+            ],
+        },
+    )
+    assert config.tasks[0].rules[0].match.regex == pattern
+    hits_before = compile_rule_pattern.cache_info().hits
+    assert compile_rule_pattern(pattern).search("validated-42-once")
+    assert compile_rule_pattern.cache_info().hits == hits_before + 1
+
+
+def test_shared_patterns_compile_once_across_tasks() -> None:
+    """8. Patterns repeated through shortcuts are compiled once per unique string."""
+    shared = [r"shared-skip-\d+", r"shared-protect-[a-z]+"]
+    tasks = [
+        {
+            "name": f"Task {index}",
+            "source_lang": "en",
+            "target_lang": "fr",
+            "source": {"include": ["*.txt"]},
+            "rules": {"extends": ".shared-rules"},
+        }
+        for index in range(5)
+    ]
+    # Start from an empty cache so patterns compiled by earlier tests cannot count as hits
+    compile_rule_pattern.cache_clear()
+    config, _ = GlocalConfig.from_dict(
+        {
+            "shortcuts": {".shared-rules": {"rules": {"skip": [shared[0]], "protect": [shared[1]]}}},
+            "tasks": tasks,
+        },
+    )
+    assert all(len(task.rules) == 2 for task in config.tasks)
+    assert compile_rule_pattern.cache_info().misses == len(shared)
 
 
 if __name__ == "__main__":
-    unittest.main()
+    sys.exit(pytest.main([__file__, "-x", "--tb=short", "-p", "no:cacheprovider"]))
@@ -15,7 +15,7 @@ from glocaltext.processing import (
     TranslationProcessor,
     WriteBackProcessor,
 )
-from glocaltext.processing.cache_utils import _get_task_cache_path
+from glocaltext.processing.cache_utils import _get_task_cache_path, _partition_matches_by_cache, calculate_checksum
 from glocaltext.processing.capture_processor import _exclude_files
 from glocaltext.processing.writeback_processor import (
     _apply_translations_by_strategy,
@@ -225,6 +225,17 @@ class TestCacheProcessor(unittest.TestCase):
         assert len(self.context.matches_to_translate) == 1
         assert self.context.matches_to_translate[0].original_text == "World"
 
+    def test_partitioning_hashes_each_unique_text_once(self) -> None:
+        """2b. Partitioning: Duplicate texts share one checksum and one cache lookup."""
+        cache = {calculate_checksum("Hello"): "Bonjour"}
+        matches = [TextMatch(text, Path("f.txt"), (i, i + 5), "t", "r") for i, text in enumerate(["Hello", "World", "Hello", "World"])]
+        with patch("glocaltext.processing.cache_utils.calculate_checksum", wraps=calculate_checksum) as mock_checksum:
+            to_translate, cached = _partition_matches_by_cache(matches, cache)
+        assert mock_checksum.call_count == 2
+        assert [m.translated_text for m in cached] == ["Bonjour", "Bonjour"]
+        assert all(m.lifecycle == MatchLifecycle.CACHED for m in cached)
+        assert [m.original_text for m in to_translate] == ["World", "World"]
+
     @patch("glocaltext.paths.find_project_root", return_value=Path("/fake_project"))
     @patch("pathlib.Path.exists", return_value=True)
     @patch("pathlib.Path.open", new_callable=mock_open, read_data="corrupted json")
@@ -311,7 +322,7 @@ class TestCacheUpdateProcessor(unittest.TestCase):
             mock_update_cache.assert_not_called()
 
     @patch("glocaltext.processing.cache_processors._get_task_cache_path")
-    @patch("glocaltext.processing.cache_processors._update_cache")
+    @patch("glocaltext.processing.cache_processors._update_cache", autospec=True)
     def test_updates_cache_with_new_translations(self, mock_update_cache: MagicMock, mock_get_path: MagicMock) -> None:
         """2. Update: Updates the cache with new, API-translated items."""
         self.context.is_incremental = True  # Enable incremental mode
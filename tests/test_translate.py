@@ -21,6 +21,7 @@ from glocaltext.translate import (
     _is_match_terminated,
     _log_oversized_batch_warning,
     _rpd_session_counts,
+    _track_pattern_coverage,
     _translator_cache,
     apply_terminating_rules,
     get_translator,
@@ -122,6 +123,12 @@ class TestRuleHandling(unittest.TestCase):
             assert result == "Hello World"  # Should return original text on error
             assert any("Invalid regex substitution" in log for log in cm.output)
 
+    def test_handle_replace_action_replaces_every_occurrence(self) -> None:
+        """Rule Handling: _handle_replace_action replaces all occurrences, with '.' matching newlines."""
+        rule = Rule(match=MatchRule(regex="a.b"), action=ActionRule(action="replace", value="x"))
+        text = "a\nb " * 20
+        assert _handle_replace_action(text, "a.b", rule) == "x " * 20
+
     def test_apply_protection_invalid_regex(self) -> None:
         """Rule Handling: _apply_protection handles invalid regex."""
         with self.assertLogs("glocaltext.translate", level="WARNING") as cm:
@@ -210,11 +217,12 @@ class TestProcessMatches(unittest.TestCase):
             TextMatch(original_text="text 1", source_file=Path("dummy.txt"), span=(0, 6), task_name="test", extraction_rule="test_rule"),
             TextMatch(original_text="text 2", source_file=Path("dummy.txt"), span=(7, 13), task_name="test", extraction_rule="test_rule"),
         ]
-        with self.assertLogs("glocaltext.translate", level="WARNING") as cm:
+        with self.assertLogs("glocaltext.translate", level="WARNING") as cm, patch("time.sleep") as mock_sleep:
             process_matches(matches, self.mock_task, self.mock_config, debug=False)
             assert any(f"Request Per Day limit ({RPD_LIMIT}) for 'gemini' reached." in log for log in cm.output)
 
         self.mock_translator.translate.assert_called_once()
+        mock_sleep.assert_called_once_with(DELAY_SECONDS)
         assert matches[0].translated_text == "Translated"
         assert matches[1].translated_text is None
         assert matches[1].lifecycle == MatchLifecycle.SKIPPED
@@ -299,6 +307,20 @@ class TestProcessMatches(unittest.TestCase):
         assert matches[0].translated_text == "Bonjour"
         assert matches[0].lifecycle == MatchLifecycle.TRANSLATED
 
+    def test_process_matches_simple_provider_deduplicates(self, mock_get_translator: MagicMock) -> None:
+        """9. Simple Provider: Translates each unique text once and shares the result."""
+        self.mock_task.translator = "mock"
+        mock_simple_translator = MagicMock(spec=BaseTranslator)
+        mock_simple_translator.translate.side_effect = lambda texts, **_: [TranslationResult(translated_text=f"fr:{texts[0]}", tokens_used=5)]
+        mock_get_translator.return_value = mock_simple_translator
+
+        matches = [TextMatch(original_text=text, source_file=Path("f.txt"), span=(i, i + 5), task_name="t", extraction_rule="r") for i, text in enumerate(["Hello", "World", "Hello"])]
+        process_matches(matches, self.mock_task, self.mock_config, debug=False)
+
+        assert [c.kwargs["texts"] for c in mock_simple_translator.translate.call_args_list] == [["Hello"], ["World"]]
+        assert [m.translated_text for m in matches] == ["fr:Hello", "fr:World", "fr:Hello"]
+        assert all(m.lifecycle == MatchLifecycle.TRANSLATED for m in matches)
+
 
 class TestBatchCreation(unittest.TestCase):
     """Test suite for batch creation functions."""
@@ -444,6 +466,21 @@ class TestFullCoverageDetection(unittest.TestCase):
         is_covered = _check_full_coverage(match, rules)
         assert is_covered is False, "No rules means text is not covered"
 
+    def test_full_coverage_stops_scanning_remaining_rules(self) -> None:
+        """Once the text is fully covered, later rule patterns should not be scanned."""
+        match = TextMatch(original_text="who are you", source_file=self.source_file, span=(0, 11), task_name="test", extraction_rule="test_rule")
+        rules = [
+            Rule(match=MatchRule(regex=".+"), action=ActionRule(action="skip")),
+            Rule(match=MatchRule(regex="who"), action=ActionRule(action="skip")),
+            Rule(match=MatchRule(regex="you"), action=ActionRule(action="protect")),
+        ]
+
+        with patch("glocaltext.translate._track_pattern_coverage", wraps=_track_pattern_coverage) as mock_track:
+            is_covered = _check_full_coverage(match, rules)
+
+        assert is_covered is True
+        mock_track.assert_called_once()
+
     def test_apply_terminating_rules_with_full_coverage(self) -> None:
         """7. Integration: apply_terminating_rules() detects full coverage."""
         match = TextMatch(original_text="who are you", source_file=self.source_file, span=(0, 11), task_name="test", extraction_rule="test_rule")
@@ -1,6 +1,8 @@
 """Tests for the translator classes."""
 
+import sys
 import unittest
+from dataclasses import dataclass
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -14,6 +16,7 @@ from glocaltext.translators.gemini_translator import GeminiTranslator
 from glocaltext.translators.gemma_translator import GemmaTranslator
 from glocaltext.translators.google_translator import GoogleTranslator
 from glocaltext.translators.mock_translator import MockTranslator
+from tests.conftest import FakeGenerateResponse, FakeUsageMetadata
 
 
 class TestMockTranslator(unittest.TestCase):
@@ -50,6 +53,13 @@ class TestMockTranslator(unittest.TestCase):
             self.fail(f"MockTranslator failed in debug mode: {e}")
 
 
+@dataclass
+class _FakeCountResponse:
+    """Plain stand-in for a count_tokens response."""
+
+    total_tokens: int | None
+
+
 class ConcreteTestTranslator(BaseGenAITranslator):
     """A concrete implementation of BaseGenAITranslator for testing purposes."""
 
@@ -80,10 +90,8 @@ class TestBaseGenAITranslator(unittest.TestCase):
     @patch("google.genai.Client")
     def test_translate_handles_empty_response(self, mock_genai_client: MagicMock) -> None:
         """3. Translate: Handles empty response text and raises ValueError."""
-        mock_response = MagicMock()
-        mock_response.text = ""
         mock_client_instance = mock_genai_client.return_value
-        mock_client_instance.models.generate_content.return_value = mock_response
+        mock_client_instance.models.generate_content.return_value = FakeGenerateResponse(text="")
         translator = ConcreteTestTranslator(settings=ProviderSettings(api_key="fake-key"))
         with pytest.raises(ValueError, match=r"Failed to process API response: response text is empty."):
             translator.translate(["text"], "en")
@@ -91,11 +99,11 @@ class TestBaseGenAITranslator(unittest.TestCase):
     @patch("google.genai.Client")
     def test_successful_translation_and_token_distribution(self, mock_genai_client: MagicMock) -> None:
         """4. Success: Correctly processes a successful translation and distributes tokens."""
-        mock_response = MagicMock()
-        mock_response.text = "Success"
-        mock_response.usage_metadata = MagicMock(total_token_count=10)
         mock_client_instance = mock_genai_client.return_value
-        mock_client_instance.models.generate_content.return_value = mock_response
+        mock_client_instance.models.generate_content.return_value = FakeGenerateResponse(
+            text="Success",
+            usage_metadata=FakeUsageMetadata(total_token_count=10),
+        )
         translator = ConcreteTestTranslator(settings=ProviderSettings(api_key="fake-key"))
         results = translator.translate(["text1", "text2", "text3"], "en")
         assert len(results) == 3
@@ -108,7 +116,7 @@ class TestBaseGenAITranslator(unittest.TestCase):
     def test_count_tokens_success_and_failure(self, mock_genai_client: MagicMock) -> None:
         """5. Token Count: Correctly counts tokens on success and handles API errors."""
         mock_client_instance = mock_genai_client.return_value
-        mock_client_instance.models.count_tokens.return_value = MagicMock(total_tokens=42)
+        mock_client_instance.models.count_tokens.return_value = _FakeCountResponse(total_tokens=42)
         translator = ConcreteTestTranslator(settings=ProviderSettings(api_key="fake-key"))
         token_count = translator.count_tokens(["some text"])
         assert token_count == 42
@@ -208,44 +216,49 @@ class TestGemmaTranslator(unittest.TestCase):
             self.translator._parse_response(response_text, self.original_texts)  # noqa: SLF001
 
 
-class TestGeminiTranslator(unittest.TestCase):
-    """Test suite for the GeminiTranslator."""
+_ORIGINAL_TEXTS = ["Hello", "World"]
 
-    def setUp(self) -> None:
-        """Set up the test case."""
-        self.translator = GeminiTranslator(settings=ProviderSettings(api_key="fake-key"))
-        self.original_texts = ["Hello", "World"]
 
-    def test_get_generation_config(self) -> None:
-        """1. Config: Returns the correct generation config for JSON output."""
-        config = self.translator._get_generation_config()  # noqa: SLF001
-        assert isinstance(config, google_genai_types.GenerateContentConfig)
-        assert config.response_mime_type == "application/json"
+@pytest.fixture(scope="module")
+def gemini_translator() -> GeminiTranslator:
+    """Provide one GeminiTranslator for the module; the tests only call its pure helpers."""
+    return GeminiTranslator(settings=ProviderSettings(api_key="fake-key"))
 
-    def test_parse_response_direct_json(self) -> None:
-        """2. Parse: Handles a direct, valid JSON response."""
-        response_text = '{"translations": ["Bonjour", "Monde"]}'
-        result = self.translator._parse_response(response_text, self.original_texts)  # noqa: SLF001
-        assert result == ["Bonjour", "Monde"]
 
-    def test_parse_response_from_markdown(self) -> None:
-        """3. Parse: Extracts and handles JSON from a markdown code block."""
-        response_text = '```json\n{"translations": ["Hallo", "Welt"]}\n```'
-        result = self.translator._parse_response(response_text, self.original_texts)  # noqa: SLF001
-        assert result == ["Hallo", "Welt"]
+def test_gemini_get_generation_config(gemini_translator: GeminiTranslator) -> None:
+    """1. Config: Returns the correct generation config for JSON output."""
+    config = gemini_translator._get_generation_config()  # noqa: SLF001
+    assert isinstance(config, google_genai_types.GenerateContentConfig)
+    assert config.response_mime_type == "application/json"
 
-    def test_parse_response_mismatched_count_raises_error(self) -> None:
-        """4. Error: Raises ValueError if translation count mismatches."""
-        response_text = '{"translations": ["Bonjour"]}'
-        with pytest.raises(ValueError, match="Mismatched translation count: expected 2, but got 1"):
-            self.translator._parse_response(response_text, self.original_texts)  # noqa: SLF001
 
-    def test_parse_response_invalid_json_raises_error(self) -> None:
-        """5. Error: Raises ValidationError on malformed JSON."""
-        response_text = '{"translations": ["Bonjour", "Monde"]'
-        with pytest.raises(ValidationError):
-            self.translator._parse_response(response_text, self.original_texts)  # noqa: SLF001
+def test_gemini_parse_response_direct_json(gemini_translator: GeminiTranslator) -> None:
+    """2. Parse: Handles a direct, valid JSON response."""
+    response_text = '{"translations": ["Bonjour", "Monde"]}'
+    result = gemini_translator._parse_response(response_text, _ORIGINAL_TEXTS)  # noqa: SLF001
+    assert result == ["Bonjour", "Monde"]
+
+
+def test_gemini_parse_response_from_markdown(gemini_translator: GeminiTranslator) -> None:
+    """3. Parse: Extracts and handles JSON from a markdown code block."""
+    response_text = '```json\n{"translations": ["Hallo", "Welt"]}\n```'
+    result = gemini_translator._parse_response(response_text, _ORIGINAL_TEXTS)  # noqa: SLF001
+    assert result == ["Hallo", "Welt"]
+
+
+def test_gemini_parse_response_mismatched_count_raises_error(gemini_translator: GeminiTranslator) -> None:
+    """4. Error: Raises ValueError if translation count mismatches."""
+    response_text = '{"translations": ["Bonjour"]}'
+    with pytest.raises(ValueError, match="Mismatched translation count: expected 2, but got 1"):
+        gemini_translator._parse_response(response_text, _ORIGINAL_TEXTS)  # noqa: SLF001
+
+
+def test_gemini_parse_response_invalid_json_raises_error(gemini_translator: GeminiTranslator) -> None:
+    """5. Error: Raises ValidationError on malformed JSON."""
+    response_text = '{"translations": ["Bonjour", "Monde"]'
+    with pytest.raises(ValidationError):
+        gemini_translator._parse_response(response_text, _ORIGINAL_TEXTS)  # noqa: SLF001
 
 
 if __name__ == "__main__":
-    unittest.main()
+    sys.exit(pytest.main([__file__, "-x", "--tb=short", "-p", "no:cacheprovider"]))